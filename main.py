@@ -4,31 +4,77 @@ Main module of the time adjustment reminder script.
 import logging
 import os
 from res.api import APIConnector
+from res.cassette import Cassette
+from res.circuit_breaker import CircuitBreaker, CircuitOpenError
+from res.contact_index import ContactIndex, stream_match
+from res.contact_store import ContactStore
+from res.metrics import APIMetrics
+from res.rate_limit import RateLimiter
+from res.stages import StageRunner
 from res.db.db_functions import (
     get_pay_period_by_start_date,
     get_worker_ids_with_missing_punches_by_pay_period
 )
 from res.db.database import Database
 from res.date_util import DateUtil
+from res.logging_config import configure_logging, summarize
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('time_adjustment.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
-# Get the environment variables for API key and brand ID
+# Logging settings, applied when the script runs. Log records are written by a background thread
+# to the console and to a log file rotated at LOG_MAX_BYTES
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FILE = os.getenv("LOG_FILE", "time_adjustment.log")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+if LOG_FORMAT not in ("text", "json"):
+    raise ValueError("LOG_FORMAT must be either 'text' or 'json'.")
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "5"))
+
+# Get the environment variables for API key and brand IDs
 API_KEY = os.getenv("SLICK_TEXT_API_KEY")
 if not API_KEY:
     raise ValueError("SLICK_TEXT_API_KEY environment variable is not set.")
-BRAND_ID = os.getenv("SLICK_TEXT_BRAND_ID")
-if not BRAND_ID:
-    raise ValueError("SLICK_TEXT_BRAND_ID environment variable is not set.")
+# Comma-separated brand IDs processed concurrently in one run, or a single SLICK_TEXT_BRAND_ID
+BRAND_IDS = [brand_id.strip() for brand_id in
+             os.getenv("SLICK_TEXT_BRAND_IDS", os.getenv("SLICK_TEXT_BRAND_ID", "")).split(",")
+             if brand_id.strip()]
+if not BRAND_IDS:
+    raise ValueError("SLICK_TEXT_BRAND_ID or SLICK_TEXT_BRAND_IDS environment variable is not set.")
+BRAND_IDS = list(dict.fromkeys(BRAND_IDS))
+# Number of threads used to fetch contact pages concurrently
+MAX_WORKERS = int(os.getenv("SLICK_TEXT_MAX_WORKERS", str(APIConnector.DEFAULT_MAX_WORKERS)))
+# Maximum number of requests per second sent to each SlickText endpoint
+RATE_LIMIT = float(os.getenv("SLICK_TEXT_RATE_LIMIT", str(RateLimiter.DEFAULT_RATE)))
+# Failure rate of the recent requests to an endpoint that opens its circuit and fails the run fast
+CIRCUIT_FAILURE_RATE = float(os.getenv("SLICK_TEXT_CIRCUIT_FAILURE_RATE", "0.5"))
+# Optional path of a local contact snapshot, synced incrementally instead of downloading every contact
+CONTACT_STORE_PATH = os.getenv("CONTACT_STORE_PATH")
+# Set to "true" to force a full resync of the local contact snapshot
+CONTACT_STORE_FULL_SYNC = os.getenv("CONTACT_STORE_FULL_SYNC", "false").lower() == "true"
+# How contacts are looked up: "all" streams every contact, "targeted" only queries the contacts
+# whose adp_associate_id is one of the worker IDs with missing punches
+CONTACT_LOOKUP_MODE = os.getenv("CONTACT_LOOKUP_MODE", "all").lower()
+if CONTACT_LOOKUP_MODE not in ("all", "targeted"):
+    raise ValueError("CONTACT_LOOKUP_MODE must be either 'all' or 'targeted'.")
+# Set to "true" to keep only the first contact of every worker and stop fetching contacts as soon as
+# every worker is matched; by default every contact sharing a worker ID is matched
+FIRST_MATCH_WINS = os.getenv("CONTACT_FIRST_MATCH_WINS", "false").lower() == "true"
+# Optional cassette file to record the SlickText requests to, or to replay them from without network access
+CASSETTE_PATH = os.getenv("SLICK_TEXT_CASSETTE")
+CASSETTE_MODE = os.getenv("SLICK_TEXT_CASSETTE_MODE", Cassette.REPLAY).lower()
+if CASSETTE_MODE not in (Cassette.RECORD, Cassette.REPLAY):
+    raise ValueError("SLICK_TEXT_CASSETTE_MODE must be either 'record' or 'replay'.")
+# Set to "true" to wait the recorded latency of every replayed response
+CASSETTE_REPLAY_LATENCY = os.getenv("SLICK_TEXT_CASSETTE_REPLAY_LATENCY", "false").lower() == "true"
+# Set to "false" to always create a new contact list and campaign, even on a rerun
+REUSE_EXISTING = os.getenv("REUSE_EXISTING_CAMPAIGN", "true").lower() == "true"
+# Set to "true" to read the worker IDs from the missing punch summary table instead of querying the
+# day entries of the pay period. The table is only refreshed by refresh_summary.py, run after the import
+USE_MISSING_PUNCH_SUMMARY = os.getenv("USE_MISSING_PUNCH_SUMMARY", "false").lower() == "true"
+
+# Contact fields used to match contacts to workers, every other field is dropped after decoding
+CONTACT_FIELDS = ["contact_id", "first_name", "last_name", "mobile_number", "custom_fields.adp_associate_id"]
 
 # Define the message content for the campaign
 MESSAGE_CONTENT = """
@@ -50,89 +96,214 @@ def fetch_pay_period(session, date_util: DateUtil):
     return get_pay_period_by_start_date(session, last_monday)
 
 
-def get_missing_punch_data(session, pay_period):
+def get_missing_punch_data(session, pay_period, use_summary=None):
     """
     Get and log the worker IDs with missing punches for the specified pay period.
     :param session: The database session.
     :param pay_period: The pay period object.
+    :param use_summary: Read the missing punch summary (defaults to USE_MISSING_PUNCH_SUMMARY).
     :return: A list of worker IDs with missing punches.
     """
+    if use_summary is None:
+        use_summary = USE_MISSING_PUNCH_SUMMARY
     worker_ids = get_worker_ids_with_missing_punches_by_pay_period(
         session,
-        pay_period.pay_period_id
+        pay_period.pay_period_id,
+        use_summary=use_summary
     )
     logger.info("Found %d workers with missing punches for pay period %s: %s",
-                len(worker_ids), pay_period.pay_period_id, worker_ids)
+                len(worker_ids), pay_period.pay_period_id, summarize(worker_ids))
+    logger.debug("Workers with missing punches for pay period %s: %s", pay_period.pay_period_id, worker_ids)
     return worker_ids
 
 
-def process_contacts(api_connector, worker_ids):
+def fetch_contacts(api_connector, worker_ids, contact_store=None, prefetch=True):
+    """
+    Fetch the brand contacts, either from the API or from a synced local snapshot.
+    :param api_connector: The API connector instance.
+    :param worker_ids: The worker IDs with missing punches, used by the targeted lookup mode.
+    :param contact_store: Optional ContactStore to sync and read the contacts from.
+    :param prefetch: If True, fetch the next contact page while the current one is consumed. A page
+    already being prefetched is still downloaded when the caller stops iterating early.
+    :return: An iterable of contacts.
+    """
+    if CONTACT_LOOKUP_MODE == "targeted":
+        return api_connector.find_contacts_by_custom_field("adp_associate_id", worker_ids,
+                                                           projection=CONTACT_FIELDS)
+    if contact_store is None:
+        # A failed page fails the brand instead of silently matching a partial contact list
+        return api_connector.iter_contacts(prefetch=prefetch, strict=True, projection=CONTACT_FIELDS,
+                                           brand_id=api_connector.brand_id)
+
+    contact_store.sync(api_connector, full=CONTACT_STORE_FULL_SYNC)
+    return contact_store.get_contacts()
+
+
+def build_contact_index(api_connector, worker_ids, contact_store=None):
+    """
+    Fetch the brand contacts and index them, logging the contacts that cannot be matched.
+    :param api_connector: The API connector instance.
+    :param worker_ids: The worker IDs with missing punches, used by the targeted lookup mode.
+    :param contact_store: Optional ContactStore to read the contacts from.
+    :return: A ContactIndex of the contacts.
+    """
+    contact_index = ContactIndex(fetch_contacts(api_connector, worker_ids, contact_store))
+
+    for contact in contact_index.missing_custom_fields:
+        logger.debug("Contact %s (%s %s) missing custom_fields",
+                     contact.get('contact_id'), contact.get('first_name', ''), contact.get('last_name', ''))
+    if contact_index.missing_custom_fields:
+        logger.warning("%d contacts missing custom_fields", len(contact_index.missing_custom_fields))
+    if contact_index.missing_associate_id:
+        logger.warning("%d contacts missing ADP worker ID", len(contact_index.missing_associate_id))
+    duplicates = contact_index.duplicates()
+    if duplicates:
+        logger.warning("%d ADP worker IDs are shared by several contacts: %s", len(duplicates),
+                       summarize(f"{associate_id} {[contact.get('contact_id') for contact in contacts]}"
+                                 for associate_id, contacts in duplicates.items()))
+
+    logger.info("Indexed %d contacts", len(contact_index))
+    return contact_index
+
+
+def process_contacts(api_connector, worker_ids, contact_store=None, contact_index=None):
     """
     Process contacts and match against worker IDs with missing punches.
     :param api_connector: The API connector instance.
     :param worker_ids: List of worker IDs to match against contacts.
-    :return:
+    :param contact_store: Optional ContactStore to read the contacts from.
+    :param contact_index: Optional ContactIndex of the brand built earlier in the process, reused
+    instead of fetching the contacts again.
+    With FIRST_MATCH_WINS and no contact_index, only the first contact of every worker is matched
+    and no more contact pages are requested once every worker is matched.
+    :return: The IDs of the matched contacts.
     """
-    contacts = api_connector.get_all_contacts(brand_id=BRAND_ID)
+    if contact_index is not None:
+        matched = contact_index.match(worker_ids)
+    elif FIRST_MATCH_WINS:
+        # Stream the contacts and stop paging once every worker ID is matched; without prefetching,
+        # no page past the one holding the last match is requested
+        matched = stream_match(fetch_contacts(api_connector, worker_ids, contact_store, prefetch=False),
+                               worker_ids)
+        logger.info("Matched %d of %d worker IDs while streaming contacts", len(matched), len(set(worker_ids)))
+    else:
+        matched = build_contact_index(api_connector, worker_ids, contact_store).match(worker_ids)
+
     contact_ids = []
-    missing_worker_id_count = 0
-
-    for contact in contacts:
-        contact_id = contact.get('contact_id')
-        raw_custom_fields = contact.get('custom_fields')
-        custom_fields = raw_custom_fields or {}
-        adp_worker_id = custom_fields.get('adp_associate_id', None)
-        first_name = contact.get('first_name', '')
-        last_name = contact.get('last_name', '')
-
-        if raw_custom_fields is None:
-            logger.warning("Contact %s (%s %s) missing custom_fields",
-                           contact_id,
-                           first_name,
-                           last_name
-                           )
-
-        if adp_worker_id is None:
-            missing_worker_id_count += 1
-            continue
+    for associate_id, contacts in matched.items():
+        for contact in contacts:
+            contact_ids.append(contact.get('contact_id'))
+            logger.debug("Matched contact: %s, %s, (%s %s)",
+                         contact.get('contact_id'),
+                         associate_id,
+                         contact.get('first_name', ''),
+                         contact.get('last_name', '')
+                         )
+
+    logger.info("Matched %d contacts to worker IDs: %s", len(contact_ids), summarize(contact_ids))
+    return contact_ids
 
-        if adp_worker_id in worker_ids:
-            contact_ids.append(contact_id)
-            logger.info("Matched contact: %s, %s, (%s %s)",
-                        contact_id,
-                        adp_worker_id,
-                        first_name,
-                        last_name
-                        )
 
-    if missing_worker_id_count:
-        logger.warning("%d contacts missing ADP worker ID", missing_worker_id_count)
+def get_reminder_name(pay_period):
+    """
+    Get the name of the contact list and campaign of a pay period.
+    :param pay_period: The pay period object.
+    :return: The reminder name.
+    """
+    return (f"Time Adjustment Reminder "
+            f"{pay_period.pay_period_start} - "
+            f"{pay_period.pay_period_end}")
 
-    logger.info("Matched %d contacts to worker IDs", len(contact_ids))
-    return contact_ids
+
+def find_contact_list(api_connector, pay_period):
+    """
+    Look up the contact list of the pay period left by a previous run, without creating one.
+    :param api_connector: The API connector instance.
+    :param pay_period: The pay period object.
+    :return: The contact list dictionary, or None if there is none.
+    """
+    reminder_name = get_reminder_name(pay_period)
+    contact_list = api_connector.find_contact_list_by_name(reminder_name)
+    if contact_list:
+        logger.info("Reusing contact list: %s with ID: %s", reminder_name, contact_list.get("contact_list_id"))
+    return contact_list
 
 
-def create_campaign(api_connector, pay_period, contact_ids):
+def find_or_create_contact_list(api_connector, pay_period, reuse_existing=None, looked_up=False):
+    """
+    Get the contact list of the pay period, creating it if needed.
+    :param api_connector: The API connector instance.
+    :param pay_period: The pay period object.
+    :param reuse_existing: Whether to reuse an existing list with the same name (defaults to REUSE_EXISTING).
+    :param looked_up: True if find_contact_list already found no list, so it is created without another lookup.
+    :return: The contact list dictionary.
+    """
+    if reuse_existing is None:
+        reuse_existing = REUSE_EXISTING
+
+    contact_list = find_contact_list(api_connector, pay_period) if reuse_existing and not looked_up else None
+    if contact_list:
+        return contact_list
+
+    reminder_name = get_reminder_name(pay_period)
+    contact_list = api_connector.create_contact_list(reminder_name)
+    logger.info("Created contact list: %s with ID: %s", reminder_name, contact_list.get("contact_list_id"))
+    return contact_list
+
+
+def create_campaign(api_connector, pay_period, contact_ids, reuse_existing=None, contact_list=None,
+                    list_looked_up=False):
     """
     Create a campaign for the contacts with missing punches.
+    In reuse mode, a rerun after a partial failure skips the campaign if it already exists,
+    reuses the contact list with the same name and only adds the contacts it is missing.
     :param api_connector: The API connector instance.
     :param pay_period: The pay period object.
     :param contact_ids: List of contact IDs to include in the campaign.
+    :param reuse_existing: Whether to reuse an existing list and campaign (defaults to REUSE_EXISTING).
+    :param contact_list: Optional contact list from find_contact_list, looked up or created here otherwise.
+    :param list_looked_up: True if find_contact_list already ran, so a missing list is created without
+    another lookup.
     :return: The campaign ID.
+    :raises RuntimeError: If some contacts could not be added to the list; the campaign is not created.
     """
-    reminder_name = (f"Time Adjustment Reminder "
-                     f"{pay_period.pay_period_start} - "
-                     f"{pay_period.pay_period_end}")
-
-    # Create contact list
-    contact_list = api_connector.create_contact_list(reminder_name)
+    if reuse_existing is None:
+        reuse_existing = REUSE_EXISTING
+    reminder_name = get_reminder_name(pay_period)
+
+    if reuse_existing:
+        campaign = api_connector.find_campaign_by_name(reminder_name)
+        if campaign:
+            logger.info("Campaign %s already exists with ID: %s, skipping.",
+                        reminder_name, campaign.get("campaign_id"))
+            return campaign
+
+    if contact_list is None and reuse_existing and not list_looked_up:
+        contact_list = find_contact_list(api_connector, pay_period)
+    # A list created by this run has no members to skip
+    reused = contact_list is not None
+    if contact_list is None:
+        contact_list = find_or_create_contact_list(api_connector, pay_period, reuse_existing, looked_up=True)
     contact_list_id = contact_list.get("contact_list_id")
-    logger.info("Created contact list: %s with ID: %s",
-                reminder_name, contact_list_id)
+
+    if reused:
+        # Only add the contacts that are not members of a reused list yet
+        members = api_connector.get_list_contact_ids(contact_list_id)
+        contact_ids = [contact_id for contact_id in contact_ids if int(contact_id) not in members]
+        if members:
+            logger.info("Contact list %s already has %d members", contact_list_id, len(members))
 
     # Add contacts to the contact list
-    api_connector.add_contacts_to_list(contact_ids, contact_list_id)
-    logger.info("Added %d contacts to the contact list %s.", len(contact_ids), contact_list_id)
+    if contact_ids:
+        report = api_connector.add_contacts_to_list(contact_ids, contact_list_id)
+        logger.info("Added %d contacts to the contact list %s.", len(report.succeeded), contact_list_id)
+        if not report.ok:
+            logger.error("Failed to add %d contacts to the contact list %s: %s",
+                         len(report.failed), contact_list_id, report.failed)
+            # A campaign sent now would miss these contacts, and a rerun would skip the existing
+            # campaign; without it, the rerun adds only the missing members and sends the campaign
+            raise RuntimeError(f"Failed to add {len(report.failed)} contacts to the contact list "
+                               f"{contact_list_id}, campaign not created")
 
     # Create campaign
     campaign = api_connector.create_campaign(
@@ -145,6 +316,204 @@ def create_campaign(api_connector, pay_period, contact_ids):
     return campaign
 
 
+def get_contact_store_path(brand_id):
+    """
+    Get the path of the local contact snapshot of a brand.
+    With several brands, every brand gets its own snapshot next to CONTACT_STORE_PATH.
+    :param brand_id: The brand ID.
+    :return: The snapshot path, or None if no snapshot is configured.
+    """
+    if not CONTACT_STORE_PATH or len(BRAND_IDS) == 1:
+        return CONTACT_STORE_PATH
+    root, extension = os.path.splitext(CONTACT_STORE_PATH)
+    return f"{root}.{brand_id}{extension}"
+
+
+def load_contact_index(api_connector, worker_ids=None):
+    """
+    Fetch and index the contacts of a brand, from its local snapshot when one is configured.
+    :param api_connector: The API connector instance of the brand.
+    :param worker_ids: The worker IDs with missing punches, only needed by the targeted lookup mode.
+    :return: A ContactIndex of the brand contacts.
+    """
+    contact_store_path = get_contact_store_path(api_connector.brand_id)
+    if contact_store_path:
+        with ContactStore(contact_store_path) as contact_store:
+            return build_contact_index(api_connector, worker_ids, contact_store)
+    return build_contact_index(api_connector, worker_ids)
+
+
+def stream_brand_contacts(api_connector, worker_ids):
+    """
+    Match the contacts of a brand as they are fetched, stopping once every worker is matched.
+    :param api_connector: The API connector instance of the brand.
+    :param worker_ids: List of worker IDs with missing punches.
+    :return: A list of matched contact IDs.
+    """
+    contact_store_path = get_contact_store_path(api_connector.brand_id)
+    if contact_store_path:
+        with ContactStore(contact_store_path) as contact_store:
+            return process_contacts(api_connector, worker_ids, contact_store)
+    return process_contacts(api_connector, worker_ids)
+
+
+def match_brand_contacts(api_connector, worker_ids, contact_index=None):
+    """
+    Match the contacts of a brand to the worker IDs.
+    :param api_connector: The API connector instance of the brand.
+    :param worker_ids: List of worker IDs with missing punches.
+    :param contact_index: Optional ContactIndex of the brand, loaded here unless the first match wins.
+    :return: A list of matched contact IDs.
+    """
+    if contact_index is None and FIRST_MATCH_WINS:
+        return stream_brand_contacts(api_connector, worker_ids)
+    if contact_index is None:
+        contact_index = load_contact_index(api_connector, worker_ids)
+    return process_contacts(api_connector, worker_ids, contact_index=contact_index)
+
+
+def process_brand(api_connector, pay_period, worker_ids, contact_index=None, contact_list=None,
+                  list_looked_up=False):
+    """
+    Match the contacts of one brand and create its campaign.
+    Errors are caught and reported in the result so a failing brand does not stop the others.
+    :param api_connector: The API connector instance of the brand.
+    :param pay_period: The pay period object.
+    :param worker_ids: List of worker IDs with missing punches.
+    :param contact_index: Optional ContactIndex of the brand, or the exception raised building it.
+    :param contact_list: Optional contact list of the pay period found by find_contact_list, or the
+    exception raised looking it up. It is only created once contacts are matched.
+    :param list_looked_up: True if find_contact_list already ran for contact_list.
+    :return: A dictionary with the brand_id, status, matched contact count, campaign_id and error.
+    """
+    brand_id = api_connector.brand_id
+    result = {"brand_id": brand_id, "status": None, "matched": 0, "campaign_id": None, "error": None}
+    if not pay_period or not worker_ids:
+        result["status"] = "skipped"
+        return result
+    try:
+        for prepared in (contact_index, contact_list):
+            if isinstance(prepared, Exception):
+                raise prepared
+        contact_ids = match_brand_contacts(api_connector, worker_ids, contact_index)
+        result["matched"] = len(contact_ids)
+
+        if not contact_ids:
+            logger.info("No matching contacts found in brand %s for worker IDs with missing punches.",
+                        brand_id)
+            result["status"] = "no_contacts"
+            return result
+
+        # Create a campaign for the contacts with missing punches
+        campaign = create_campaign(api_connector, pay_period, contact_ids, contact_list=contact_list,
+                                   list_looked_up=list_looked_up)
+        result["campaign_id"] = (campaign or {}).get("campaign_id")
+        result["status"] = "campaign" if campaign else "failed"
+    except CircuitOpenError as e:
+        logger.error("SlickText is unavailable, aborting brand %s: %s", brand_id, e)
+        result.update(status="failed", error=str(e))
+    except Exception as e:  # pylint: disable=broad-except
+        logger.exception("Processing brand %s failed with error: %s", brand_id, e)
+        result.update(status="failed", error=str(e))
+    return result
+
+
+def log_brand_results(results):
+    """
+    Log one line per brand with the outcome of process_brand.
+    :param results: The result dictionaries of process_brand.
+    """
+    for result in results:
+        logger.info("Brand %s: %s, %d contacts matched, campaign %s%s",
+                    result["brand_id"], result["status"], result["matched"], result["campaign_id"],
+                    f", error: {result['error']}" if result["error"] else "")
+
+
+def capture_errors(func):
+    """
+    Wrap a brand stage so it returns its exception instead of raising it. process_brand then
+    reports the error for that brand only, instead of the runner aborting every brand.
+    :param func: The stage callable.
+    :return: The wrapped callable.
+    """
+    def wrapper(*args):
+        try:
+            return func(*args)
+        except Exception as e:  # pylint: disable=broad-except
+            return e
+    return wrapper
+
+
+def add_stages(runner, session, date_util, api_connectors):
+    """
+    Add the stages of a run to a StageRunner.
+
+    The database queries and, in the "all" lookup mode, the contact downloads do not depend on
+    each other and run concurrently. Once the worker IDs are known, every brand looks up the contact
+    list of a previous run, and its campaign stage waits for its contacts, that lookup and the worker IDs.
+    :param runner: The StageRunner.
+    :param session: The database session, only used by one stage at a time.
+    :param date_util: The DateUtil instance.
+    :param api_connectors: The API connector instances, one per brand.
+    """
+    def pay_period_stage():
+        pay_period = fetch_pay_period(session, date_util)
+        if not pay_period:
+            logger.error("No pay period found for the previous week.")
+            return None
+        logger.info("Processing pay period: %s (%s to %s)",
+                    pay_period.pay_period_id,
+                    pay_period.pay_period_start,
+                    pay_period.pay_period_end)
+        return pay_period
+
+    def worker_ids_stage(pay_period):
+        if not pay_period:
+            return []
+        worker_ids = get_missing_punch_data(session, pay_period)
+        if not worker_ids:
+            logger.info("No workers found with missing punches for pay period %s.",
+                        pay_period.pay_period_id)
+        return worker_ids
+
+    runner.add("pay_period", pay_period_stage)
+    runner.add("worker_ids", worker_ids_stage, depends=["pay_period"])
+
+    for api_connector in api_connectors:
+        brand_id = api_connector.brand_id
+
+        # Only the read-only lookup of a list left by a previous run overlaps with the contacts; the list
+        # is created by the brand stage once contacts are matched, so no empty list is left behind
+        runner.add(f"list:{brand_id}", capture_errors(
+            lambda pay_period, worker_ids, api_connector=api_connector:
+            find_contact_list(api_connector, pay_period) if worker_ids and REUSE_EXISTING else None
+        ), depends=["pay_period", "worker_ids"])
+
+        if FIRST_MATCH_WINS:
+            # Streaming stops once the worker IDs are matched, so it cannot start before they are known
+            runner.add(f"brand:{brand_id}",
+                       lambda pay_period, worker_ids, contact_list, api_connector=api_connector:
+                       process_brand(api_connector, pay_period, worker_ids, contact_list=contact_list,
+                                     list_looked_up=REUSE_EXISTING),
+                       depends=["pay_period", "worker_ids", f"list:{brand_id}"])
+            continue
+
+        if CONTACT_LOOKUP_MODE == "all":
+            # The full contact download does not need the worker IDs
+            runner.add(f"contacts:{brand_id}", capture_errors(
+                lambda api_connector=api_connector: load_contact_index(api_connector)))
+        else:
+            runner.add(f"contacts:{brand_id}", capture_errors(
+                lambda worker_ids, api_connector=api_connector:
+                load_contact_index(api_connector, worker_ids) if worker_ids else None
+            ), depends=["worker_ids"])
+        runner.add(f"brand:{brand_id}",
+                   lambda pay_period, worker_ids, contact_index, contact_list, api_connector=api_connector:
+                   process_brand(api_connector, pay_period, worker_ids, contact_index, contact_list,
+                                 list_looked_up=REUSE_EXISTING),
+                   depends=["pay_period", "worker_ids", f"contacts:{brand_id}", f"list:{brand_id}"])
+
+
 def main():
     """
     Main function to run the time adjustment reminder script.
@@ -152,50 +521,63 @@ def main():
     logger.info("Starting the time adjustment reminder script.")
     # Initialize date utility
     date_util = DateUtil()
+    # Collect the SlickText request metrics, summarized when the process completes
+    api_metrics = APIMetrics()
     # Record the start time of the process
     start_time = date_util.get_current_datetime()
+    cassette = None
+    runner = StageRunner()
 
     try:
         db = Database()
-        with db.get_new_session() as session:
-            # Retrieve the pay period for the previous week
-            pay_period = fetch_pay_period(session, date_util)
-
-            if not pay_period:
-                logger.error("No pay period found for the previous week.")
+        # The reminder queries only read; the missing punch summary is refreshed by refresh_summary.py
+        with db.get_read_only_session() as session:
+            rate_limiter = RateLimiter(rate=RATE_LIMIT)
+            if CASSETTE_PATH:
+                cassette = Cassette(CASSETTE_PATH, CASSETTE_MODE, replay_latency=CASSETTE_REPLAY_LATENCY)
+                logger.info("Using cassette %s in %s mode", CASSETTE_PATH, CASSETTE_MODE)
+                if CASSETTE_MODE == Cassette.REPLAY:
+                    # Replayed responses are not paced, only optionally delayed by their recorded latency
+                    rate_limiter = None
+            # The brands share the rate limits, circuits and metrics, but every brand gets
+            # its own connector instead of switching a shared one with set_brand_id
+            circuit_breaker = CircuitBreaker(failure_rate=CIRCUIT_FAILURE_RATE, metrics=api_metrics)
+            api_connectors = [
+                APIConnector(token=API_KEY, brand_id=brand_id, max_workers=MAX_WORKERS,
+                             rate_limiter=rate_limiter, fast_json=True, cassette=cassette,
+                             metrics=api_metrics, circuit_breaker=circuit_breaker)
+                for brand_id in BRAND_IDS
+            ]
+
+            # Run the database queries, contact downloads, lists and campaigns as a dependency graph
+            add_stages(runner, session, date_util, api_connectors)
+            stage_results = runner.run()
+            if not stage_results["worker_ids"]:
                 return
 
-            logger.info("Processing pay period: %s (%s to %s)",
-                        pay_period.pay_period_id,
-                        pay_period.pay_period_start,
-                        pay_period.pay_period_end)
-
-            # Get worker IDs with missing punches
-            worker_ids = get_missing_punch_data(session, pay_period)
-            if not worker_ids:
-                logger.info("No workers found with missing punches for pay period %s.",
-                            pay_period.pay_period_id)
-                return
-
-            # Process contacts
-            api_connector = APIConnector(token=API_KEY, brand_id=BRAND_ID)
-            contact_ids = process_contacts(api_connector, worker_ids)
-
-            if not contact_ids:
-                logger.info("No matching contacts found for worker IDs with missing punches.")
-                return
-
-            # Create a campaign for the contacts with missing punches
-            create_campaign(api_connector, pay_period, contact_ids)
+            results = [stage_results[f"brand:{brand_id}"] for brand_id in BRAND_IDS]
+            log_brand_results(results)
+            failed = [result["brand_id"] for result in results if result["status"] == "failed"]
+            if failed:
+                raise RuntimeError(f"Processing failed for brands: {', '.join(failed)}")
 
     except Exception as e:
         logger.exception("Process failed with error: %s", e)
         raise
     finally:
+        if cassette is not None:
+            cassette.close()
+        runner.log_timings(logger)
         end_time = date_util.get_current_datetime()
         duration = end_time - start_time
+        api_metrics.log_summary(logger)
         logger.info("Process completed in %s seconds.", duration.total_seconds())
 
 
 if __name__ == "__main__":
-    main()
+    log_listener = configure_logging(level=LOG_LEVEL, log_file=LOG_FILE, json_format=LOG_FORMAT == "json",
+                                     max_bytes=LOG_MAX_BYTES, backup_count=LOG_BACKUP_COUNT)
+    try:
+        main()
+    finally:
+        log_listener.stop()
@@ -0,0 +1,46 @@
+"""
+Refresh the MissingPunchSummaries table from the day entries.
+
+The refresh recomputes the missing punches of every timecard, so it costs about as much as the
+reminder query itself. Run it right after the timecard import, not as part of the reminder run:
+with USE_MISSING_PUNCH_SUMMARY=true, main.py only reads the summary, which is as current as the
+last refresh.
+
+Usage:
+    python refresh_summary.py [pay_period_id]
+"""
+import logging
+import os
+import sys
+from res.db.database import Database
+from res.db.db_functions import refresh_missing_punch_summary
+from res.logging_config import configure_logging
+
+logger = logging.getLogger(__name__)
+
+
+def main(pay_period_id=None):
+    """
+    Refresh the missing punch summary and commit the changed rows.
+    :param pay_period_id: (Optional) Only refresh the timecards of this pay period.
+    :return: The number of summary rows inserted, updated or deleted.
+    """
+    db = Database()
+    try:
+        with db.get_new_session() as session:
+            changed = refresh_missing_punch_summary(session, pay_period_id)
+            session.commit()
+    finally:
+        db.close()
+    logger.info("Refreshed %d missing punch summary rows%s", changed,
+                f" for pay period {pay_period_id}" if pay_period_id is not None else "")
+    return changed
+
+
+if __name__ == "__main__":
+    log_listener = configure_logging(level=os.getenv("LOG_LEVEL", "INFO").upper(),
+                                     log_file=os.getenv("LOG_FILE", "time_adjustment.log"))
+    try:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else None)
+    finally:
+        log_listener.stop()
@@ -4,7 +4,138 @@ This module contains the APIConnector class for interacting with the SlickText A
 import logging
 import time
 import json
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 import requests
+import urllib3
+from . import json_codec
+from .cassette import Cassette
+from .circuit_breaker import CircuitBreaker
+from .metrics import APIMetrics
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .transport import TransportConfig
+
+
+class IncompleteDownloadError(RuntimeError):
+    """
+    Raised by strict downloads when a page could not be fetched, instead of returning a partial result.
+    """
+
+    def __init__(self, offset: int, fetched: int, total: int = None):
+        """
+        Initialize the IncompleteDownloadError.
+        :param offset: The offset of the page that failed.
+        :param fetched: The number of items fetched before the failure.
+        :param total: The total number of items reported by the API, if known.
+        """
+        expected = f" of {total}" if total is not None else ""
+        super().__init__(f"Download failed at offset {offset} after {fetched}{expected} items")
+        self.offset = offset
+        self.fetched = fetched
+        self.total = total
+
+
+class ListAddReport:
+    """
+    Per-contact result of adding contacts to a list in chunks.
+    """
+
+    def __init__(self, list_id):
+        """
+        Initialize the ListAddReport.
+        :param list_id: The ID of the list the contacts were added to.
+        """
+        self.list_id = list_id
+        self.succeeded = []
+        self.failed = []
+        self.responses = []
+
+    def record(self, contact_ids: list, response):
+        """
+        Record the outcome of one chunk.
+        :param contact_ids: The contact IDs sent in the chunk.
+        :param response: The API response for the chunk, or None if it failed.
+        """
+        if response is None:
+            self.failed.extend(contact_ids)
+        else:
+            self.succeeded.extend(contact_ids)
+            self.responses.append(response)
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if every contact was added.
+        """
+        return not self.failed
+
+    def to_dict(self) -> dict:
+        """
+        Convert the report to a dictionary of {contact_id: True if added}.
+        :return: A dictionary with the status of every contact.
+        """
+        results = {contact_id: True for contact_id in self.succeeded}
+        results.update({contact_id: False for contact_id in self.failed})
+        return results
+
+    def __repr__(self):
+        return (f"<ListAddReport(list_id={self.list_id}, "
+                f"succeeded={len(self.succeeded)}, "
+                f"failed={len(self.failed)})>")
+
+
+def get_total_count(paging_data: dict):
+    """
+    Extract the total number of items from the pagingData of a response.
+    :param paging_data: The pagingData dictionary of a paginated response.
+    :return: The total number of items or None if it is not reported.
+    """
+    for key in ("total", "totalCount", "total_count"):
+        total = paging_data.get(key)
+        if isinstance(total, int):
+            return total
+    return None
+
+
+def custom_field_value(contact: dict, field_name: str):
+    """
+    Get a custom field of a contact.
+    :param contact: The contact dictionary returned by the API.
+    :param field_name: The name of the custom field.
+    :return: The value of the field, or None if the contact does not have it.
+    """
+    return (contact.get('custom_fields') or {}).get(field_name)
+
+
+def ignores_custom_field_filter(page: dict, field_name: str, values) -> bool:
+    """
+    Check whether the first page of a custom field query shows that the API ignored the filter.
+    :param page: The first page of the query, with data and pagingData.
+    :param field_name: The name of the filtered custom field.
+    :param values: The values sent in the filter.
+    :return: True if the page holds contacts outside the values or reports more contacts than values.
+    """
+    values = set(values)
+    total = get_total_count(page.get('pagingData') or {})
+    return (any(custom_field_value(contact, field_name) not in values for contact in page['data'])
+            or (total is not None and total > len(values)))
+
+
+def unique_contacts(results) -> list:
+    """
+    Flatten lists of contacts, dropping the contacts already seen.
+    :param results: An iterable of contact lists.
+    :return: A list of contacts, without duplicate contact IDs.
+    """
+    matches = []
+    seen = set()
+    for contacts in results:
+        for contact in contacts:
+            if contact.get('contact_id') not in seen:
+                seen.add(contact.get('contact_id'))
+                matches.append(contact)
+    return matches
 
 
 class APIConnector:
@@ -18,17 +149,61 @@ class APIConnector:
         "contacts": "/brands/{brand_id}/contacts",
         "contact_details": "/brands/{brand_id}/contacts/{contact_id}",
         "create_list": "/brands/{brand_id}/lists",
+        "lists": "/brands/{brand_id}/lists",
+        "list_contacts": "/brands/{brand_id}/lists/{list_id}/contacts",
         "add_contact_to_list": "/brands/{brand_id}/lists/contacts",
         "campaigns": "/brands/{brand_id}/campaigns",
         "custom_fields": "/brands/{brand_id}/custom-fields/{field_id}"
     }
-    DEFAULT_RETRY_WAIT_TIME = 5
     MAX_RETRIES = 5
+    PAGE_LIMIT = 250
+    DEFAULT_MAX_WORKERS = 4
+    # Query parameter used to filter contacts by a custom field, and the number of values per query
+    CUSTOM_FIELD_FILTER = "custom_fields[{field}]"
+    CUSTOM_FIELD_CHUNK_SIZE = 50
+    # Number of contacts sent per request when adding contacts to a list
+    LIST_CHUNK_SIZE = 250
 
-    def __init__(self, token: str, brand_id: str = None):
+    def __init__(self, token: str, brand_id: str = None, max_workers: int = DEFAULT_MAX_WORKERS,
+                 base_url: str = None, retry_policy: RetryPolicy = None,
+                 rate_limiter: RateLimiter = None, transport: TransportConfig = None,
+                 fast_json: bool = False, metrics: APIMetrics = None,
+                 circuit_breaker: CircuitBreaker = None, cassette: Cassette = None):
+        """
+        Initialize the APIConnector.
+        :param token: The SlickText API token.
+        :param brand_id: The brand ID to use for brand scoped requests.
+        :param max_workers: The number of threads used for concurrent requests.
+        :param base_url: Optional base URL overriding BASE_URL (e.g. a local stand-in server).
+        :param retry_policy: The retry policy for failed requests
+        (defaults to RetryPolicy with MAX_RETRIES attempts).
+        :param rate_limiter: Optional rate limiter pacing the requests per endpoint key.
+        It may be shared between connectors.
+        :param transport: The HTTP transport settings (pool size, timeouts, compression).
+        :param fast_json: If True, decode responses with json_codec (orjson when available).
+        :param metrics: The APIMetrics recording per-endpoint request metrics. It may be shared
+        between connectors.
+        :param circuit_breaker: Optional circuit breaker failing requests fast with CircuitOpenError
+        while an endpoint keeps failing. It may be shared between connectors.
+        :param cassette: Optional Cassette recording every request, or replaying recorded responses
+        instead of sending requests.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
         self.token = token
         self.brand_id = brand_id
-        self.session = requests.Session()
+        self.max_workers = max_workers
+        self.base_url = base_url or self.BASE_URL
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=self.MAX_RETRIES)
+        self.rate_limiter = rate_limiter
+        self.transport = transport or TransportConfig()
+        self.fast_json = fast_json
+        self.metrics = metrics or APIMetrics()
+        self.circuit_breaker = circuit_breaker
+        self.cassette = cassette
+        # The session carries the default headers and a connection pool sized for max_workers
+        self.session = self.transport.build_session(token, max_workers)
+        self.__url_templates = {key: f"{self.base_url}{path}" for key, path in self.ENDPOINTS.items()}
 
     def set_brand_id(self, brand_id: str):
         """
@@ -44,14 +219,24 @@ class APIConnector:
         :param dynamic_data: A dictionary with dynamic values to be placed in the url.
         :return: A complete URL string with the base endpoint and the given key
         """
-        url = f"{self.BASE_URL}{self.ENDPOINTS[key]}"
+        url = self.__url_templates[key]
         if dynamic_data:
             # Replace any dynamic parts of the URL, like {address}
             url = url.format(**dynamic_data)
         return url
 
+    def __send(self, **kwargs) -> requests.Response:
+        """
+        Send a request through the session, or through the cassette when one is set.
+        :param kwargs: The arguments of requests.Session.request.
+        :return: The response.
+        """
+        if self.cassette is None:
+            return self.session.request(**kwargs)
+        return self.cassette.request(self.session, **kwargs)
+
     def __make_request(self, url_key: str = None, method: str = "GET", dynamic_data: dict = None,
-                       params: dict = None, body=None):
+                       params: dict = None, body=None, projection: dict = None):
         """
         Make a request to the SlickText API.
         :param url_key: The key for the endpoint
@@ -59,48 +244,114 @@ class APIConnector:
         :param dynamic_data: A dictionary with dynamic values to be placed in the url.
         :param params: Query parameters for the request
         :param body: The body of the request (for POST requests). Either a dictionary or a list of dictionaries.
+        :param projection: Optional projection tree (see json_codec.compile_projection) applied to
+        every record of the response's data list.
         :return: The response from the API or None if the request fails
+        :raises CircuitOpenError: If the circuit breaker of the endpoint is open.
         """
         url = self.__generate_url(url_key, dynamic_data)
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json"
-        }
+        data, headers = self.transport.encode_body(body)
+        timeout = self.transport.timeout_for(url_key)
+        bytes_sent = len(data) if data else 0
 
-        retries = self.MAX_RETRIES
-        while retries > 0:
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            status_code = None
+            retry_after = None
+            request_sent = True
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_request(url_key)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(url_key)
             try:
-                logging.debug("Making %s request to %s with headers %s",
-                              method.upper(), url, headers
-                              )
-                response = self.session.request(
+                logging.debug("Making %s request to %s", method.upper(), url)
+                request_start = time.monotonic()
+                response = self.__send(
                     method=method.upper(),
                     url=url,
                     headers=headers,
                     params=params,
-                    json=body)
+                    data=data,
+                    timeout=timeout)
+                self.__record_attempt(url_key, response.status_code, time.monotonic() - request_start,
+                                      bytes_sent, len(response.content))
 
                 if response.status_code in [200, 201]:
                     logging.debug("Success: %s %s", method, url)
-                    try:
-                        return response.json()
-                    except json.JSONDecodeError as e:
-                        logging.error(
-                            "Failed to decode JSON response for %s %s: %s",
-                            method,
-                            url,
-                            e
-                        )
-                        return None
+                    return self.__decode_response(response, method, url, projection)
 
+                status_code = response.status_code
+                retry_after = response.headers.get("Retry-After")
                 logging.warning("Error %d: %s", response.status_code, response.text)
             except requests.exceptions.RequestException as e:
                 logging.error("Request failed: %s", e)
-            retries -= 1
-            time.sleep(self.DEFAULT_RETRY_WAIT_TIME)
-        logging.error("Failed after %d retries: %s %s", self.MAX_RETRIES, method, url)
+                request_sent = not self.is_connect_error(e)
+                self.__record_attempt(url_key, None, time.monotonic() - request_start, bytes_sent)
+
+            wait = self.retry_policy.next_wait(attempt, time.monotonic() - start, status_code, retry_after,
+                                               method, request_sent)
+            if wait is None:
+                break
+            logging.debug("Retrying %s %s in %.2f seconds", method, url, wait)
+            self.metrics.record_retry(url_key, wait)
+            time.sleep(wait)
+        logging.error("Failed after %d attempts: %s %s", attempt, method, url)
         return None
 
+    def __record_attempt(self, url_key: str, status_code, duration: float, bytes_sent: int,
+                         bytes_received: int = 0):
+        """
+        Record the outcome of one attempt in the metrics and the circuit breaker.
+        :param url_key: The key for the endpoint
+        :param status_code: The HTTP status code, or None if no response was received.
+        :param duration: The duration of the attempt in seconds.
+        :param bytes_sent: The size of the request body.
+        :param bytes_received: The size of the response body.
+        """
+        self.metrics.record_request(url_key, status_code, duration, bytes_sent, bytes_received)
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(url_key, status_code)
+
+    def __decode_response(self, response: requests.Response, method: str, url: str, projection: dict = None):
+        """
+        Decode a successful response and apply the projection to its data list.
+        :param response: The response.
+        :param method: The HTTP method, for logging.
+        :param url: The URL, for logging.
+        :param projection: Optional projection tree applied to every record of the data list.
+        :return: The decoded response, or None if it is not valid JSON.
+        """
+        try:
+            result = json_codec.loads(response.content) if self.fast_json else response.json()
+        except json.JSONDecodeError as e:
+            logging.error(
+                "Failed to decode JSON response for %s %s: %s",
+                method,
+                url,
+                e
+            )
+            return None
+        if projection is not None and isinstance(result, dict) and isinstance(result.get('data'), list):
+            result['data'] = [json_codec.project(record, projection) for record in result['data']]
+        return result
+
+    @staticmethod
+    def is_connect_error(error: requests.exceptions.RequestException) -> bool:
+        """
+        Check whether a request failed before a connection to the server was established, in which
+        case the server cannot have received it.
+        :param error: The exception raised by requests.
+        :return: True for a connect timeout, a refused or unresolvable connection, or a TLS handshake failure.
+        """
+        if isinstance(error, (requests.exceptions.ConnectTimeout, requests.exceptions.SSLError)):
+            return True
+        if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+            # requests wraps the urllib3 error, NewConnectionError being a ConnectTimeoutError
+            return isinstance(getattr(error.args[0], "reason", error.args[0]), urllib3.exceptions.ConnectTimeoutError)
+        return False
+
     def get_brands(self):
         """
         Get all brands associated with the account.
@@ -108,13 +359,15 @@ class APIConnector:
         """
         return self.__make_request("brands")
 
-    def get_contacts(self, limit=None, offset=None, page=None, page_size=None, **filters):
+    def get_contacts(self, limit=None, offset=None, page=None, page_size=None, projection=None, **filters):
         """
         Get contacts with pagination and filtering.
         :param limit: Max items per request (max 250)
         :param offset: Items to skip
         :param page: Page number (0-based)
         :param page_size: Items per page
+        :param projection: Optional list of fields to keep on each contact, nested keys separated
+        by dots (e.g. "custom_fields.adp_associate_id"). The other fields are dropped after decoding.
         :param filters: Filter parameters as key=value
         """
         if not self.brand_id:
@@ -134,31 +387,218 @@ class APIConnector:
         return self.__make_request(
             "contacts",
             dynamic_data={"brand_id": self.brand_id},
-            params=params
+            params=params,
+            projection=json_codec.compile_projection(projection) if projection else None
         )
 
-    def get_all_contacts(self, **filters):
-        """Get all contacts with automatic pagination."""
-        all_contacts = []
-        limit = 250
-        offset = 0
+    def get_all_contacts(self, concurrent: bool = False, max_workers: int = None, strict: bool = False,
+                         **filters):
+        """
+        Get all contacts with automatic pagination.
+        :param concurrent: If True, fetch the remaining pages in parallel once the total
+        contact count is known from the first page.
+        :param max_workers: Number of threads to use in concurrent mode (defaults to self.max_workers).
+        :param strict: If True, raise IncompleteDownloadError when a page fails or fewer contacts than the
+        reported total are fetched; otherwise the contacts fetched before the failure are returned.
+        :param filters: Filter parameters as key=value, and optionally the projection of get_contacts
+        :return: A list of contacts, in the order returned by the API.
+        :raises IncompleteDownloadError: In strict mode, if the download is incomplete.
+        """
+        if concurrent:
+            return self.__get_all_contacts_concurrent(max_workers or self.max_workers, strict, **filters)
+        return list(self.iter_contacts(strict=strict, **filters))
 
-        while True:
-            batch = self.get_contacts(
-                limit=limit,
-                offset=offset,
-                **filters
-            )
+    def iter_contacts(self, prefetch: bool = False, strict: bool = False, **filters):
+        """
+        Iterate over all contacts, fetching them page by page as they are consumed.
+        Only the current page (and the prefetched one) is held in memory, and page requests
+        stop as soon as the caller stops iterating.
+        :param prefetch: If True, fetch the next page in a background thread while the
+        current page is being consumed, overlapping processing with network time. The prefetch
+        starts as soon as a page is received, so a caller stopping early still waits for, and pays
+        for, one extra page; leave it off when the caller is likely to stop early.
+        :param strict: If True, raise IncompleteDownloadError when a page fails instead of stopping.
+        :param filters: Filter parameters as key=value, and optionally the projection of get_contacts
+        :return: A generator of contacts, in the order returned by the API.
+        :raises IncompleteDownloadError: In strict mode, if a page cannot be fetched.
+        """
+        yield from self.__paginate(self.__contacts_page_fetcher(**filters), prefetch=prefetch, strict=strict)
 
-            if not batch or not isinstance(batch.get('data'), list):
-                break
-            all_contacts.extend(batch.get('data', []))
-            if not batch.get('pagingData', {}).get('hasMore', False):
-                break
-            offset += limit
+    def __contacts_page_fetcher(self, **filters):
+        """
+        Build a page fetcher for __paginate that gets contacts with the given filters.
+        :param filters: Filter parameters as key=value
+        :return: A function taking (limit, offset) and returning a page of contacts.
+        """
+        return lambda limit, offset: self.get_contacts(limit=limit, offset=offset, **filters)
+
+    def __paginate(self, fetch, offset: int = 0, prefetch: bool = False, strict: bool = False):
+        """
+        Iterate over the items of a paginated endpoint page by page, starting at the given offset.
+        :param fetch: A function taking (limit, offset) and returning a page with data and pagingData.
+        :param offset: The offset of the first page to fetch.
+        :param prefetch: If True, fetch the next page while the current one is consumed.
+        :param strict: If True, raise IncompleteDownloadError when a page fails instead of stopping.
+        :return: A generator of items.
+        """
+        limit = self.PAGE_LIMIT
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(fetch, limit, offset) if prefetch else None
+            try:
+                while True:
+                    batch = pending.result() if prefetch else fetch(limit, offset)
+
+                    if not batch or not isinstance(batch.get('data'), list):
+                        if strict:
+                            raise IncompleteDownloadError(offset, offset)
+                        return
+                    has_more = batch.get('pagingData', {}).get('hasMore', False)
+                    offset += limit
+                    if prefetch and has_more:
+                        pending = executor.submit(fetch, limit, offset)
+                    yield from batch['data']
+                    if not has_more:
+                        return
+            finally:
+                # The single worker starts a prefetch right away, so cancel() rarely stops it and
+                # leaving the executor waits for the page in flight
+                if pending is not None:
+                    pending.cancel()
+
+    def __get_all_contacts_concurrent(self, max_workers: int, strict: bool = False, **filters):
+        """
+        Get all contacts by fetching the first page and then the remaining offsets in parallel.
+        Falls back to sequential pagination if the first page does not report a total count.
+        :param max_workers: Number of threads to use.
+        :param strict: If True, raise IncompleteDownloadError instead of returning a partial list.
+        :param filters: Filter parameters as key=value
+        :return: A list of contacts, in the order returned by the API.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+
+        limit = self.PAGE_LIMIT
+        first = self.get_contacts(limit=limit, offset=0, **filters)
+        if not first or not isinstance(first.get('data'), list):
+            if strict:
+                raise IncompleteDownloadError(0, 0)
+            return []
+
+        all_contacts = list(first['data'])
+        paging_data = first.get('pagingData') or {}
+        if not paging_data.get('hasMore', False):
+            return all_contacts
+
+        total = get_total_count(paging_data)
+        if total is None:
+            logging.warning("pagingData has no total count, falling back to sequential pagination")
+            return all_contacts + list(self.__paginate(self.__contacts_page_fetcher(**filters), limit,
+                                                       strict=strict))
 
+        offsets = range(limit, total, limit)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map() yields results in submission order, which keeps the pages in order
+            batches = executor.map(
+                lambda offset: self.get_contacts(limit=limit, offset=offset, **filters),
+                offsets
+            )
+            for offset, batch in zip(offsets, batches):
+                if not batch or not isinstance(batch.get('data'), list):
+                    logging.error("Failed to fetch contacts page at offset %d", offset)
+                    if strict:
+                        raise IncompleteDownloadError(offset, len(all_contacts), total)
+                    break
+                all_contacts.extend(batch['data'])
+
+        if strict and len(all_contacts) < total:
+            # A page came back short, e.g. contacts deleted while paging
+            raise IncompleteDownloadError(len(all_contacts), len(all_contacts), total)
         return all_contacts
 
+    def find_contacts_by_custom_field(self, field_name: str, values, chunk_size: int = CUSTOM_FIELD_CHUNK_SIZE,
+                                      max_workers: int = None, **filters):
+        """
+        Find the contacts whose custom field matches one of the given values.
+        The values are sent in chunks of comma separated filters, and the chunks are queried in
+        parallel, so the cost scales with the number of values instead of the number of contacts.
+        The first page of the first chunk is checked before the other chunks are sent: if the API
+        ignored the filter, every chunk would page through the whole contact book, so the contacts
+        are matched in a single pass over all of them instead. The same pass is used if that page is
+        empty, since an API rejecting the comma separated values would quietly match nothing.
+        :param field_name: The name of the custom field, e.g. adp_associate_id.
+        :param values: The values to look up.
+        :param chunk_size: The number of values per query.
+        :param max_workers: Number of threads to use (defaults to self.max_workers).
+        :param filters: Additional filter parameters as key=value
+        :return: A list of matching contacts, without duplicates.
+        """
+        if not field_name:
+            raise ValueError("field_name must be provided to find contacts by custom field")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        values = sorted({str(value) for value in values if value is not None})
+        if not values:
+            return []
+        chunks = [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+        filter_key = self.CUSTOM_FIELD_FILTER.format(field=field_name)
+        limit = self.PAGE_LIMIT
+
+        def fetch_chunk(chunk, first=None):
+            chunk_filters = dict(filters, **{filter_key: ",".join(chunk)})
+            if first is None:
+                contacts = self.iter_contacts(**chunk_filters)
+            else:
+                contacts = self.__continue_pages(first, self.__contacts_page_fetcher(**chunk_filters))
+            wanted = set(chunk)
+            return [contact for contact in contacts if custom_field_value(contact, field_name) in wanted]
+
+        first_filters = dict(filters, **{filter_key: ",".join(chunks[0])})
+        first = self.get_contacts(limit=limit, offset=0, **first_filters)
+        if not first or not isinstance(first.get('data'), list):
+            return unique_contacts([fetch_chunk(chunk) for chunk in chunks])
+
+        if not first['data']:
+            logging.warning("Custom field filter %s matched none of %d values, it may not be supported; "
+                            "matching the values in one pass over all contacts", filter_key, len(chunks[0]))
+            return self.__match_in_one_pass(field_name, values, filters)
+        if ignores_custom_field_filter(first, field_name, chunks[0]):
+            logging.warning("Custom field filter %s is not applied by the API, "
+                            "matching the values in one pass over all contacts", filter_key)
+            # The filter was ignored, so the first page is the first page of every contact
+            return self.__match_in_one_pass(field_name, values, filters, first)
+
+        results = [fetch_chunk(chunks[0], first)]
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            results.extend(executor.map(fetch_chunk, chunks[1:]))
+        return unique_contacts(results)
+
+    def __match_in_one_pass(self, field_name: str, values, filters: dict, first: dict = None) -> list:
+        """
+        Match the values of a custom field while paging through every contact.
+        :param field_name: The name of the custom field.
+        :param values: The values to look up.
+        :param filters: Filter parameters as key=value
+        :param first: Optional first page of every contact, already fetched.
+        :return: A list of matching contacts, without duplicates.
+        """
+        fetch = self.__contacts_page_fetcher(**filters)
+        contacts = self.__continue_pages(first, fetch) if first is not None else self.__paginate(fetch)
+        wanted = set(values)
+        return unique_contacts([[contact for contact in contacts if custom_field_value(contact, field_name) in wanted]])
+
+    def __continue_pages(self, first: dict, fetch):
+        """
+        Iterate over the items of a first page already fetched, then over the following pages.
+        :param first: The first page, with data and pagingData.
+        :param fetch: A function taking (limit, offset) and returning a page, as for __paginate.
+        :return: An iterator of items.
+        """
+        if not first.get('pagingData', {}).get('hasMore', False):
+            return iter(first['data'])
+        return chain(first['data'], self.__paginate(fetch, self.PAGE_LIMIT))
+
     def get_contact_details(self, contact_id):
         """
         Get details of a specific contact.
@@ -171,6 +611,105 @@ class APIConnector:
             dynamic_data={"brand_id": self.brand_id, "contact_id": contact_id}
         )
 
+    def __get_page(self, url_key: str, limit=None, offset=None, dynamic_data: dict = None, **filters):
+        """
+        Get one page of a paginated brand endpoint.
+        :param url_key: The key for the endpoint
+        :param limit: Max items per request (max 250)
+        :param offset: Items to skip
+        :param dynamic_data: Additional dynamic values to be placed in the url.
+        :param filters: Filter parameters as key=value
+        :return: The page returned by the API or None if the request fails
+        """
+        params = dict(filters)
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return self.__make_request(
+            url_key,
+            dynamic_data=dict(dynamic_data or {}, brand_id=self.brand_id),
+            params=params
+        )
+
+    def get_contact_lists(self, limit=None, offset=None, **filters):
+        """
+        Get a page of the brand contact lists.
+        :param limit: Max items per request (max 250)
+        :param offset: Items to skip
+        :param filters: Filter parameters as key=value
+        :return: Dictionary containing the contact lists and pagingData.
+        """
+        if not self.brand_id:
+            raise ValueError("brand_id must be set to call get_contact_lists")
+        return self.__get_page("lists", limit, offset, **filters)
+
+    def find_contact_list_by_name(self, name):
+        """
+        Find a contact list by its exact name.
+        :param name: The name of the contact list.
+        :return: The first contact list with this name, or None.
+        :raises IncompleteDownloadError: If a page fails, so a failure is not mistaken for a missing list.
+        """
+        if not name:
+            raise ValueError("name must be provided to find a contact list")
+        for contact_list in self.__paginate(lambda limit, offset: self.get_contact_lists(limit, offset),
+                                            strict=True):
+            if contact_list.get('name') == name:
+                return contact_list
+        return None
+
+    def get_list_contacts(self, list_id, limit=None, offset=None):
+        """
+        Get a page of the contacts in a contact list.
+        :param list_id: The ID of the contact list.
+        :param limit: Max items per request (max 250)
+        :param offset: Items to skip
+        :return: Dictionary containing the contacts and pagingData.
+        """
+        if not self.brand_id:
+            raise ValueError("brand_id must be set to call get_list_contacts")
+        if not list_id:
+            raise ValueError("list_id must be provided to get the contacts of a list")
+        return self.__get_page("list_contacts", limit, offset, dynamic_data={"list_id": list_id})
+
+    def get_list_contact_ids(self, list_id) -> set:
+        """
+        Get the IDs of every contact in a contact list.
+        :param list_id: The ID of the contact list.
+        :return: A set of contact IDs as integers.
+        :raises IncompleteDownloadError: If a page fails, so no member is mistaken for a missing one.
+        """
+        contacts = self.__paginate(lambda limit, offset: self.get_list_contacts(list_id, limit, offset),
+                                   strict=True)
+        return {int(contact['contact_id']) for contact in contacts if contact.get('contact_id') is not None}
+
+    def get_campaigns(self, limit=None, offset=None, **filters):
+        """
+        Get a page of the brand campaigns.
+        :param limit: Max items per request (max 250)
+        :param offset: Items to skip
+        :param filters: Filter parameters as key=value
+        :return: Dictionary containing the campaigns and pagingData.
+        """
+        if not self.brand_id:
+            raise ValueError("brand_id must be set to call get_campaigns")
+        return self.__get_page("campaigns", limit, offset, **filters)
+
+    def find_campaign_by_name(self, name):
+        """
+        Find a campaign by its exact name.
+        :param name: The name of the campaign.
+        :return: The first campaign with this name, or None.
+        :raises IncompleteDownloadError: If a page fails, so a failure is not mistaken for a missing campaign.
+        """
+        if not name:
+            raise ValueError("name must be provided to find a campaign")
+        for campaign in self.__paginate(lambda limit, offset: self.get_campaigns(limit, offset), strict=True):
+            if campaign.get('name') == name:
+                return campaign
+        return None
+
     def create_contact_list(self, name=None, description=None):
         """
         Creates a contact list
@@ -210,11 +749,17 @@ class APIConnector:
             }]
         )
 
-    def add_contacts_to_list(self, contact_ids, list_id):
+    def add_contacts_to_list(self, contact_ids, list_id, chunk_size: int = LIST_CHUNK_SIZE,
+                             max_workers: int = None) -> ListAddReport:
         """
         Add multiple contacts to a list.
+        The contacts are sent in chunks uploaded in parallel. Each chunk is retried on its own,
+        so a failure only affects the contacts of that chunk.
         :param contact_ids: List of contact IDs to add.
         :param list_id: The ID of the list to add contacts to.
+        :param chunk_size: The number of contacts per request.
+        :param max_workers: Number of concurrent uploads (defaults to self.max_workers).
+        :return: A ListAddReport with the contacts that were and were not added.
         """
         if not self.brand_id:
             raise ValueError("brand_id must be set to call add_contacts_to_list")
@@ -224,15 +769,29 @@ class APIConnector:
             raise ValueError("list_id must be provided to add contacts to a list")
         if len(contact_ids) < 1:
             raise ValueError("contact_ids list must contain at least one contact ID")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
 
-        body = [{"contact_id": int(contact_id), "lists": [list_id]} for contact_id in contact_ids]
+        chunks = [contact_ids[i:i + chunk_size] for i in range(0, len(contact_ids), chunk_size)]
 
-        return self.__make_request(
-            "add_contact_to_list",
-            method="POST",
-            dynamic_data={"brand_id": self.brand_id},
-            body=body
-        )
+        def upload_chunk(chunk):
+            body = [{"contact_id": int(contact_id), "lists": [list_id]} for contact_id in chunk]
+            return self.__make_request(
+                "add_contact_to_list",
+                method="POST",
+                dynamic_data={"brand_id": self.brand_id},
+                body=body
+            )
+
+        report = ListAddReport(list_id)
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            for chunk, response in zip(chunks, executor.map(upload_chunk, chunks)):
+                report.record(chunk, response)
+
+        if report.failed:
+            logging.error("Failed to add %d of %d contacts to list %s",
+                          len(report.failed), len(contact_ids), list_id)
+        return report
 
     def get_custom_field(self, field_id):
         """Get details for a custom field."""
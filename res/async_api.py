@@ -0,0 +1,655 @@
+"""
+This module contains the AsyncAPIConnector class, the asyncio counterpart of APIConnector.
+"""
+import asyncio
+import json
+import logging
+import time
+import aiohttp
+from . import json_codec
+from .api import (APIConnector, IncompleteDownloadError, ListAddReport, custom_field_value, get_total_count,
+                  ignores_custom_field_filter, unique_contacts)
+from .circuit_breaker import CircuitBreaker
+from .metrics import APIMetrics
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .transport import TransportConfig
+
+
+class AsyncAPIConnector:
+    """
+    Class for making asynchronous requests to the SlickText API.
+
+    The connector shares a pooled aiohttp session between all of its coroutines and limits
+    the number of requests in flight with a semaphore. Use it as an async context manager:
+
+        async with AsyncAPIConnector(token, brand_id) as api_connector:
+            contacts = await api_connector.get_all_contacts()
+    """
+    BASE_URL = APIConnector.BASE_URL
+    ENDPOINTS = APIConnector.ENDPOINTS
+    MAX_RETRIES = APIConnector.MAX_RETRIES
+    PAGE_LIMIT = APIConnector.PAGE_LIMIT
+    LIST_CHUNK_SIZE = APIConnector.LIST_CHUNK_SIZE
+    DEFAULT_CONCURRENCY = 8
+
+    def __init__(self, token: str, brand_id: str = None, concurrency: int = DEFAULT_CONCURRENCY,
+                 base_url: str = None, retry_policy: RetryPolicy = None,
+                 rate_limiter: RateLimiter = None, transport: TransportConfig = None,
+                 metrics: APIMetrics = None, circuit_breaker: CircuitBreaker = None):
+        """
+        Initialize the AsyncAPIConnector.
+        :param token: The SlickText API token.
+        :param brand_id: The brand ID to use for brand scoped requests.
+        :param concurrency: The maximum number of requests in flight at once.
+        :param base_url: Optional base URL overriding BASE_URL (e.g. a local stand-in server).
+        :param retry_policy: The retry policy for failed requests
+        (defaults to RetryPolicy with MAX_RETRIES attempts).
+        :param rate_limiter: Optional rate limiter pacing the requests per endpoint key.
+        It may be shared between connectors.
+        :param transport: The HTTP transport settings (pool size, timeouts, compression).
+        :param metrics: The APIMetrics recording per-endpoint request metrics. It may be shared
+        between connectors.
+        :param circuit_breaker: Optional circuit breaker failing requests fast with CircuitOpenError
+        while an endpoint keeps failing. It may be shared between connectors.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be a positive integer")
+        self.token = token
+        self.brand_id = brand_id
+        self.concurrency = concurrency
+        self.base_url = base_url or self.BASE_URL
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=self.MAX_RETRIES)
+        self.rate_limiter = rate_limiter
+        self.transport = transport or TransportConfig()
+        self.metrics = metrics or APIMetrics()
+        self.circuit_breaker = circuit_breaker
+        # The session and semaphore are bound to the running event loop, so they are
+        # created lazily on first use rather than in __init__.
+        self.session = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def open(self):
+        """
+        Create the pooled HTTP session if it does not exist yet.
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.transport.pool_maxsize or self.concurrency),
+                headers=self.transport.default_headers(self.token)
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+    async def close(self):
+        """
+        Close the HTTP session.
+        """
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        self._semaphore = None
+
+    def set_brand_id(self, brand_id: str):
+        """
+        Set the brand ID for the API requests.
+        :param brand_id: The brand ID to set.
+        """
+        self.brand_id = brand_id
+
+    def __generate_url(self, key: str, dynamic_data: dict = None) -> str:
+        """
+        Generate a URL for the given key.
+        :param key: The key for the endpoint
+        :param dynamic_data: A dictionary with dynamic values to be placed in the url.
+        :return: A complete URL string with the base endpoint and the given key
+        """
+        url = f"{self.base_url}{self.ENDPOINTS[key]}"
+        if dynamic_data:
+            url = url.format(**dynamic_data)
+        return url
+
+    async def __make_request(self, url_key: str = None, method: str = "GET", dynamic_data: dict = None,
+                             params: dict = None, body=None, projection: dict = None):
+        """
+        Make a request to the SlickText API.
+        :param url_key: The key for the endpoint
+        :param method: The HTTP method (GET, POST, etc.)
+        :param dynamic_data: A dictionary with dynamic values to be placed in the url.
+        :param params: Query parameters for the request
+        :param body: The body of the request (for POST requests). Either a dictionary or a list of dictionaries.
+        :param projection: Optional projection tree (see json_codec.compile_projection) applied to
+        every record of the response's data list.
+        :return: The response from the API or None if the request fails
+        :raises CircuitOpenError: If the circuit breaker of the endpoint is open.
+        """
+        await self.open()
+        url = self.__generate_url(url_key, dynamic_data)
+        # aiohttp only accepts str, int and float query values
+        params = {key: str(value) if isinstance(value, bool) else value
+                  for key, value in (params or {}).items()}
+        data, headers = self.transport.encode_body(body)
+        connect_timeout, read_timeout = self.transport.timeout_for(url_key)
+        timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        bytes_sent = len(data) if data else 0
+
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            status_code = None
+            retry_after = None
+            request_sent = True
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_request(url_key)
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(url_key)
+            try:
+                logging.debug("Making %s request to %s", method.upper(), url)
+                async with self._semaphore:
+                    # The latency excludes the time spent queued behind the semaphore
+                    request_start = time.monotonic()
+                    async with self.session.request(method.upper(), url, params=params, data=data,
+                                                    headers=headers, timeout=timeout) as response:
+                        content = await response.read()
+                        status_code = response.status
+                        retry_after = response.headers.get("Retry-After")
+                self.__record_attempt(url_key, status_code, time.monotonic() - request_start,
+                                      bytes_sent, len(content))
+
+                if status_code in [200, 201]:
+                    logging.debug("Success: %s %s", method, url)
+                    return self.__decode_response(content, method, url, projection)
+
+                logging.warning("Error %d: %s", status_code, content.decode("utf-8", errors="replace"))
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logging.error("Request failed: %s", e)
+                status_code = None
+                request_sent = not self.is_connect_error(e)
+                self.__record_attempt(url_key, None, time.monotonic() - request_start, bytes_sent)
+
+            wait = self.retry_policy.next_wait(attempt, time.monotonic() - start, status_code, retry_after,
+                                               method, request_sent)
+            if wait is None:
+                break
+            logging.debug("Retrying %s %s in %.2f seconds", method, url, wait)
+            self.metrics.record_retry(url_key, wait)
+            await asyncio.sleep(wait)
+        logging.error("Failed after %d attempts: %s %s", attempt, method, url)
+        return None
+
+    def __record_attempt(self, url_key: str, status_code, duration: float, bytes_sent: int,
+                         bytes_received: int = 0):
+        """
+        Record the outcome of one attempt in the metrics and the circuit breaker.
+        :param url_key: The key for the endpoint
+        :param status_code: The HTTP status code, or None if no response was received.
+        :param duration: The duration of the attempt in seconds.
+        :param bytes_sent: The size of the request body.
+        :param bytes_received: The size of the response body.
+        """
+        self.metrics.record_request(url_key, status_code, duration, bytes_sent, bytes_received)
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(url_key, status_code)
+
+    @staticmethod
+    def __decode_response(content: bytes, method: str, url: str, projection: dict = None):
+        """
+        Decode the body of a successful response and apply the projection to its data list.
+        :param content: The response body.
+        :param method: The HTTP method, for logging.
+        :param url: The URL, for logging.
+        :param projection: Optional projection tree applied to every record of the data list.
+        :return: The decoded response, or None if it is not valid JSON.
+        """
+        try:
+            result = json_codec.loads(content)
+        except json.JSONDecodeError as e:
+            logging.error(
+                "Failed to decode JSON response for %s %s: %s",
+                method,
+                url,
+                e
+            )
+            return None
+        if projection is not None and isinstance(result, dict) and isinstance(result.get('data'), list):
+            result['data'] = [json_codec.project(record, projection) for record in result['data']]
+        return result
+
+    @staticmethod
+    def is_connect_error(error: Exception) -> bool:
+        """
+        Check whether a request failed before a connection to the server was established, in which
+        case the server cannot have received it.
+        :param error: The exception raised by aiohttp.
+        :return: True for a connect timeout, a refused or unresolvable connection, or a TLS handshake failure.
+        """
+        return isinstance(error, (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError))
+
+    async def get_brands(self):
+        """
+        Get all brands associated with the account.
+        :return: Dictionary containing brand data.
+        """
+        return await self.__make_request("brands")
+
+    async def get_contacts(self, limit=None, offset=None, page=None, page_size=None, projection=None,
+                           **filters):
+        """
+        Get contacts with pagination and filtering.
+        :param limit: Max items per request (max 250)
+        :param offset: Items to skip
+        :param page: Page number (0-based)
+        :param page_size: Items per page
+        :param projection: Optional list of fields to keep on each contact, nested keys separated
+        by dots (e.g. "custom_fields.adp_associate_id"). The other fields are dropped after decoding.
+        :param filters: Filter parameters as key=value
+        """
+        if not self.brand_id:
+            raise ValueError("brand_id must be set to call get_contacts")
+
+        params = {}
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        if page is not None:
+            params['page'] = page
+        if page_size is not None:
+            params['pageSize'] = page_size
+        params.update(filters)
+
+        return await self.__make_request(
+            "contacts",
+            dynamic_data={"brand_id": self.brand_id},
+            params=params,
+            projection=json_codec.compile_projection(projection) if projection else None
+        )
+
+    async def get_all_contacts(self, strict: bool = False, **filters):
+        """
+        Get all contacts with automatic pagination.
+        The first page reports the total count, the remaining pages are then fetched concurrently.
+        :param strict: If True, raise IncompleteDownloadError when a page fails or fewer contacts than the
+        reported total are fetched; otherwise the contacts fetched before the failure are returned.
+        :param filters: Filter parameters as key=value, and optionally the projection of get_contacts
+        :return: A list of contacts, in the order returned by the API.
+        :raises IncompleteDownloadError: In strict mode, if the download is incomplete.
+        """
+        limit = self.PAGE_LIMIT
+        first = await self.get_contacts(limit=limit, offset=0, **filters)
+        if not first or not isinstance(first.get('data'), list):
+            if strict:
+                raise IncompleteDownloadError(0, 0)
+            return []
+
+        all_contacts = list(first['data'])
+        paging_data = first.get('pagingData') or {}
+        if not paging_data.get('hasMore', False):
+            return all_contacts
+
+        total = get_total_count(paging_data)
+        if total is None:
+            logging.warning("pagingData has no total count, falling back to sequential pagination")
+            async for contact in self.__paginate(self.__contacts_page_fetcher(**filters), limit, strict=strict):
+                all_contacts.append(contact)
+            return all_contacts
+
+        offsets = range(limit, total, limit)
+        batches = await asyncio.gather(
+            *(self.get_contacts(limit=limit, offset=offset, **filters) for offset in offsets)
+        )
+        for offset, batch in zip(offsets, batches):
+            if not batch or not isinstance(batch.get('data'), list):
+                logging.error("Failed to fetch contacts page at offset %d", offset)
+                if strict:
+                    raise IncompleteDownloadError(offset, len(all_contacts), total)
+                break
+            all_contacts.extend(batch['data'])
+
+        if strict and len(all_contacts) < total:
+            # A page came back short, e.g. contacts deleted while paging
+            raise IncompleteDownloadError(len(all_contacts), len(all_contacts), total)
+        return all_contacts
+
+    async def iter_contacts(self, strict: bool = False, **filters):
+        """
+        Iterate over all contacts, fetching them page by page as they are consumed.
+        Only the current page is held in memory, and page requests stop as soon as the
+        caller stops iterating.
+        :param strict: If True, raise IncompleteDownloadError when a page fails instead of stopping.
+        :param filters: Filter parameters as key=value, and optionally the projection of get_contacts
+        :return: An async generator of contacts, in the order returned by the API.
+        :raises IncompleteDownloadError: In strict mode, if a page cannot be fetched.
+        """
+        async for contact in self.__paginate(self.__contacts_page_fetcher(**filters), strict=strict):
+            yield contact
+
+    def __contacts_page_fetcher(self, **filters):
+        """
+        Build a page fetcher for __paginate that gets contacts with the given filters.
+        :param filters: Filter parameters as key=value
+        :return: A coroutine function taking (limit, offset) and returning a page of contacts.
+        """
+        return lambda limit, offset: self.get_contacts(limit=limit, offset=offset, **filters)
+
+    async def __paginate(self, fetch, offset: int = 0, strict: bool = False, first: dict = None):
+        """
+        Iterate over the items of a paginated endpoint page by page, starting at the given offset.
+        :param fetch: A coroutine function taking (limit, offset) and returning a page with data and pagingData.
+        :param offset: The offset of the first page to fetch.
+        :param strict: If True, raise IncompleteDownloadError when a page fails instead of stopping.
+        :param first: Optional page already fetched at the given offset, yielded before fetching the next ones.
+        :return: An async generator of items.
+        """
+        limit = self.PAGE_LIMIT
+        batch = first
+        while True:
+            if batch is None:
+                batch = await fetch(limit, offset)
+            if not batch or not isinstance(batch.get('data'), list):
+                if strict:
+                    raise IncompleteDownloadError(offset, offset)
+                return
+            for item in batch['data']:
+                yield item
+            if not batch.get('pagingData', {}).get('hasMore', False):
+                return
+            offset += limit
+            batch = None
+
+    async def find_contacts_by_custom_field(self, field_name: str, values,
+                                            chunk_size: int = APIConnector.CUSTOM_FIELD_CHUNK_SIZE, **filters):
+        """
+        Find the contacts whose custom field matches one of the given values.
+        The values are sent in chunks of comma separated filters, and the chunks are queried
+        concurrently. As in APIConnector.find_contacts_by_custom_field, the first page of the first
+        chunk is checked first, and the contacts are matched in a single pass over all of them if
+        the API ignored the filter or that page is empty.
+        :param field_name: The name of the custom field, e.g. adp_associate_id.
+        :param values: The values to look up.
+        :param chunk_size: The number of values per query.
+        :param filters: Additional filter parameters as key=value
+        :return: A list of matching contacts, without duplicates.
+        """
+        if not field_name:
+            raise ValueError("field_name must be provided to find contacts by custom field")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        values = sorted({str(value) for value in values if value is not None})
+        if not values:
+            return []
+        chunks = [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+        filter_key = APIConnector.CUSTOM_FIELD_FILTER.format(field=field_name)
+
+        async def fetch_chunk(chunk, first=None):
+            fetch = self.__contacts_page_fetcher(**dict(filters, **{filter_key: ",".join(chunk)}))
+            wanted = set(chunk)
+            return [contact async for contact in self.__paginate(fetch, first=first)
+                    if custom_field_value(contact, field_name) in wanted]
+
+        first = await self.get_contacts(limit=self.PAGE_LIMIT, offset=0,
+                                        **dict(filters, **{filter_key: ",".join(chunks[0])}))
+        if not first or not isinstance(first.get('data'), list):
+            return unique_contacts(await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks)))
+
+        if not first['data']:
+            logging.warning("Custom field filter %s matched none of %d values, it may not be supported; "
+                            "matching the values in one pass over all contacts", filter_key, len(chunks[0]))
+            return await self.__match_in_one_pass(field_name, values, filters)
+        if ignores_custom_field_filter(first, field_name, chunks[0]):
+            logging.warning("Custom field filter %s is not applied by the API, "
+                            "matching the values in one pass over all contacts", filter_key)
+            # The filter was ignored, so the first page is the first page of every contact
+            return await self.__match_in_one_pass(field_name, values, filters, first)
+
+        results = await asyncio.gather(fetch_chunk(chunks[0], first), *(fetch_chunk(chunk) for chunk in chunks[1:]))
+        return unique_contacts(results)
+
+    async def __match_in_one_pass(self, field_name: str, values, filters: dict, first: dict = None) -> list:
+        """
+        Match the values of a custom field while paging through every contact.
+        :param field_name: The name of the custom field.
+        :param values: The values to look up.
+        :param filters: Filter parameters as key=value
+        :param first: Optional first page of every contact, already fetched.
+        :return: A list of matching contacts, without duplicates.
+        """
+        wanted = set(values)
+        return unique_contacts([[contact async for contact in
+                                 self.__paginate(self.__contacts_page_fetcher(**filters), first=first)
+                                 if custom_field_value(contact, field_name) in wanted]])
+
+    async def get_contact_details(self, contact_id):
+        """
+        Get details of a specific contact.
+        """
+        if not self.brand_id:
+            raise ValueError("brand_id must be set to call get_contact_details")
+
+        return await self.__make_request(
+            "contact_details",
+            dynamic_data={"brand_id": self.brand_id, "contact_id": contact_id}
+        )
+
+    async def __get_page(self, url_key: str, limit=None, offset=None, dynamic_data: dict = None, **filters):
+        """
+        Get one page of a paginated brand endpoint.
+        :param url_key: The key for the endpoint
+        :param limit: Max items per request (max 250)
+        :param offset: Items to skip
+        :param dynamic_data: Additional dynamic values to be placed in the url.
+        :param filters: Filter parameters as key=value
+        :return: The page returned by the API or None if the request fails
+        """
+        params = dict(filters)
+        if limit is not None:
+            params['limit'] = limit
+        if offset is not None:
+            params['offset'] = offset
+        return await self.__make_request(
+            url_key,
+            dynamic_data=dict(dynamic_data or {}, brand_id=self.brand_id),
+            params=params
+        )
+
+    async def get_contact_lists(self, limit=None, offset=None, **filters):
+        """
+        Get a page of the brand contact lists.
+        :param limit: Max items per request (max 250)
+        :param offset: Items to skip
+        :param filters: Filter parameters as key=value
+        :return: Dictionary containing the contact lists and pagingData.
+        """
+        if not self.brand_id:
+            raise ValueError("brand_id must be set to call get_contact_lists")
+        return await self.__get_page("lists", limit, offset, **filters)
+
+    async def find_contact_list_by_name(self, name):
+        """
+        Find a contact list by its exact name.
+        :param name: The name of the contact list.
+        :return: The first contact list with this name, or None.
+        :raises IncompleteDownloadError: If a page fails, so a failure is not mistaken for a missing list.
+        """
+        if not name:
+            raise ValueError("name must be provided to find a contact list")
+        async for contact_list in self.__paginate(self.get_contact_lists, strict=True):
+            if contact_list.get('name') == name:
+                return contact_list
+        return None
+
+    async def get_list_contacts(self, list_id, limit=None, offset=None):
+        """
+        Get a page of the contacts in a contact list.
+        :param list_id: The ID of the contact list.
+        :param limit: Max items per request (max 250)
+        :param offset: Items to skip
+        :return: Dictionary containing the contacts and pagingData.
+        """
+        if not self.brand_id:
+            raise ValueError("brand_id must be set to call get_list_contacts")
+        if not list_id:
+            raise ValueError("list_id must be provided to get the contacts of a list")
+        return await self.__get_page("list_contacts", limit, offset, dynamic_data={"list_id": list_id})
+
+    async def get_list_contact_ids(self, list_id) -> set:
+        """
+        Get the IDs of every contact in a contact list.
+        :param list_id: The ID of the contact list.
+        :return: A set of contact IDs as integers.
+        :raises IncompleteDownloadError: If a page fails, so no member is mistaken for a missing one.
+        """
+        contacts = self.__paginate(lambda limit, offset: self.get_list_contacts(list_id, limit, offset),
+                                   strict=True)
+        return {int(contact['contact_id']) async for contact in contacts if contact.get('contact_id') is not None}
+
+    async def get_campaigns(self, limit=None, offset=None, **filters):
+        """
+        Get a page of the brand campaigns.
+        :param limit: Max items per request (max 250)
+        :param offset: Items to skip
+        :param filters: Filter parameters as key=value
+        :return: Dictionary containing the campaigns and pagingData.
+        """
+        if not self.brand_id:
+            raise ValueError("brand_id must be set to call get_campaigns")
+        return await self.__get_page("campaigns", limit, offset, **filters)
+
+    async def find_campaign_by_name(self, name):
+        """
+        Find a campaign by its exact name.
+        :param name: The name of the campaign.
+        :return: The first campaign with this name, or None.
+        :raises IncompleteDownloadError: If a page fails, so a failure is not mistaken for a missing campaign.
+        """
+        if not name:
+            raise ValueError("name must be provided to find a campaign")
+        async for campaign in self.__paginate(self.get_campaigns, strict=True):
+            if campaign.get('name') == name:
+                return campaign
+        return None
+
+    async def create_contact_list(self, name=None, description=None):
+        """
+        Creates a contact list
+        """
+        if not self.brand_id:
+            raise ValueError("brand_id must be set to call create_contact_list")
+        if not name:
+            raise ValueError("name must be provided to create a contact list")
+        return await self.__make_request(
+            "create_list",
+            method="POST",
+            dynamic_data={"brand_id": self.brand_id},
+            body={
+                "name": name,
+                "description": description
+            }
+        )
+
+    async def add_contact_to_list(self, contact_id, list_id):
+        """
+        Add a contact to a list.
+        """
+        if not self.brand_id:
+            raise ValueError("brand_id must be set to call add_contact_to_list")
+        if not contact_id:
+            raise ValueError("contact_id must be provided to add a contact to a list")
+        if not list_id:
+            raise ValueError("list_id must be provided to add a contact to a list")
+
+        return await self.__make_request(
+            "add_contact_to_list",
+            method="POST",
+            dynamic_data={"brand_id": self.brand_id},
+            body=[{
+                "contact_id": int(contact_id),
+                "lists": [list_id]
+            }]
+        )
+
+    async def add_contacts_to_list(self, contact_ids, list_id,
+                                   chunk_size: int = LIST_CHUNK_SIZE) -> ListAddReport:
+        """
+        Add multiple contacts to a list.
+        The contacts are sent in chunks uploaded concurrently. Each chunk is retried on its own,
+        so a failure only affects the contacts of that chunk.
+        :param contact_ids: List of contact IDs to add.
+        :param list_id: The ID of the list to add contacts to.
+        :param chunk_size: The number of contacts per request.
+        :return: A ListAddReport with the contacts that were and were not added.
+        """
+        if not self.brand_id:
+            raise ValueError("brand_id must be set to call add_contacts_to_list")
+        if not contact_ids or not isinstance(contact_ids, list):
+            raise ValueError("contact_ids must be provided to add contacts to a list")
+        if not list_id:
+            raise ValueError("list_id must be provided to add contacts to a list")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        chunks = [contact_ids[i:i + chunk_size] for i in range(0, len(contact_ids), chunk_size)]
+        responses = await asyncio.gather(*(
+            self.__make_request(
+                "add_contact_to_list",
+                method="POST",
+                dynamic_data={"brand_id": self.brand_id},
+                body=[{"contact_id": int(contact_id), "lists": [list_id]} for contact_id in chunk]
+            )
+            for chunk in chunks
+        ))
+
+        report = ListAddReport(list_id)
+        for chunk, response in zip(chunks, responses):
+            report.record(chunk, response)
+        if report.failed:
+            logging.error("Failed to add %d of %d contacts to list %s",
+                          len(report.failed), len(contact_ids), list_id)
+        return report
+
+    async def get_custom_field(self, field_id):
+        """Get details for a custom field."""
+        if not self.brand_id:
+            raise ValueError("brand_id must be set to call get_custom_field")
+
+        return await self.__make_request(
+            "custom_fields",
+            dynamic_data={"brand_id": self.brand_id, "field_id": field_id}
+        )
+
+    async def create_campaign(self, name, message, contact_list_id, send_time=None):
+        """
+        Create a new campaign.
+        :param name: The name of the campaign.
+        :param message: The message content of the campaign.
+        :param contact_list_id: The ID of the contact list to send the campaign to.
+        :param send_time: Optional send time for the campaign.
+        :return: The response from the API.
+        """
+        if not self.brand_id:
+            raise ValueError("brand_id must be set to call create_campaign")
+
+        body = {
+            "name": name,
+            "body": message,
+            "status": "scheduled" if send_time else "send",
+            "audience": {
+                "contact_lists": [contact_list_id]
+            },
+            "scheduled": send_time
+        }
+
+        return await self.__make_request(
+            "campaigns",
+            method="POST",
+            dynamic_data={"brand_id": self.brand_id},
+            body=body
+        )
@@ -0,0 +1,181 @@
+"""
+This module contains the Cassette class, which records the SlickText requests of an APIConnector
+and replays them offline.
+"""
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class CassetteMissError(LookupError):
+    """
+    Raised in replay mode when the cassette has no (more) recorded responses for a request.
+    """
+
+
+class Cassette:
+    """
+    On-disk recording of request/response pairs, stored as gzipped JSON lines.
+
+    In record mode every request is sent through the session and written to the cassette with
+    its response and latency. In replay mode no request is sent: the recorded responses are
+    served back as requests.Response objects, either immediately or after the recorded latency.
+
+    Requests are matched on method, URL, query parameters and a hash of the (uncompressed) body.
+    Identical requests, like retries of the same page, are answered in the order they were
+    recorded.
+    """
+    RECORD = "record"
+    REPLAY = "replay"
+    # Response headers that describe the wire encoding rather than the decoded content
+    SKIPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+
+    def __init__(self, path: str, mode: str = REPLAY, replay_latency: bool = False):
+        """
+        Initialize the Cassette.
+        :param path: The path of the cassette file (conventionally ending in .jsonl.gz).
+        :param mode: Either Cassette.RECORD, which overwrites the file, or Cassette.REPLAY.
+        :param replay_latency: In replay mode, wait the recorded latency before returning a response.
+        """
+        if mode not in (self.RECORD, self.REPLAY):
+            raise ValueError("mode must be either 'record' or 'replay'")
+        self.path = path
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self._interactions = defaultdict(deque)
+        self._lock = threading.Lock()
+        self._file = None
+        if mode == self.RECORD:
+            self._file = gzip.open(path, "wt", encoding="utf-8")
+        else:
+            self._load()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Flush and close the cassette file in record mode.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(queue) for queue in self._interactions.values())
+
+    def _load(self):
+        """
+        Read every recorded interaction of the cassette file.
+        """
+        with gzip.open(self.path, "rt", encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    interaction = json.loads(line)
+                    self._interactions[interaction["key"]].append(interaction)
+        logging.info("Loaded %d recorded requests from cassette %s", len(self), self.path)
+
+    @staticmethod
+    def request_key(method: str, url: str, params: dict = None, data: bytes = None, headers: dict = None) -> str:
+        """
+        Build the key a request is matched on.
+        :param method: The HTTP method.
+        :param url: The request URL.
+        :param params: The query parameters.
+        :param data: The encoded request body.
+        :param headers: The extra request headers, used to detect a gzipped body.
+        :return: A string identifying the request.
+        """
+        if data and (headers or {}).get("Content-Encoding") == "gzip":
+            # gzip output embeds a timestamp, so compare the uncompressed body
+            data = gzip.decompress(data)
+        body_hash = hashlib.sha256(data).hexdigest()[:16] if data else ""
+        query = json.dumps(params or {}, sort_keys=True, separators=(",", ":"), default=str)
+        return f"{method.upper()} {url} {query} {body_hash}"
+
+    def request(self, session: requests.Session, method: str, url: str, headers: dict = None,
+                params: dict = None, data: bytes = None, timeout=None) -> requests.Response:
+        """
+        Send a request through the session and record it, or replay its recorded response.
+        :param session: The session used to send the request in record mode.
+        :param method: The HTTP method.
+        :param url: The request URL.
+        :param headers: The extra request headers.
+        :param params: The query parameters.
+        :param data: The encoded request body.
+        :param timeout: The request timeout.
+        :return: The response.
+        :raises CassetteMissError: In replay mode, if no recorded response is left for the request.
+        """
+        key = self.request_key(method, url, params, data, headers)
+        if self.mode == self.REPLAY:
+            return self._replay(key)
+
+        start = time.monotonic()
+        response = session.request(method=method, url=url, headers=headers, params=params, data=data,
+                                   timeout=timeout)
+        self._record(key, response, time.monotonic() - start)
+        return response
+
+    def _record(self, key: str, response: requests.Response, latency: float):
+        """
+        Append an interaction to the cassette file.
+        :param key: The request key.
+        :param response: The response received.
+        :param latency: The request duration in seconds.
+        """
+        interaction = {
+            "key": key,
+            "status_code": response.status_code,
+            "headers": {name: value for name, value in response.headers.items()
+                        if name.lower() not in self.SKIPPED_HEADERS},
+            "latency": round(latency, 6)
+        }
+        try:
+            interaction["text"] = response.content.decode("utf-8")
+        except UnicodeDecodeError:
+            interaction["content"] = base64.b64encode(response.content).decode("ascii")
+        line = json.dumps(interaction, separators=(",", ":"))
+        with self._lock:
+            if self._file is None:
+                raise ValueError(f"Cassette {self.path} is closed")
+            self._file.write(line + "\n")
+
+    def _replay(self, key: str) -> requests.Response:
+        """
+        Build the next recorded response of a request.
+        :param key: The request key.
+        :return: The recorded response.
+        :raises CassetteMissError: If no recorded response is left for the request.
+        """
+        with self._lock:
+            queue = self._interactions.get(key)
+            if not queue:
+                raise CassetteMissError(f"No recorded response left in cassette {self.path} for {key}")
+            interaction = queue.popleft()
+
+        if self.replay_latency and interaction["latency"] > 0:
+            time.sleep(interaction["latency"])
+
+        response = requests.Response()
+        response.status_code = interaction["status_code"]
+        response.headers = CaseInsensitiveDict(interaction["headers"])
+        if "text" in interaction:
+            response._content = interaction["text"].encode("utf-8")  # pylint: disable=protected-access
+        else:
+            response._content = base64.b64decode(interaction["content"])  # pylint: disable=protected-access
+        response.encoding = "utf-8"
+        response.url = key.split(" ", 2)[1]
+        return response
@@ -0,0 +1,225 @@
+"""
+This module contains a per-endpoint circuit breaker for the API connectors.
+"""
+import logging
+import threading
+import time
+from collections import deque
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised instead of sending a request while the circuit of its endpoint is open.
+    """
+
+    def __init__(self, key: str, retry_in: float):
+        """
+        Initialize the CircuitOpenError.
+        :param key: The endpoint key whose circuit is open.
+        :param retry_in: The number of seconds until the circuit lets a probe request through.
+        """
+        super().__init__(f"Circuit for SlickText endpoint '{key}' is open after repeated failures, "
+                         f"failing fast (next probe in {retry_in:.1f}s)")
+        self.key = key
+        self.retry_in = retry_in
+
+
+class Circuit:
+    """
+    The circuit of a single endpoint key.
+
+    closed: every request goes through and its outcome is added to a sliding window of the
+    last `window_size` outcomes. Once the window holds at least `min_calls` outcomes and the
+    failure rate reaches `failure_rate`, the circuit opens.
+    open: every request is rejected until `open_duration` seconds have passed.
+    half_open: up to `half_open_calls` probe requests go through. The circuit closes when a probe
+    succeeds and opens again when one fails.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, key: str, failure_rate: float, window_size: int, min_calls: int,
+                 open_duration: float, half_open_calls: int, on_change=None):
+        """
+        Initialize the Circuit in the closed state.
+        :param key: The endpoint key.
+        :param failure_rate: The failure rate, between 0 and 1, that opens the circuit.
+        :param window_size: The number of recent outcomes the failure rate is computed over.
+        :param min_calls: The minimum number of outcomes before the circuit can open.
+        :param open_duration: The number of seconds the circuit stays open before probing.
+        :param half_open_calls: The number of concurrent probe requests in the half-open state.
+        :param on_change: Optional callable taking (key, old_state, new_state).
+        """
+        self.key = key
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self.on_change = on_change
+        self.state = self.CLOSED
+        self._outcomes = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def _transition(self, state: str):
+        """
+        Move to a new state. Must be called with the lock held.
+        :param state: The new state.
+        """
+        old_state, self.state = self.state, state
+        self._probes = 0
+        if state == self.OPEN:
+            self._opened_at = time.monotonic()
+            logging.warning("Circuit for endpoint %s opened (%s -> %s), failing fast for %.1fs",
+                            self.key, old_state, state, self.open_duration)
+        else:
+            if state == self.CLOSED:
+                self._outcomes.clear()
+            logging.info("Circuit for endpoint %s changed from %s to %s", self.key, old_state, state)
+        if self.on_change is not None:
+            self.on_change(self.key, old_state, state)
+
+    def allow(self):
+        """
+        Check that a request may be sent.
+        :raises CircuitOpenError: If the circuit is open, or half-open with every probe slot taken.
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                retry_in = self._opened_at + self.open_duration - time.monotonic()
+                if retry_in > 0:
+                    raise CircuitOpenError(self.key, retry_in)
+                self._transition(self.HALF_OPEN)
+            if self.state == self.HALF_OPEN:
+                if self._probes >= self.half_open_calls:
+                    raise CircuitOpenError(self.key, 0.0)
+                self._probes += 1
+
+    @property
+    def failure_ratio(self) -> float:
+        """
+        The failure rate over the current window (0 when the window is empty).
+        """
+        with self._lock:
+            return sum(self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    def record(self, failed: bool):
+        """
+        Record the outcome of a request sent after allow().
+        :param failed: True if the request failed.
+        """
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._transition(self.OPEN if failed else self.CLOSED)
+                return
+            if self.state == self.OPEN:
+                # A request sent before the circuit opened; the window is already decided
+                return
+            self._outcomes.append(failed)
+            if (len(self._outcomes) >= self.min_calls
+                    and sum(self._outcomes) / len(self._outcomes) >= self.failure_rate):
+                self._transition(self.OPEN)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker with one Circuit per endpoint key (the keys of APIConnector.ENDPOINTS).
+
+    Connection errors and the FAILURE_STATUS_CODES count as failures. Any other response,
+    including fatal client errors like 404 and throttling with 429, shows that the service is up.
+    The same instance can be shared between threads and between sync and async connectors.
+    """
+    FAILURE_STATUS_CODES = frozenset({408, 500, 502, 503, 504})
+
+    def __init__(self, failure_rate: float = 0.5, window_size: int = 20, min_calls: int = 10,
+                 open_duration: float = 30.0, half_open_calls: int = 1, metrics=None):
+        """
+        Initialize the CircuitBreaker.
+        :param failure_rate: The failure rate, between 0 and 1, that opens a circuit.
+        :param window_size: The number of recent outcomes per endpoint the failure rate is computed over.
+        :param min_calls: The minimum number of outcomes before a circuit can open.
+        :param open_duration: The number of seconds a circuit stays open before letting a probe through.
+        :param half_open_calls: The number of concurrent probe requests in the half-open state.
+        :param metrics: Optional APIMetrics recording the state changes.
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be between 0 (exclusive) and 1")
+        if window_size < 1 or min_calls < 1 or half_open_calls < 1:
+            raise ValueError("window_size, min_calls and half_open_calls must be positive integers")
+        if min_calls > window_size:
+            raise ValueError("min_calls must not exceed window_size")
+        if open_duration < 0:
+            raise ValueError("open_duration must not be negative")
+        self.failure_rate = failure_rate
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self.metrics = metrics
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def circuit(self, key: str) -> Circuit:
+        """
+        Get the circuit of an endpoint key, creating it on first use.
+        :param key: The endpoint key.
+        :return: The Circuit for the key.
+        """
+        with self._lock:
+            if key not in self._circuits:
+                self._circuits[key] = Circuit(key, self.failure_rate, self.window_size, self.min_calls,
+                                              self.open_duration, self.half_open_calls, self._on_change)
+            return self._circuits[key]
+
+    def _on_change(self, key: str, old_state: str, new_state: str):
+        """
+        Report a state change to the metrics.
+        :param key: The endpoint key.
+        :param old_state: The previous state.
+        :param new_state: The new state.
+        """
+        if self.metrics is not None:
+            self.metrics.record_circuit_state(key, old_state, new_state)
+
+    def before_request(self, key: str):
+        """
+        Check that a request to the endpoint key may be sent.
+        :param key: The endpoint key.
+        :raises CircuitOpenError: If the circuit of the key is open.
+        """
+        try:
+            self.circuit(key).allow()
+        except CircuitOpenError:
+            if self.metrics is not None:
+                self.metrics.record_rejected(key)
+            raise
+
+    def record(self, key: str, status_code):
+        """
+        Record the outcome of a request.
+        :param key: The endpoint key.
+        :param status_code: The HTTP status code, or None for a connection error.
+        """
+        self.circuit(key).record(status_code is None or status_code in self.FAILURE_STATUS_CODES)
+
+    def state(self, key: str) -> str:
+        """
+        Get the state of the circuit of an endpoint key.
+        :param key: The endpoint key.
+        :return: One of Circuit.CLOSED, Circuit.OPEN or Circuit.HALF_OPEN.
+        """
+        return self.circuit(key).state
+
+    def states(self) -> dict:
+        """
+        Get the state and failure rate of every circuit.
+        :return: A dictionary of {endpoint_key: {"state", "failure_rate"}}.
+        """
+        with self._lock:
+            circuits = dict(self._circuits)
+        return {
+            key: {"state": circuit.state, "failure_rate": circuit.failure_ratio}
+            for key, circuit in sorted(circuits.items())
+        }
@@ -0,0 +1,168 @@
+"""
+This module contains the ContactIndex class, in-memory lookups of the SlickText contacts used to
+match contacts to workers.
+"""
+import re
+
+
+class ContactIndex:
+    """
+    Hash indexes of a brand's contacts on associate ID, contact ID and phone number.
+
+    The index is built once from a contact stream and can then be matched against the worker IDs
+    of any number of pay periods. Associate IDs are compared after trimming and case folding, so
+    " w000123" and "W000123" are the same worker. Several contacts sharing one associate ID are
+    kept and reported by duplicates().
+    """
+    ASSOCIATE_ID_FIELD = "adp_associate_id"
+    PHONE_FIELD = "mobile_number"
+
+    def __init__(self, contacts=None):
+        """
+        Initialize the ContactIndex.
+        :param contacts: Optional iterable of contact dictionaries to add.
+        """
+        self.by_associate_id = {}
+        self.by_contact_id = {}
+        self.by_phone = {}
+        # Contacts without custom fields at all, and without an associate ID
+        self.missing_custom_fields = []
+        self.missing_associate_id = []
+        if contacts is not None:
+            self.add_all(contacts)
+
+    @staticmethod
+    def normalize_associate_id(associate_id):
+        """
+        Normalize an associate ID for comparison.
+        :param associate_id: The raw associate ID.
+        :return: The trimmed, case-folded ID, or None if it is empty.
+        """
+        if associate_id is None:
+            return None
+        normalized = str(associate_id).strip().casefold()
+        return normalized or None
+
+    @staticmethod
+    def normalize_phone(phone):
+        """
+        Normalize a phone number to its digits, without the North American country code.
+        :param phone: The raw phone number, e.g. "+1 (555) 000-0001".
+        :return: The digits, or None if there are none.
+        """
+        if phone is None:
+            return None
+        digits = re.sub(r"\D", "", str(phone))
+        if len(digits) == 11 and digits.startswith("1"):
+            digits = digits[1:]
+        return digits or None
+
+    def add(self, contact: dict):
+        """
+        Add a contact to the indexes.
+        :param contact: The contact dictionary returned by the API.
+        """
+        contact_id = contact.get('contact_id')
+        if contact_id is not None:
+            self.by_contact_id[contact_id] = contact
+
+        phone = self.normalize_phone(contact.get(self.PHONE_FIELD))
+        if phone is not None:
+            self.by_phone.setdefault(phone, []).append(contact)
+
+        custom_fields = contact.get('custom_fields')
+        if custom_fields is None:
+            self.missing_custom_fields.append(contact)
+        associate_id = self.normalize_associate_id((custom_fields or {}).get(self.ASSOCIATE_ID_FIELD))
+        if associate_id is None:
+            self.missing_associate_id.append(contact)
+        else:
+            self.by_associate_id.setdefault(associate_id, []).append(contact)
+
+    def add_all(self, contacts):
+        """
+        Add every contact of an iterable to the indexes.
+        :param contacts: An iterable of contact dictionaries.
+        :return: The ContactIndex, for chaining.
+        """
+        for contact in contacts:
+            self.add(contact)
+        return self
+
+    def __len__(self):
+        return len(self.by_contact_id)
+
+    def get_by_associate_id(self, associate_id) -> list:
+        """
+        Get the contacts of an associate ID.
+        :param associate_id: The associate ID, normalized before the lookup.
+        :return: A list of contacts, empty if there is none.
+        """
+        return list(self.by_associate_id.get(self.normalize_associate_id(associate_id), []))
+
+    def get_by_contact_id(self, contact_id):
+        """
+        Get a contact by its ID.
+        :param contact_id: The contact ID.
+        :return: The contact dictionary, or None.
+        """
+        return self.by_contact_id.get(contact_id)
+
+    def get_by_phone(self, phone) -> list:
+        """
+        Get the contacts with a phone number.
+        :param phone: The phone number, normalized before the lookup.
+        :return: A list of contacts, empty if there is none.
+        """
+        return list(self.by_phone.get(self.normalize_phone(phone), []))
+
+    def duplicates(self) -> dict:
+        """
+        Get the associate IDs shared by several contacts.
+        :return: A dictionary of {normalized associate ID: list of contacts}.
+        """
+        return {associate_id: contacts for associate_id, contacts in self.by_associate_id.items()
+                if len(contacts) > 1}
+
+    def match(self, worker_ids) -> dict:
+        """
+        Match worker IDs against the associate ID index.
+        :param worker_ids: An iterable of worker IDs.
+        :return: A dictionary of {normalized worker ID: list of matched contacts}, sorted by worker ID.
+        """
+        normalized = {self.normalize_associate_id(worker_id) for worker_id in worker_ids}
+        matched = normalized.intersection(self.by_associate_id)
+        return {associate_id: self.by_associate_id[associate_id] for associate_id in sorted(matched)}
+
+
+def stream_match(contacts, worker_ids) -> dict:
+    """
+    Match worker IDs against a contact stream, stopping as soon as every worker ID is matched.
+
+    Only the first contact of every worker ID is kept ("first match wins"), which is what makes it
+    safe to stop early; use ContactIndex.match to get every contact sharing an associate ID.
+    When the stream stops early it is closed, so a paginating generator issues no more requests,
+    apart from a page it was already prefetching.
+    :param contacts: An iterable of contact dictionaries, e.g. APIConnector.iter_contacts().
+    :param worker_ids: An iterable of worker IDs.
+    :return: A dictionary of {normalized worker ID: [first matched contact]}, sorted by worker ID.
+    """
+    remaining = {ContactIndex.normalize_associate_id(worker_id) for worker_id in worker_ids}
+    remaining.discard(None)
+    matched = {}
+    iterator = iter(contacts)
+    try:
+        for contact in iterator if remaining else ():
+            associate_id = ContactIndex.normalize_associate_id(
+                (contact.get('custom_fields') or {}).get(ContactIndex.ASSOCIATE_ID_FIELD)
+            )
+            if associate_id in remaining:
+                remaining.discard(associate_id)
+                matched[associate_id] = [contact]
+                if not remaining:
+                    break
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+    return {associate_id: matched[associate_id] for associate_id in sorted(matched)}
@@ -0,0 +1,168 @@
+"""
+This module contains the ContactStore class, a local SQLite snapshot of the SlickText contacts.
+"""
+import logging
+import sqlite3
+
+
+class ContactStore:
+    """
+    Local on-disk snapshot of the brand contacts, keyed by contact_id.
+
+    Only the fields used to match contacts to workers are kept, together with a last-modified
+    watermark. sync() fetches the contacts modified since the watermark and upserts them, so a
+    normal run only transfers the contacts that changed. Contacts deleted in SlickText are only
+    removed by a full resync.
+    """
+    # Contact field holding the last modification time and the filter used to query by it
+    MODIFIED_FIELD = "last_updated"
+    MODIFIED_SINCE_FILTER = "last_updated_after"
+
+    def __init__(self, path: str, modified_field: str = MODIFIED_FIELD,
+                 modified_since_filter: str = MODIFIED_SINCE_FILTER):
+        """
+        Initialize the ContactStore and create its tables if needed.
+        :param path: The path of the SQLite file (":memory:" for a temporary store).
+        :param modified_field: The contact field holding the last modification time.
+        :param modified_since_filter: The contacts filter returning contacts modified since a time.
+        """
+        self.path = path
+        self.modified_field = modified_field
+        self.modified_since_filter = modified_since_filter
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS contacts ("
+                "contact_id INTEGER PRIMARY KEY, "
+                "adp_associate_id TEXT, "
+                "first_name TEXT, "
+                "last_name TEXT, "
+                "has_custom_fields INTEGER NOT NULL, "
+                "last_modified TEXT)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value TEXT)"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Close the SQLite connection.
+        """
+        self.connection.close()
+
+    @property
+    def watermark(self):
+        """
+        The last-modified time of the most recently modified contact in the store, or None.
+        """
+        row = self.connection.execute(
+            "SELECT value FROM sync_state WHERE key = 'watermark'"
+        ).fetchone()
+        return row[0] if row else None
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+
+    def _to_row(self, contact: dict) -> tuple:
+        """
+        Convert an API contact to a contacts table row.
+        :param contact: The contact dictionary returned by the API.
+        :return: A tuple matching the contacts table columns.
+        """
+        custom_fields = contact.get('custom_fields')
+        adp_associate_id = (custom_fields or {}).get('adp_associate_id')
+        return (
+            int(contact['contact_id']),
+            adp_associate_id,
+            contact.get('first_name', ''),
+            contact.get('last_name', ''),
+            int(custom_fields is not None),
+            contact.get(self.modified_field)
+        )
+
+    def upsert(self, contacts, replace: bool = False) -> int:
+        """
+        Insert or update contacts and advance the watermark.
+        :param contacts: An iterable of contact dictionaries returned by the API.
+        :param replace: If True, delete every stored contact first.
+        :return: The number of contacts written.
+        """
+        rows = [self._to_row(contact) for contact in contacts]
+        modified = [row[5] for row in rows if row[5]]
+        with self.connection:
+            if replace:
+                self.connection.execute("DELETE FROM contacts")
+                self.connection.execute("DELETE FROM sync_state WHERE key = 'watermark'")
+            self.connection.executemany(
+                "INSERT INTO contacts "
+                "(contact_id, adp_associate_id, first_name, last_name, has_custom_fields, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(contact_id) DO UPDATE SET "
+                "adp_associate_id = excluded.adp_associate_id, "
+                "first_name = excluded.first_name, "
+                "last_name = excluded.last_name, "
+                "has_custom_fields = excluded.has_custom_fields, "
+                "last_modified = excluded.last_modified",
+                rows
+            )
+            if modified:
+                watermark = max(modified)
+                if self.watermark is None or watermark > self.watermark:
+                    self.connection.execute(
+                        "INSERT OR REPLACE INTO sync_state (key, value) VALUES ('watermark', ?)",
+                        (watermark,)
+                    )
+        return len(rows)
+
+    def sync(self, api_connector, full: bool = False, **filters) -> int:
+        """
+        Bring the store up to date with the API.
+        :param api_connector: The APIConnector used to fetch the contacts.
+        :param full: If True, or if the store has no watermark yet, download every contact and
+        replace the store content.
+        :param filters: Additional filter parameters as key=value
+        :return: The number of contacts transferred.
+        :raises IncompleteDownloadError: If a page fails; the store and its watermark are left unchanged.
+        """
+        watermark = self.watermark
+        # Only decode the fields kept in the store
+        filters.setdefault('projection', ["contact_id", "first_name", "last_name",
+                                          "custom_fields.adp_associate_id", self.modified_field])
+        # A partial download must neither replace the store nor move the watermark past missing contacts
+        if full or watermark is None:
+            contacts = api_connector.get_all_contacts(concurrent=True, strict=True, **filters)
+            count = self.upsert(contacts, replace=True)
+            logging.info("Full contact sync stored %d contacts", count)
+            return count
+
+        # The filter is inclusive, so contacts modified at the watermark are fetched again;
+        # the upsert makes that harmless and no same-second change is missed.
+        filters[self.modified_since_filter] = watermark
+        contacts = api_connector.get_all_contacts(concurrent=True, strict=True, **filters)
+        count = self.upsert(contacts)
+        logging.info("Incremental contact sync since %s stored %d contacts", watermark, count)
+        return count
+
+    def get_contacts(self):
+        """
+        Get the stored contacts in the shape returned by the API.
+        :return: A generator of contact dictionaries with contact_id, first_name, last_name and
+        custom_fields (None if the contact had no custom fields).
+        """
+        cursor = self.connection.execute(
+            "SELECT contact_id, adp_associate_id, first_name, last_name, has_custom_fields "
+            "FROM contacts ORDER BY contact_id"
+        )
+        for contact_id, adp_associate_id, first_name, last_name, has_custom_fields in cursor:
+            yield {
+                'contact_id': contact_id,
+                'first_name': first_name,
+                'last_name': last_name,
+                'custom_fields': {'adp_associate_id': adp_associate_id} if has_custom_fields else None
+            }
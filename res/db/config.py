@@ -9,6 +9,10 @@ class Config:
     """
     Configuration class for the database connection.
     """
+    # Isolation levels accepted by the SQL Server dialect
+    ISOLATION_LEVELS = ('READ UNCOMMITTED', 'READ COMMITTED', 'REPEATABLE READ', 'SNAPSHOT', 'SERIALIZABLE',
+                        'AUTOCOMMIT')
+
     def __init__(self):
         self.server = os.getenv('DB_SERVER')
         self.username = os.getenv('DB_USERNAME')
@@ -16,6 +20,20 @@ class Config:
         self.database = os.getenv('DB_NAME')
         self.validate_config()
 
+        # Connection pool settings; connections older than pool_recycle seconds are replaced, and
+        # pre-ping checks a pooled connection before handing it out so a dropped one is reconnected
+        self.pool_size = int(os.getenv('DB_POOL_SIZE', '5'))
+        self.max_overflow = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+        self.pool_recycle = int(os.getenv('DB_POOL_RECYCLE', '1800'))
+        self.pool_pre_ping = os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
+        # Isolation level of regular sessions, the driver default when not set
+        self.isolation_level = os.getenv('DB_ISOLATION_LEVEL', '').upper() or None
+        # Isolation level of the read-only sessions running the reminder queries
+        self.read_only_isolation_level = os.getenv('DB_READ_ONLY_ISOLATION_LEVEL', 'READ UNCOMMITTED').upper()
+        # Send executemany() parameters in one batch instead of one round trip per row
+        self.fast_executemany = os.getenv('DB_FAST_EXECUTEMANY', 'true').lower() == 'true'
+        self.validate_engine_options()
+
         self.connection_string = (
             f'DRIVER=ODBC Driver 17 for SQL Server;'
             f'SERVER={self.server};'
@@ -42,5 +60,39 @@ class Config:
         if not self.database:
             raise ValueError("Configuration variable DB_NAME is not set")
 
+    def validate_engine_options(self):
+        """
+        Validate the connection pool and isolation level settings.
+        :raises ValueError: If a setting is out of range or unknown.
+        """
+        if self.pool_size < 1:
+            raise ValueError("Configuration variable DB_POOL_SIZE must be a positive integer")
+        if self.max_overflow < 0:
+            raise ValueError("Configuration variable DB_MAX_OVERFLOW must not be negative")
+        if self.isolation_level is not None and self.isolation_level not in self.ISOLATION_LEVELS:
+            raise ValueError(f"Configuration variable DB_ISOLATION_LEVEL must be one of "
+                             f"{', '.join(self.ISOLATION_LEVELS)}")
+        if self.read_only_isolation_level not in self.ISOLATION_LEVELS:
+            raise ValueError(f"Configuration variable DB_READ_ONLY_ISOLATION_LEVEL must be one of "
+                             f"{', '.join(self.ISOLATION_LEVELS)}")
+
+    @property
+    def engine_options(self) -> dict:
+        """
+        The keyword arguments of create_engine for the database URI.
+        :return: A dictionary of engine options.
+        """
+        options = {
+            'pool_size': self.pool_size,
+            'max_overflow': self.max_overflow,
+            'pool_recycle': self.pool_recycle,
+            'pool_pre_ping': self.pool_pre_ping
+        }
+        if self.isolation_level:
+            options['isolation_level'] = self.isolation_level
+        if self.sqlalchemy_database_uri.startswith('mssql+pyodbc'):
+            options['fast_executemany'] = self.fast_executemany
+        return options
+
     def __str__(self):
         return "Config"
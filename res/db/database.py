@@ -1,7 +1,7 @@
 """
 Database module to handle the database configuration and session.
 """
-from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.orm import Session, sessionmaker, scoped_session
 from sqlalchemy import create_engine
 from .config import Config
 from .models import Base
@@ -18,19 +18,35 @@ class Database:
         self.config = Config()
         self.engine = self._create_engine()
         self.session_factory = scoped_session(sessionmaker(bind=self.engine))
+        # Shares the connection pool of the engine; every connection it checks out runs at the
+        # read-only isolation level and is reset when returned to the pool
+        self.read_only_engine = self.engine.execution_options(
+            isolation_level=self.config.read_only_isolation_level)
+        self.read_only_session_factory = sessionmaker(bind=self.read_only_engine, autoflush=False)
 
     def _create_engine(self):
         """
         Create and return the database engine.
         :return: SQLAlchemy engine
         """
-        return create_engine(self.config.sqlalchemy_database_uri)
+        return create_engine(self.config.sqlalchemy_database_uri, **self.config.engine_options)
 
     def create_tables(self):
         """
-        Create all tables in the database if they do not exist.
+        Create all tables in the database if they do not exist, and the missing indexes of existing tables.
         """
         Base.metadata.create_all(self.engine)
+        self.create_indexes()
+
+    def create_indexes(self):
+        """
+        Create the indexes of the models that do not exist yet.
+        create_all() skips the tables that already exist, together with their indexes, so indexes added
+        to a model after its table was created are only created here.
+        """
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
 
     def get_new_session(self):
         """
@@ -39,6 +55,15 @@ class Database:
         """
         return self.session_factory()
 
+    def get_read_only_session(self) -> Session:
+        """
+        Create a session for the reminder queries, which only read the database and tolerate
+        uncommitted rows, so they do not wait on the locks of a running timecard import.
+        The isolation level is DB_READ_ONLY_ISOLATION_LEVEL (READ UNCOMMITTED by default).
+        :return: A new SQLAlchemy session
+        """
+        return self.read_only_session_factory()
+
     def close(self):
         """
         Close the database engine and remove session.
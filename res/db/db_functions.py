@@ -1,8 +1,30 @@
 """
 This module contains functions to interact with the database.
 """
-from sqlalchemy import or_
-from .models import Employee, Timecard, DayEntry, PayPeriod
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import func, or_, select
+from .models import Employee, Timecard, DayEntry, MissingPunchSummary, PayPeriod
+
+# 2001-01-01 00:00:00.0000000 -05:00 is ADPs placeholder for missing punches
+# 2000-01-01 00:00:00.0000000 +00:00 is an additional placeholder for missing punches
+# They are timezone-aware datetimes bound with the type of the punch columns: pyodbc sends them as
+# datetimeoffset strings that keep their offset, and SQL Server converts those parameters rather than
+# the columns, so the comparison can still seek the punch time indexes.
+MISSING_PUNCH_TIMES = [
+    datetime(2001, 1, 1, tzinfo=timezone(timedelta(hours=-5))),
+    datetime(2000, 1, 1, tzinfo=timezone.utc)
+]
+
+
+def missing_punch_filter():
+    """
+    Build the filter matching day entries with a missing clock in or clock out punch.
+    The expected plan seeks IX_Timecards_pay_period_id_associate_id for the pay period, then the
+    DayEntries indexes (by timecard, or by punch time when the placeholders are rarer), never a scan.
+    :return: A SQLAlchemy boolean expression on DayEntry.
+    """
+    return or_(DayEntry.clock_in_time.in_(MISSING_PUNCH_TIMES),
+               DayEntry.clock_out_time.in_(MISSING_PUNCH_TIMES))
 
 
 def get_all_employees(session):
@@ -41,18 +63,8 @@ def get_time_cards_with_missing_punches(session, pay_period_id=None):
     :param pay_period_id: (Optional) The ID of the pay period to filter by.
     :return: A list of time cards with missing punches.
     """
-    # 2001-01-01 00:00:00.0000000 -05:00 is ADPs placeholder for missing punches
-    # 2000-01-01 00:00:00.0000000 +00:00 is an additional placeholder for missing punches
-    missing_punch_times = [
-        '2001-01-01 00:00:00.0000000 -05:00',
-        '2000-01-01 00:00:00.0000000 +00:00'
-    ]
-
     # Query for time cards with missing punches
-    query = session.query(Timecard).join(DayEntry).filter(
-        or_(DayEntry.clock_in_time.in_(missing_punch_times),
-            DayEntry.clock_out_time.in_(missing_punch_times))
-    ).distinct()
+    query = session.query(Timecard).join(DayEntry).filter(missing_punch_filter()).distinct()
 
     # If a pay period ID is provided, filter by it
     if pay_period_id is not None:
@@ -61,28 +73,94 @@ def get_time_cards_with_missing_punches(session, pay_period_id=None):
     return query.all()
 
 
-def get_employees_with_missing_punches_by_pay_period(session, pay_period_id):
+def get_employees_with_missing_punches_by_pay_period(session, pay_period_id, options=None):
     """
     Get employees with missing punches by pay period.
     :param session: The database session.
     :param pay_period_id: The ID of the pay period.
+    :param options: (Optional) Loader options applied to the query, e.g.
+    [selectinload(Employee.timecards).selectinload(Timecard.day_entries)] to eager-load the
+    timecards and day entries of the employees.
     :return: A list of employees with missing punches for the specified pay period.
     """
-    time_cards = get_time_cards_with_missing_punches(session, pay_period_id)
-    employee_ids = {timecard.associate_id for timecard in time_cards}
-    return session.query(Employee).filter(Employee.associate_id.in_(employee_ids)).all()
+    # A single query with a semi-join on the timecards with missing punches, instead of loading
+    # them and sending their associate IDs back as an IN list of parameters
+    timecards_with_missing_punches = select(Timecard.associate_id).join(Timecard.day_entries).where(
+        Timecard.pay_period_id == pay_period_id,
+        missing_punch_filter()
+    )
+    query = session.query(Employee).filter(Employee.associate_id.in_(timecards_with_missing_punches))
+    if options:
+        query = query.options(*options)
+    return query.all()
 
 
-def get_worker_ids_with_missing_punches_by_pay_period(session, pay_period_id):
+def get_worker_ids_with_missing_punches_by_pay_period(session, pay_period_id, use_summary=False):
     """
     Get worker IDs with time cards containing missing punches by pay period.
     :param session: The database session.
     :param pay_period_id: The ID of the pay period.
-    :return: A list of worker IDs.
+    :param use_summary: (Optional) Read the MissingPunchSummary table instead of the day entries.
+    It is only as current as the last refresh_missing_punch_summary call.
+    :return: A set of worker IDs.
     """
-    time_cards = get_time_cards_with_missing_punches(session, pay_period_id)
-    worker_ids = {timecard.employee.worker_id for timecard in time_cards}
-    return worker_ids
+    if use_summary:
+        # Only the summary rows of the timecards with missing punches are read
+        query = session.query(Employee.worker_id).join(
+            MissingPunchSummary, MissingPunchSummary.associate_id == Employee.associate_id
+        ).filter(MissingPunchSummary.pay_period_id == pay_period_id).distinct()
+        return {worker_id for (worker_id,) in query}
+
+    # One SELECT DISTINCT of the worker IDs, without loading the timecards and their employees
+    query = session.query(Employee.worker_id).join(Employee.timecards).join(Timecard.day_entries).filter(
+        Timecard.pay_period_id == pay_period_id,
+        missing_punch_filter()
+    ).distinct()
+    return {worker_id for (worker_id,) in query}
+
+
+def refresh_missing_punch_summary(session, pay_period_id=None):
+    """
+    Bring the MissingPunchSummary rows in line with the day entries and write only the rows that changed.
+    There is no change tracking on the DayEntries table: every day entry with a missing punch is read
+    again, through the punch time indexes, so a refresh costs about as much as the direct query. It is
+    meant to run after the timecard import (see refresh_summary.py), not before every reminder run.
+    A timecard whose count differs from its summary row is updated, a new one is inserted, and the row
+    of a timecard without missing punches anymore, because its entries were fixed or deleted, is
+    deleted. The changes are flushed, the caller commits them.
+    :param session: The database session.
+    :param pay_period_id: (Optional) Only refresh the timecards of this pay period.
+    :return: The number of summary rows inserted, updated or deleted.
+    """
+    query = session.query(
+        Timecard.timecard_id, Timecard.associate_id, Timecard.pay_period_id, func.count(DayEntry.entry_id)
+    ).join(Timecard.day_entries).filter(missing_punch_filter())
+    summaries = session.query(MissingPunchSummary)
+    if pay_period_id is not None:
+        query = query.filter(Timecard.pay_period_id == pay_period_id)
+        summaries = summaries.filter(MissingPunchSummary.pay_period_id == pay_period_id)
+    counts = query.group_by(Timecard.timecard_id, Timecard.associate_id, Timecard.pay_period_id).all()
+    summaries = {summary.timecard_id: summary for summary in summaries}
+
+    changed = 0
+    for timecard_id, associate_id, timecard_pay_period_id, missing_punches in counts:
+        summary = summaries.pop(timecard_id, None)
+        if summary is None:
+            session.add(MissingPunchSummary(timecard_id, associate_id, timecard_pay_period_id, missing_punches))
+        elif (summary.associate_id, summary.pay_period_id, summary.missing_punches) != \
+                (associate_id, timecard_pay_period_id, missing_punches):
+            summary.associate_id = associate_id
+            summary.pay_period_id = timecard_pay_period_id
+            summary.missing_punches = missing_punches
+        else:
+            continue
+        changed += 1
+
+    # The timecards left have no missing punches anymore
+    for summary in summaries.values():
+        session.delete(summary)
+    session.flush()
+    return changed + len(summaries)
 
 
 def get_pay_period_by_start_date(session, start_date):
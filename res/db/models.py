@@ -4,11 +4,17 @@ This module contains the models for the database.
 import os
 from datetime import date, datetime
 from sqlalchemy.orm import declarative_base
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Date, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Date, DateTime, Index
+from sqlalchemy.dialects.mssql import DATETIMEOFFSET
 from sqlalchemy.orm import relationship
 
 Base = declarative_base()
 
+# Punch times are timezone aware; on SQL Server they are DATETIMEOFFSET(7) columns. pyodbc still sends
+# the bound values as strings in the datetimeoffset format, which SQL Server converts on the parameter
+# side because datetimeoffset has the higher type precedence, so the column itself is never converted
+PunchTime = DateTime(timezone=True).with_variant(DATETIMEOFFSET(7), "mssql")
+
 
 class Employee(Base):
     """
@@ -124,7 +130,11 @@ class Timecard(Base):
     Timecard model for the database.
     """
     __tablename__ = 'Timecards'
-    __table_args__ = {'schema': os.environ.get('DB_SCHEMA', 'dbo')}
+    __table_args__ = (
+        # Finds the timecards of a pay period and covers the join to the employees
+        Index('IX_Timecards_pay_period_id_associate_id', 'pay_period_id', 'associate_id'),
+        {'schema': os.environ.get('DB_SCHEMA', 'dbo')}
+    )
 
     timecard_id = Column(String(25), primary_key=True)
     associate_id = Column(String(20), ForeignKey(Employee.associate_id))
@@ -186,13 +196,19 @@ class DayEntry(Base):
     Day entry model for the database.
     """
     __tablename__ = 'DayEntries'
-    __table_args__ = {'schema': os.environ.get('DB_SCHEMA', 'dbo')}
+    __table_args__ = (
+        Index('IX_DayEntries_timecard_id', 'timecard_id'),
+        # Seek the missing punch placeholders and cover the join to the timecards
+        Index('IX_DayEntries_clock_in_time_timecard_id', 'clock_in_time', 'timecard_id'),
+        Index('IX_DayEntries_clock_out_time_timecard_id', 'clock_out_time', 'timecard_id'),
+        {'schema': os.environ.get('DB_SCHEMA', 'dbo')}
+    )
 
     entry_id = Column(String(50), primary_key=True)
     timecard_id = Column(String(25), ForeignKey(Timecard.timecard_id))
     entry_date = Column(Date)
-    clock_in_time = Column(DateTime(timezone=True))
-    clock_out_time = Column(DateTime(timezone=True))
+    clock_in_time = Column(PunchTime)
+    clock_out_time = Column(PunchTime)
 
     timecard = relationship("Timecard", back_populates="day_entries")
 
@@ -246,3 +262,66 @@ class DayEntry(Base):
                 f"entry_date={self.entry_date}, "
                 f"clock_in_time={self.clock_in_time}, "
                 f"clock_out_time={self.clock_out_time})>")
+
+
+class MissingPunchSummary(Base):
+    """
+    Missing punch summary model for the database: the number of day entries with a missing punch
+    of every timecard having at least one, maintained by db_functions.refresh_missing_punch_summary.
+    """
+    __tablename__ = 'MissingPunchSummaries'
+    __table_args__ = (
+        # Reads the timecards with missing punches of a pay period without touching the others
+        Index('IX_MissingPunchSummaries_pay_period_id_associate_id', 'pay_period_id', 'associate_id'),
+        {'schema': os.environ.get('DB_SCHEMA', 'dbo')}
+    )
+
+    timecard_id = Column(String(25), ForeignKey(Timecard.timecard_id), primary_key=True)
+    associate_id = Column(String(20), ForeignKey(Employee.associate_id), nullable=False)
+    pay_period_id = Column(Integer, ForeignKey(PayPeriod.pay_period_id), nullable=False)
+    missing_punches = Column(Integer, nullable=False)
+
+    def __init__(self,
+                 timecard_id: str,
+                 associate_id: str,
+                 pay_period_id: int,
+                 missing_punches: int):
+        """
+        Initialize the MissingPunchSummary object.
+        :param timecard_id: The timecard id.
+        :param associate_id: The associate id.
+        :param pay_period_id: The pay period id.
+        :param missing_punches: The number of day entries with a missing punch.
+        """
+        # Check that all the arguments are of the correct type
+        if not isinstance(timecard_id, str):
+            raise TypeError("timecard_id must be a string")
+        if not isinstance(associate_id, str):
+            raise TypeError("associate_id must be a string")
+        if not isinstance(pay_period_id, int):
+            raise TypeError("pay_period_id must be an integer")
+        if not isinstance(missing_punches, int):
+            raise TypeError("missing_punches must be an integer")
+
+        self.timecard_id = timecard_id
+        self.associate_id = associate_id
+        self.pay_period_id = pay_period_id
+        self.missing_punches = missing_punches
+
+    def to_dict(self):
+        """
+        Convert the object to a dictionary.
+        :return: A dictionary containing the summary data.
+        """
+        return {
+            'timecard_id': self.timecard_id,
+            'associate_id': self.associate_id,
+            'pay_period_id': self.pay_period_id,
+            'missing_punches': self.missing_punches
+        }
+
+    def __repr__(self):
+        return (f"<MissingPunchSummary(timecard_id={self.timecard_id}, "
+                f"associate_id={self.associate_id}, "
+                f"pay_period_id={self.pay_period_id}, "
+                f"missing_punches={self.missing_punches})>")
@@ -0,0 +1,63 @@
+"""
+This module contains the JSON decoding helpers used by the API connectors.
+
+orjson is used when it is installed, the standard library json module otherwise.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def loads(data):
+    """
+    Decode a JSON document.
+    :param data: The JSON document as bytes or str.
+    :return: The decoded object.
+    :raises json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def compile_projection(fields) -> dict:
+    """
+    Turn a list of dotted field paths into a nested projection tree.
+    Example:
+        compile_projection(["contact_id", "custom_fields.adp_associate_id"])
+        {'contact_id': None, 'custom_fields': {'adp_associate_id': None}}
+    :param fields: An iterable of field paths, nested keys separated by dots.
+    :return: A dictionary where None marks a kept leaf.
+    """
+    tree = {}
+    for field in fields:
+        node = tree
+        parts = field.split(".")
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+            if node is None:
+                break
+        else:
+            node[parts[-1]] = None
+    return tree
+
+
+def project(record, projection: dict):
+    """
+    Keep only the projected keys of a record.
+    Keys missing from the record are left out; a None parent (e.g. custom_fields: null) is kept as None.
+    :param record: The decoded record.
+    :param projection: A projection tree from compile_projection.
+    :return: A new, smaller dictionary.
+    """
+    if not isinstance(record, dict):
+        return record
+    result = {}
+    for key, child in projection.items():
+        if key in record:
+            value = record[key]
+            result[key] = value if child is None else project(value, child)
+    return result
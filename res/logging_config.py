@@ -0,0 +1,106 @@
+"""
+This module contains the logging setup of the script: a queue-based pipeline writing to a
+rotating log file and the console, with optional JSON output.
+"""
+import copy
+import json
+import logging
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+TEXT_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+# Number of items of a collection written to a log line by summarize()
+SAMPLE_SIZE = 20
+
+# Attributes of every LogRecord, anything else was passed with `extra=`
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Format records as one JSON object per line.
+    Values passed with `extra=` are added as top-level keys.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record.
+        :param record: The log record.
+        :return: The JSON line.
+        """
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        entry.update({key: value for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class RecordQueueHandler(QueueHandler):
+    """
+    QueueHandler passing records to the listener unformatted.
+    The base class merges the arguments and the traceback into the message and clears exc_info,
+    so the listener formatters could no longer write the exception on its own.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepare a record for queuing.
+        :param record: The log record.
+        :return: A copy of the record, keeping its args and exc_info.
+        """
+        return copy.copy(record)
+
+
+def configure_logging(level=logging.INFO, log_file: str = "time_adjustment.log", json_format: bool = False,
+                      max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5) -> QueueListener:
+    """
+    Route the root logger through a queue to a rotating file and the console.
+    Logging calls only put the record on the queue; formatting and I/O happen in the listener thread.
+    :param level: The root log level.
+    :param log_file: The path of the log file, or None to only log to the console.
+    :param json_format: If True, write JSON lines instead of text.
+    :param max_bytes: The size at which the log file is rotated.
+    :param backup_count: The number of rotated log files kept.
+    :return: The started QueueListener; stop() it before exiting to flush the queue.
+    """
+    formatter = JSONFormatter() if json_format else logging.Formatter(TEXT_FORMAT)
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.append(RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count,
+                                            encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(RecordQueueHandler(log_queue))
+    root.setLevel(level)
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def summarize(items, limit: int = SAMPLE_SIZE) -> str:
+    """
+    Describe a collection in bounded length for a log line.
+    Example:
+        summarize(["W1", "W2", "W3"], limit=2)
+        'W1, W2 (+1 more)'
+    :param items: The items to describe.
+    :param limit: The maximum number of items written.
+    :return: The first `limit` items and the number of items left out.
+    """
+    items = list(items)
+    sample = ", ".join(str(item) for item in items[:limit])
+    if len(items) > limit:
+        return f"{sample} (+{len(items) - limit} more)"
+    return sample
@@ -0,0 +1,204 @@
+"""
+This module contains the APIMetrics class, per-endpoint request metrics for the API connectors.
+"""
+import logging
+import math
+import threading
+from collections import Counter
+
+
+class EndpointStats:
+    """
+    Request statistics of a single endpoint key.
+    """
+    # Upper bounds, in seconds, of the latency histogram buckets
+    LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, math.inf)
+
+    def __init__(self):
+        """
+        Initialize empty statistics.
+        """
+        self.requests = 0
+        self.retries = 0
+        self.retry_sleep = 0.0
+        self.status_codes = Counter()
+        self.latency_histogram = [0] * len(self.LATENCY_BUCKETS)
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.circuit_state = None
+        self.circuit_opened = 0
+        self.rejected = 0
+
+    def add_request(self, status_code, latency: float, bytes_sent: int, bytes_received: int):
+        """
+        Add one request attempt to the statistics.
+        :param status_code: The HTTP status code, or None for a connection error.
+        :param latency: The request duration in seconds.
+        :param bytes_sent: The size of the request body.
+        :param bytes_received: The size of the response body.
+        """
+        self.requests += 1
+        self.status_codes["error" if status_code is None else status_code] += 1
+        for index, bound in enumerate(self.LATENCY_BUCKETS):
+            if latency <= bound:
+                self.latency_histogram[index] += 1
+                break
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.bytes_sent += bytes_sent
+        self.bytes_received += bytes_received
+
+    def to_dict(self) -> dict:
+        """
+        Convert the statistics to a dictionary.
+        :return: A dictionary of the statistics.
+        """
+        return {
+            'requests': self.requests,
+            'retries': self.retries,
+            'retry_sleep': self.retry_sleep,
+            'status_codes': dict(self.status_codes),
+            'latency_histogram': {
+                ('inf' if math.isinf(bound) else bound): count
+                for bound, count in zip(self.LATENCY_BUCKETS, self.latency_histogram)
+            },
+            'latency_avg': self.latency_total / self.requests if self.requests else 0.0,
+            'latency_max': self.latency_max,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'circuit_state': self.circuit_state,
+            'circuit_opened': self.circuit_opened,
+            'rejected': self.rejected
+        }
+
+
+class APIMetrics:
+    """
+    Thread-safe request metrics per endpoint key (the keys of APIConnector.ENDPOINTS).
+
+    Hooks registered with add_hook() receive every event as a dictionary, which lets callers
+    export the data (e.g. to a metrics backend) as it is produced:
+        {"event": "request", "endpoint": key, "status_code": ..., "latency": ...,
+         "bytes_sent": ..., "bytes_received": ...}
+        {"event": "retry", "endpoint": key, "wait": ...}
+        {"event": "circuit", "endpoint": key, "old_state": ..., "new_state": ...}
+        {"event": "rejected", "endpoint": key}
+    """
+
+    def __init__(self):
+        """
+        Initialize empty metrics.
+        """
+        self._endpoints = {}
+        self._hooks = []
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        """
+        Register a callable invoked with every metrics event.
+        :param hook: A callable taking the event dictionary.
+        """
+        self._hooks.append(hook)
+
+    def _emit(self, event: dict):
+        """
+        Send an event to the registered hooks. A failing hook never breaks the request.
+        :param event: The event dictionary.
+        """
+        for hook in self._hooks:
+            try:
+                hook(event)
+            except Exception:  # pylint: disable=broad-except
+                logging.exception("Metrics hook %r failed", hook)
+
+    def _stats(self, key: str) -> EndpointStats:
+        """
+        Get the statistics of an endpoint key, creating them on first use. Must hold the lock.
+        :param key: The endpoint key.
+        :return: The EndpointStats of the key.
+        """
+        if key not in self._endpoints:
+            self._endpoints[key] = EndpointStats()
+        return self._endpoints[key]
+
+    def record_request(self, key: str, status_code, latency: float, bytes_sent: int = 0,
+                       bytes_received: int = 0):
+        """
+        Record one request attempt.
+        :param key: The endpoint key.
+        :param status_code: The HTTP status code, or None for a connection error.
+        :param latency: The request duration in seconds.
+        :param bytes_sent: The size of the request body.
+        :param bytes_received: The size of the response body.
+        """
+        with self._lock:
+            self._stats(key).add_request(status_code, latency, bytes_sent, bytes_received)
+        self._emit({
+            'event': 'request',
+            'endpoint': key,
+            'status_code': status_code,
+            'latency': latency,
+            'bytes_sent': bytes_sent,
+            'bytes_received': bytes_received
+        })
+
+    def record_retry(self, key: str, wait: float):
+        """
+        Record a retry and the time slept before it.
+        :param key: The endpoint key.
+        :param wait: The number of seconds slept before retrying.
+        """
+        with self._lock:
+            stats = self._stats(key)
+            stats.retries += 1
+            stats.retry_sleep += wait
+        self._emit({'event': 'retry', 'endpoint': key, 'wait': wait})
+
+    def record_circuit_state(self, key: str, old_state: str, new_state: str):
+        """
+        Record a circuit breaker state change.
+        :param key: The endpoint key.
+        :param old_state: The previous circuit state.
+        :param new_state: The new circuit state.
+        """
+        with self._lock:
+            stats = self._stats(key)
+            stats.circuit_state = new_state
+            if new_state == "open":
+                stats.circuit_opened += 1
+        self._emit({'event': 'circuit', 'endpoint': key, 'old_state': old_state, 'new_state': new_state})
+
+    def record_rejected(self, key: str):
+        """
+        Record a request rejected by an open circuit without being sent.
+        :param key: The endpoint key.
+        """
+        with self._lock:
+            self._stats(key).rejected += 1
+        self._emit({'event': 'rejected', 'endpoint': key})
+
+    def summary(self) -> dict:
+        """
+        Get a snapshot of the metrics.
+        :return: A dictionary of {endpoint_key: statistics dictionary}.
+        """
+        with self._lock:
+            return {key: stats.to_dict() for key, stats in sorted(self._endpoints.items())}
+
+    def log_summary(self, logger: logging.Logger = None):
+        """
+        Log one line per endpoint with its request count, latencies, retries, statuses and bytes.
+        :param logger: The logger to use (defaults to the root logger).
+        """
+        logger = logger or logging.getLogger()
+        for key, stats in self.summary().items():
+            logger.info("API %s: %d requests, avg %.3fs, max %.3fs, %d retries (%.1fs slept), "
+                        "statuses %s, %d bytes sent, %d bytes received",
+                        key, stats['requests'], stats['latency_avg'], stats['latency_max'],
+                        stats['retries'], stats['retry_sleep'], stats['status_codes'],
+                        stats['bytes_sent'], stats['bytes_received'])
+            if stats['circuit_opened']:
+                logger.warning("API %s: circuit opened %d times, %d requests rejected, now %s",
+                               key, stats['circuit_opened'], stats['rejected'], stats['circuit_state'])
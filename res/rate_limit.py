@@ -0,0 +1,157 @@
+"""
+This module contains a client-side token bucket rate limiter for the API connectors.
+"""
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket.
+
+    Tokens are added continuously at `rate` tokens per second up to `capacity`. Callers reserve
+    tokens with reserve(), which never blocks: it returns how long the caller has to wait for its
+    reservation to become valid. The bucket may go negative, so concurrent callers queue up behind
+    each other instead of all waking up at the same time.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Initialize the TokenBucket.
+        :param rate: The number of tokens added per second.
+        :param capacity: The maximum number of tokens (defaults to rate, i.e. a one second burst,
+        and to 1 below one request per second so a single request can still be sent).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        capacity = max(1, rate) if capacity is None else capacity
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """
+        Add the tokens accumulated since the last update. Must be called with the lock held.
+        :param now: The current monotonic time.
+        """
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Reserve tokens from the bucket.
+        :param tokens: The number of tokens to take.
+        :return: The number of seconds to wait before using the reservation (0 if available now).
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    @property
+    def tokens(self) -> float:
+        """
+        The current number of tokens. Negative when callers are queued for tokens.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+class RateLimiter:
+    """
+    Rate limiter with one token bucket per endpoint key (the keys of APIConnector.ENDPOINTS).
+
+    The same instance can be shared between threads and between sync and async connectors:
+    acquire() blocks the calling thread, acquire_async() only suspends the calling coroutine.
+    """
+    DEFAULT_RATE = 8.0
+
+    def __init__(self, rate: float = DEFAULT_RATE, capacity: float = None, endpoint_limits: dict = None):
+        """
+        Initialize the RateLimiter.
+        :param rate: The default number of requests per second for each endpoint key.
+        :param capacity: The default burst size for each endpoint key (defaults to max(1, rate)).
+        :param endpoint_limits: Optional overrides as {endpoint_key: (rate, capacity)}.
+        """
+        # Validate the defaults up front instead of on the first request
+        TokenBucket(rate, capacity)
+        self.rate = rate
+        self.capacity = capacity
+        self.endpoint_limits = dict(endpoint_limits or {})
+        self._buckets = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, key: str) -> TokenBucket:
+        """
+        Get the token bucket for an endpoint key, creating it on first use.
+        :param key: The endpoint key.
+        :return: The TokenBucket for the key.
+        """
+        with self._lock:
+            if key not in self._buckets:
+                rate, capacity = self.endpoint_limits.get(key, (self.rate, self.capacity))
+                self._buckets[key] = TokenBucket(rate, capacity)
+                self._stats[key] = {"acquired": 0, "throttled": 0, "total_wait": 0.0, "max_wait": 0.0}
+            return self._buckets[key]
+
+    def _record(self, key: str, wait: float):
+        """
+        Record an acquisition in the metrics.
+        :param key: The endpoint key.
+        :param wait: The number of seconds the caller had to wait.
+        """
+        with self._lock:
+            stats = self._stats[key]
+            stats["acquired"] += 1
+            if wait > 0:
+                stats["throttled"] += 1
+                stats["total_wait"] += wait
+                stats["max_wait"] = max(stats["max_wait"], wait)
+
+    def acquire(self, key: str) -> float:
+        """
+        Take a token for the endpoint key, blocking the thread until it is available.
+        :param key: The endpoint key.
+        :return: The number of seconds waited.
+        """
+        wait = self.bucket(key).reserve()
+        self._record(key, wait)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, key: str) -> float:
+        """
+        Take a token for the endpoint key, suspending the coroutine until it is available.
+        :param key: The endpoint key.
+        :return: The number of seconds waited.
+        """
+        wait = self.bucket(key).reserve()
+        self._record(key, wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def metrics(self) -> dict:
+        """
+        Get the current token levels and wait statistics per endpoint key.
+        :return: A dictionary of {endpoint_key: {"tokens", "rate", "acquired", "throttled",
+        "total_wait", "max_wait"}}.
+        """
+        with self._lock:
+            buckets = dict(self._buckets)
+            stats = {key: dict(value) for key, value in self._stats.items()}
+        return {
+            key: dict(stats[key], tokens=bucket.tokens, rate=bucket.rate)
+            for key, bucket in buckets.items()
+        }
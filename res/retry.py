@@ -0,0 +1,139 @@
+"""
+This module contains the RetryPolicy class used by the API connectors to decide
+whether and how long to wait before retrying a failed request.
+"""
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+class RetryPolicy:
+    """
+    Retry policy with exponential backoff, jitter, Retry-After support and time budgets.
+
+    Only transient failures (connection errors and the RETRYABLE_STATUS_CODES) are retried.
+    Every other status, like 400, 401, 404 or 422, is considered fatal and fails immediately.
+
+    Requests with a non-idempotent method, like the POSTs creating lists and campaigns, may have been
+    carried out even though they failed, e.g. on a read timeout or a 500, and sending them again could
+    create a duplicate campaign. They are only retried when the server provably did not process them:
+    the connection was never established, or the response is one of NON_IDEMPOTENT_RETRYABLE_STATUS_CODES.
+
+    Two budgets bound the time spent retrying:
+    - call_budget: the maximum wall time, in seconds, a single call may take including its retries.
+    - run_budget: the maximum total time, in seconds, spent sleeping between retries across every
+      call that shares this policy instance.
+    """
+    RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+    RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    # Rejections a server sends instead of processing the request
+    NON_IDEMPOTENT_RETRYABLE_STATUS_CODES = frozenset({429, 503})
+
+    def __init__(self,
+                 max_attempts: int = 5,
+                 backoff_factor: float = 0.5,
+                 max_backoff: float = 30.0,
+                 jitter: bool = True,
+                 call_budget: Optional[float] = 60.0,
+                 run_budget: Optional[float] = 300.0):
+        """
+        Initialize the RetryPolicy.
+        :param max_attempts: The maximum number of attempts per call, including the first one.
+        :param backoff_factor: The base delay in seconds, doubled after every attempt.
+        :param max_backoff: The maximum delay in seconds between two attempts.
+        :param jitter: If True, pick a random delay between 0 and the backoff ("full jitter").
+        :param call_budget: The maximum wall time in seconds for one call, or None for no limit.
+        :param run_budget: The maximum total retry sleep in seconds for the run, or None for no limit.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be a positive integer")
+        if backoff_factor < 0 or max_backoff < 0:
+            raise ValueError("backoff_factor and max_backoff must not be negative")
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.call_budget = call_budget
+        self.run_budget = run_budget
+        self.run_slept = 0.0
+        self._lock = threading.Lock()
+
+    def is_retryable(self, status_code: Optional[int] = None, method: str = "GET",
+                     request_sent: bool = True) -> bool:
+        """
+        Check whether a failed attempt may be retried.
+        :param status_code: The HTTP status code, or None for a connection error.
+        :param method: The HTTP method of the request.
+        :param request_sent: False if the connection failed before the request could reach the server.
+        :return: True if the failure is transient and retrying cannot repeat a processed request.
+        """
+        if method.upper() not in self.IDEMPOTENT_METHODS:
+            if status_code is None:
+                return not request_sent
+            return status_code in self.NON_IDEMPOTENT_RETRYABLE_STATUS_CODES
+        return status_code is None or status_code in self.RETRYABLE_STATUS_CODES
+
+    @staticmethod
+    def parse_retry_after(value) -> Optional[float]:
+        """
+        Parse a Retry-After header value.
+        :param value: The header value, either a number of seconds or an HTTP date.
+        :return: The number of seconds to wait, or None if the value is missing or invalid.
+        """
+        if not isinstance(value, str) or not value.strip():
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Compute the backoff delay after the given attempt.
+        :param attempt: The number of the attempt that just failed (1-based).
+        :return: The delay in seconds.
+        """
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
+
+    def next_wait(self, attempt: int, elapsed: float, status_code: Optional[int] = None,
+                  retry_after=None, method: str = "GET", request_sent: bool = True) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt and how long to wait first.
+        The returned wait is charged against the run budget.
+        :param attempt: The number of the attempt that just failed (1-based).
+        :param elapsed: The wall time in seconds since the call started.
+        :param status_code: The HTTP status code, or None for a connection error.
+        :param retry_after: The Retry-After header of the response, if any.
+        :param method: The HTTP method of the request.
+        :param request_sent: False if the connection failed before the request could reach the server.
+        :return: The number of seconds to wait before retrying, or None to give up.
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(status_code, method, request_sent):
+            return None
+
+        wait = self.backoff(attempt)
+        if status_code in self.RETRY_AFTER_STATUS_CODES:
+            server_wait = self.parse_retry_after(retry_after)
+            if server_wait is not None:
+                wait = server_wait
+
+        if self.call_budget is not None and elapsed + wait > self.call_budget:
+            return None
+        with self._lock:
+            if self.run_budget is not None and self.run_slept + wait > self.run_budget:
+                return None
+            self.run_slept += wait
+        return wait
@@ -0,0 +1,137 @@
+"""
+This module contains the StageRunner class, which runs the steps of the script as a dependency
+graph so independent steps overlap.
+"""
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class StageRunner:
+    """
+    Run named stages concurrently, each one as soon as the stages it depends on are done.
+
+    A stage is called with the results of its dependencies as positional arguments, in the order
+    they were declared. The wall time of the run is the duration of its critical path. If a stage
+    raises, no new stage is started, the running ones are awaited and the exception is re-raised.
+    """
+
+    def __init__(self, max_workers: int = None):
+        """
+        Initialize the StageRunner.
+        :param max_workers: The maximum number of stages running at once (defaults to the number of stages).
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+        self.max_workers = max_workers
+        self.stages = {}
+        self.timings = {}
+
+    def add(self, name: str, func, depends=()):
+        """
+        Add a stage.
+        :param name: The unique name of the stage.
+        :param func: The callable running the stage, taking the results of the dependencies.
+        :param depends: The names of the stages that must complete first.
+        :return: The StageRunner, for chaining.
+        """
+        if name in self.stages:
+            raise ValueError(f"Stage {name} is already defined")
+        self.stages[name] = (func, tuple(depends))
+        return self
+
+    def _validate(self):
+        """
+        Check that every dependency exists and that the graph has no cycle.
+        :raises ValueError: If the graph is invalid.
+        """
+        for name, (_, depends) in self.stages.items():
+            for dependency in depends:
+                if dependency not in self.stages:
+                    raise ValueError(f"Stage {name} depends on unknown stage {dependency}")
+
+        done = set()
+        remaining = dict(self.stages)
+        while remaining:
+            ready = [name for name, (_, depends) in remaining.items() if done.issuperset(depends)]
+            if not ready:
+                raise ValueError(f"Stages have a dependency cycle: {', '.join(sorted(remaining))}")
+            for name in ready:
+                done.add(name)
+                del remaining[name]
+
+    def _run_stage(self, name: str, func, args: list, origin: float):
+        """
+        Run one stage and record its timing.
+        :param name: The stage name.
+        :param func: The stage callable.
+        :param args: The results of its dependencies.
+        :param origin: The monotonic start time of the run.
+        :return: The result of the stage.
+        """
+        start = time.monotonic()
+        logging.debug("Stage %s started", name)
+        try:
+            return func(*args)
+        finally:
+            end = time.monotonic()
+            self.timings[name] = {"start": start - origin, "end": end - origin, "duration": end - start}
+            logging.debug("Stage %s finished in %.3fs", name, end - start)
+
+    def run(self) -> dict:
+        """
+        Run every stage.
+        :return: A dictionary of {stage name: result}.
+        :raises ValueError: If the dependency graph is invalid.
+        """
+        self._validate()
+        self.timings = {}
+        results = {}
+        pending = dict(self.stages)
+        running = {}
+        error = None
+        origin = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers or max(len(self.stages), 1)) as executor:
+            while pending or running:
+                if error is None:
+                    ready = [name for name, (_, depends) in pending.items()
+                             if all(dependency in results for dependency in depends)]
+                    for name in ready:
+                        func, depends = pending.pop(name)
+                        args = [results[dependency] for dependency in depends]
+                        running[executor.submit(self._run_stage, name, func, args, origin)] = name
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:  # pylint: disable=broad-except
+                        logging.error("Stage %s failed: %s", name, e)
+                        if error is None:
+                            error = e
+
+        if error is not None:
+            raise error
+        return results
+
+    @property
+    def wall_time(self) -> float:
+        """
+        The time from the start of the run to the end of the last stage.
+        """
+        return max((timing["end"] for timing in self.timings.values()), default=0.0)
+
+    def log_timings(self, logger: logging.Logger = None):
+        """
+        Log the start, end and duration of every stage, in start order.
+        :param logger: The logger to use (defaults to the root logger).
+        """
+        logger = logger or logging.getLogger()
+        for name, timing in sorted(self.timings.items(), key=lambda item: item[1]["start"]):
+            logger.info("Stage %s: start %.3fs, end %.3fs, duration %.3fs",
+                        name, timing["start"], timing["end"], timing["duration"])
+        logger.info("Stages completed in %.3fs", self.wall_time)
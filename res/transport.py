@@ -0,0 +1,101 @@
+"""
+This module contains the TransportConfig class, the HTTP transport settings of the API connectors.
+"""
+import gzip
+import json
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class TransportConfig:
+    """
+    HTTP transport settings shared by the API connectors.
+
+    It sizes the connection pool, sets the default headers once per session, accepts compressed
+    responses, optionally gzips large request bodies and provides explicit connect and read
+    timeouts, overridable per endpoint key.
+    """
+    DEFAULT_CONNECT_TIMEOUT = 5.0
+    DEFAULT_READ_TIMEOUT = 30.0
+    DEFAULT_POOL_CONNECTIONS = 10
+
+    def __init__(self,
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = None,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: float = DEFAULT_READ_TIMEOUT,
+                 endpoint_timeouts: dict = None,
+                 compress_threshold: int = None,
+                 compress_level: int = 6):
+        """
+        Initialize the TransportConfig.
+        :param pool_connections: The number of host pools to cache.
+        :param pool_maxsize: The maximum number of connections kept per host
+        (defaults to the concurrency of the connector).
+        :param connect_timeout: The default connect timeout in seconds.
+        :param read_timeout: The default read timeout in seconds.
+        :param endpoint_timeouts: Optional overrides as {endpoint_key: (connect_timeout, read_timeout)}.
+        :param compress_threshold: Gzip request bodies of at least this many bytes, or None to never compress.
+        :param compress_level: The gzip compression level (1-9).
+        """
+        if connect_timeout <= 0 or read_timeout <= 0:
+            raise ValueError("timeouts must be positive")
+        if pool_maxsize is not None and pool_maxsize < 1:
+            raise ValueError("pool_maxsize must be a positive integer")
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.endpoint_timeouts = dict(endpoint_timeouts or {})
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+
+    def default_headers(self, token: str) -> dict:
+        """
+        Get the headers sent with every request.
+        :param token: The SlickText API token.
+        :return: A dictionary of headers.
+        """
+        return {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate"
+        }
+
+    def build_session(self, token: str, concurrency: int) -> requests.Session:
+        """
+        Create a requests session with a sized connection pool and the default headers.
+        :param token: The SlickText API token.
+        :param concurrency: The number of threads sharing the session, used as the default pool size.
+        :return: A configured requests.Session.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                              pool_maxsize=self.pool_maxsize or max(concurrency, 1))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(self.default_headers(token))
+        return session
+
+    def timeout_for(self, key: str) -> tuple:
+        """
+        Get the (connect, read) timeout for an endpoint key.
+        :param key: The endpoint key.
+        :return: A tuple of (connect_timeout, read_timeout) in seconds.
+        """
+        return self.endpoint_timeouts.get(key, (self.connect_timeout, self.read_timeout))
+
+    def encode_body(self, body):
+        """
+        Serialize a request body to compact JSON, gzipping it if it is large enough.
+        :param body: A JSON serializable body, or None.
+        :return: A tuple of (bytes or None, extra headers).
+        """
+        if body is None:
+            return None, {}
+        data = json.dumps(body, separators=(",", ":")).encode("utf-8")
+        if self.compress_threshold is not None and len(data) >= self.compress_threshold:
+            return gzip.compress(data, compresslevel=self.compress_level), {"Content-Encoding": "gzip"}
+        return data, {}
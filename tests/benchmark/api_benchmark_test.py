@@ -0,0 +1,123 @@
+"""
+Load benchmarks for the APIConnector, run against the local stand-in SlickText server.
+
+Run them with `pytest tests/benchmark -s` to see the report. Every benchmark prints its
+throughput and the p50/p99 latencies of the individual requests.
+"""
+import statistics
+import time
+import pytest
+from res.api import APIConnector
+from res.retry import RetryPolicy
+from tests.fake_slicktext import FakeSlickText
+
+CONTACT_COUNTS = [1_000, 10_000, 100_000]
+# Simulated network latency per request, in seconds
+LATENCY = 0.002
+# Every n-th request is answered with a 429
+THROTTLE_EVERY = 50
+CAMPAIGNS = 20
+
+
+def percentile(values: list, percent: float) -> float:
+    """
+    Compute a percentile with linear interpolation.
+    :param values: The measured values.
+    :param percent: The percentile, between 0 and 100.
+    :return: The percentile value.
+    """
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[int(percent) - 1]
+
+
+def report(name: str, contact_count: int, operations: int, elapsed: float, latencies: list):
+    """
+    Print one benchmark result line.
+    :param name: The benchmark name.
+    :param contact_count: The number of contacts in the fake brand.
+    :param operations: The number of items processed (contacts or campaigns).
+    :param elapsed: The wall time in seconds.
+    :param latencies: The latencies of the individual requests in seconds.
+    """
+    print(f"\n{name:<22} contacts={contact_count:>7} items={operations:>7} "
+          f"time={elapsed:7.3f}s throughput={operations / elapsed:10.1f}/s "
+          f"requests={len(latencies):>5} p50={percentile(latencies, 50) * 1000:7.2f}ms "
+          f"p99={percentile(latencies, 99) * 1000:7.2f}ms")
+
+
+class TestAPIBenchmark:
+    """
+    Throughput and latency benchmarks of the APIConnector.
+    """
+    @pytest.fixture(params=CONTACT_COUNTS, ids=lambda count: f"{count}_contacts")
+    def server(self, request):
+        """
+        Fixture to run a fake SlickText server with latency and 429 injection.
+        :return: FakeSlickText object
+        """
+        with FakeSlickText(contact_count=request.param, latency=LATENCY,
+                           throttle_every=THROTTLE_EVERY, retry_after=0) as server:
+            yield server
+
+    @pytest.fixture
+    def latencies(self) -> list:
+        """
+        Fixture to return the list collecting the request latencies.
+        """
+        return []
+
+    @pytest.fixture
+    def api_connector(self, server, latencies) -> APIConnector:
+        """
+        Fixture to return an APIConnector pointed at the fake server, recording latencies.
+        :return: APIConnector object
+        """
+        api_connector = APIConnector(token="test_token", brand_id=server.brand_id, max_workers=8,
+                                     base_url=server.base_url, fast_json=True,
+                                     retry_policy=RetryPolicy(backoff_factor=0.01))
+        api_connector.metrics.add_hook(
+            lambda event: latencies.append(event["latency"]) if event["event"] == "request" else None
+        )
+        return api_connector
+
+    def test_get_all_contacts(self, server, api_connector, latencies):
+        """
+        Benchmark downloading every contact with concurrent pagination.
+        """
+        start = time.perf_counter()
+        contacts = api_connector.get_all_contacts(concurrent=True)
+        elapsed = time.perf_counter() - start
+
+        assert len(contacts) == len(server.contacts)
+        report("get_all_contacts", len(server.contacts), len(contacts), elapsed, latencies)
+
+    def test_add_contacts_to_list(self, server, api_connector, latencies):
+        """
+        Benchmark adding every contact to a list in parallel chunks.
+        """
+        list_id = api_connector.create_contact_list("Benchmark")["contact_list_id"]
+        contact_ids = [contact["contact_id"] for contact in server.contacts]
+        latencies.clear()
+
+        start = time.perf_counter()
+        result = api_connector.add_contacts_to_list(contact_ids, list_id)
+        elapsed = time.perf_counter() - start
+
+        assert result.ok
+        assert len(server.lists[list_id]["contacts"]) == len(contact_ids)
+        report("add_contacts_to_list", len(server.contacts), len(contact_ids), elapsed, latencies)
+
+    def test_create_campaign(self, server, api_connector, latencies):
+        """
+        Benchmark creating campaigns for an existing list.
+        """
+        list_id = api_connector.create_contact_list("Benchmark")["contact_list_id"]
+        latencies.clear()
+
+        start = time.perf_counter()
+        for i in range(CAMPAIGNS):
+            assert api_connector.create_campaign(f"Benchmark {i}", "Hello", list_id)
+        elapsed = time.perf_counter() - start
+
+        report("create_campaign", len(server.contacts), CAMPAIGNS, elapsed, latencies)
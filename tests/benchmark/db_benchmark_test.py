@@ -0,0 +1,76 @@
+"""
+Round-trip benchmarks of the missing punch queries, run against an in-memory SQLite database.
+
+Run them with `pytest tests/benchmark -s` to see the report. Every benchmark prints the number
+of statements sent to the database and the wall time of the previous, timecard based lookups and
+of the single query replacing them.
+"""
+import time
+import pytest
+from res.db.db_functions import (
+    get_employees_with_missing_punches_by_pay_period,
+    get_time_cards_with_missing_punches,
+    get_worker_ids_with_missing_punches_by_pay_period
+)
+from res.db.models import Employee
+from tests.sqlite_db import SQLiteDatabase
+
+EMPLOYEE_COUNTS = [100, 1_000, 5_000]
+
+
+def get_worker_ids_through_timecards(session, pay_period_id):
+    """
+    The previous implementation: load the timecards, then each timecard's employee.
+    :param session: The database session.
+    :param pay_period_id: The ID of the pay period.
+    :return: A set of worker IDs.
+    """
+    time_cards = get_time_cards_with_missing_punches(session, pay_period_id)
+    return {timecard.employee.worker_id for timecard in time_cards}
+
+
+def get_employees_through_associate_ids(session, pay_period_id):
+    """
+    The previous implementation: load the timecards, then the employees with an IN list of their IDs.
+    :param session: The database session.
+    :param pay_period_id: The ID of the pay period.
+    :return: A list of employees.
+    """
+    time_cards = get_time_cards_with_missing_punches(session, pay_period_id)
+    employee_ids = {timecard.associate_id for timecard in time_cards}
+    return session.query(Employee).filter(Employee.associate_id.in_(employee_ids)).all()
+
+
+class TestMissingPunchBenchmark:
+    """
+    Round-trip and latency benchmarks of the worker ID and employee lookups.
+    """
+    @pytest.fixture(params=EMPLOYEE_COUNTS, ids=lambda count: f"{count}_employees")
+    def database(self, request):
+        """
+        Fixture to return a populated in-memory database and its pay period.
+        :return: A tuple of the SQLiteDatabase object and the pay period
+        """
+        database = SQLiteDatabase()
+        return database, database.populate(employees=request.param, missing_every=3)
+
+    @pytest.mark.parametrize("lookup", [get_worker_ids_through_timecards,
+                                        get_worker_ids_with_missing_punches_by_pay_period,
+                                        get_employees_through_associate_ids,
+                                        get_employees_with_missing_punches_by_pay_period],
+                             ids=["worker_ids_timecards", "worker_ids_set_based",
+                                  "employees_in_list", "employees_exists"])
+    def test_lookup(self, database, lookup):
+        """
+        Benchmark one lookup and count its database round trips.
+        """
+        database, pay_period = database
+        with database.session() as session:
+            with database.count_round_trips() as statements:
+                start = time.perf_counter()
+                results = lookup(session, pay_period.pay_period_id)
+                elapsed = time.perf_counter() - start
+
+        assert results
+        print(f"\n{lookup.__name__:<50} results={len(results):>5} "
+              f"round_trips={len(statements):>5} time={elapsed * 1000:8.2f}ms")
@@ -0,0 +1,270 @@
+"""
+This module contains a local stand-in for the SlickText API used by the tests.
+
+It implements the routes listed in APIConnector.ENDPOINTS on top of the standard library
+HTTP server, so connectors can be exercised end to end without network access.
+"""
+import gzip
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class FakeSlickText:
+    """
+    A fake SlickText API server running in a background thread.
+
+    Usage:
+        with FakeSlickText(contact_count=1000) as server:
+            api_connector = APIConnector(token="token", brand_id="1", base_url=server.base_url)
+
+    Latency and rate limiting can be simulated: every request sleeps `latency` seconds, and every
+    `throttle_every`-th request is answered with a 429 and a Retry-After header.
+    Contacts are filtered by the custom_fields[<name>]=<value>,<value> query parameters, unless
+    `custom_field_filter` is False to simulate an API ignoring them.
+    """
+    MAX_PAGE_LIMIT = 250
+    # (method, brand route pattern, handler name); the handlers take the query, the body and the
+    # groups of the pattern, and return (status code, payload)
+    ROUTES = [
+        ("GET", r"/contacts", "_get_contacts"),
+        ("GET", r"/contacts/(\d+)", "_get_contact"),
+        ("POST", r"/lists", "_post_list"),
+        ("GET", r"/lists", "_get_lists"),
+        ("GET", r"/lists/(\d+)/contacts", "_get_list_contacts"),
+        ("POST", r"/lists/contacts", "_post_list_contacts"),
+        ("POST", r"/campaigns", "_post_campaign"),
+        ("GET", r"/campaigns", "_get_campaigns"),
+        ("GET", r"/custom-fields/([^/]+)", "_get_custom_field"),
+        ("GET", r"", "_get_brand"),
+    ]
+
+    def __init__(self, contact_count: int = 0, brand_id: str = "1", latency: float = 0.0,
+                 throttle_every: int = 0, retry_after: int = 0, custom_field_filter: bool = True):
+        """
+        Initialize the fake server.
+        :param contact_count: The number of contacts in the fake brand.
+        :param brand_id: The ID of the fake brand.
+        :param latency: The number of seconds each request takes.
+        :param throttle_every: Answer every n-th request with a 429 (0 to never throttle).
+        :param retry_after: The Retry-After value, in seconds, sent with a 429.
+        :param custom_field_filter: If False, ignore the custom field filters of contact queries.
+        """
+        self.brand_id = brand_id
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.custom_field_filter = custom_field_filter
+        self.throttled = 0
+        self.contacts = [self.make_contact(i) for i in range(1, contact_count + 1)]
+        self.lists = {}
+        self.campaigns = {}
+        self.requests = []
+        self.lock = threading.Lock()
+        self.httpd = None
+        self.thread = None
+
+    @staticmethod
+    def make_contact(contact_id: int) -> dict:
+        """
+        Build a contact in the shape returned by the SlickText API.
+        :param contact_id: The contact ID.
+        :return: A contact dictionary.
+        """
+        return {
+            "contact_id": contact_id,
+            "first_name": f"First{contact_id}",
+            "last_name": f"Last{contact_id}",
+            "mobile_number": f"+1555{contact_id:07d}",
+            "custom_fields": {"adp_associate_id": f"W{contact_id:06d}"}
+        }
+
+    @property
+    def base_url(self) -> str:
+        """
+        The base URL to pass to a connector.
+        """
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        """
+        Start serving requests in a background thread.
+        """
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05},
+                                       daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop the server and wait for the background thread to exit.
+        """
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.thread.join()
+            self.httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def handle(self, method: str, path: str, query: dict, body):
+        """
+        Route a request to the matching fake endpoint.
+        :param method: The HTTP method.
+        :param path: The request path, without the query string.
+        :param query: The parsed query string.
+        :param body: The decoded JSON body or None.
+        :return: A tuple of (status code, response payload).
+        """
+        with self.lock:
+            self.requests.append({"method": method, "path": path, "query": query, "body": body})
+            throttle = self.throttle_every and len(self.requests) % self.throttle_every == 0
+            if throttle:
+                self.throttled += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+        if throttle:
+            return 429, {"message": "Too Many Requests"}
+
+        if path == "/v1/brands":
+            return 200, {"_account_id": 1, "data": [{"brand_id": self.brand_id}]}
+
+        match = re.fullmatch(r"/v1/brands/([^/]+)(/.*)?", path)
+        if not match or match.group(1) != self.brand_id:
+            return 404, {"message": "Brand not found"}
+        route = match.group(2) or ""
+
+        for route_method, pattern, handler in self.ROUTES:
+            route_match = re.fullmatch(pattern, route)
+            if route_match and method == route_method:
+                return getattr(self, handler)(query, body, *route_match.groups())
+        return 404, {"message": "Not found"}
+
+    def _get_contacts(self, query: dict, body) -> tuple:
+        return 200, self._contacts_page(query)
+
+    def _get_contact(self, query: dict, body, contact_id: str) -> tuple:
+        contact_id = int(contact_id)
+        if 1 <= contact_id <= len(self.contacts):
+            return 200, self.contacts[contact_id - 1]
+        return 404, {"message": "Contact not found"}
+
+    def _post_list(self, query: dict, body) -> tuple:
+        return 201, self._create_list(body)
+
+    def _get_lists(self, query: dict, body) -> tuple:
+        lists = [{"contact_list_id": item["contact_list_id"], "name": item["name"]}
+                 for item in self.lists.values()]
+        return 200, self._page(lists, query)
+
+    def _get_list_contacts(self, query: dict, body, list_id: str) -> tuple:
+        contact_list = self.lists.get(int(list_id))
+        if contact_list is None:
+            return 404, {"message": "List not found"}
+        return 200, self._page([{"contact_id": contact_id}
+                                for contact_id in sorted(contact_list["contacts"])], query)
+
+    def _post_list_contacts(self, query: dict, body) -> tuple:
+        return 201, self._add_contacts_to_lists(body)
+
+    def _post_campaign(self, query: dict, body) -> tuple:
+        return 201, self._create_campaign(body)
+
+    def _get_campaigns(self, query: dict, body) -> tuple:
+        return 200, self._page(list(self.campaigns.values()), query)
+
+    def _get_custom_field(self, query: dict, body, field_id: str) -> tuple:
+        return 200, {"custom_field_id": field_id, "name": "adp_associate_id"}
+
+    def _get_brand(self, query: dict, body) -> tuple:
+        return 200, {"brand_id": self.brand_id}
+
+    def _page(self, items: list, query: dict) -> dict:
+        limit = min(int(query.get("limit", [self.MAX_PAGE_LIMIT])[0]), self.MAX_PAGE_LIMIT)
+        offset = int(query.get("offset", [0])[0])
+        return {
+            "data": items[offset:offset + limit],
+            "pagingData": {
+                "limit": limit,
+                "offset": offset,
+                "total": len(items),
+                "hasMore": offset + limit < len(items)
+            }
+        }
+
+    def _contacts_page(self, query: dict) -> dict:
+        contacts = self.contacts
+        if self.custom_field_filter:
+            for key, value in query.items():
+                field = re.fullmatch(r"custom_fields\[(.+)\]", key)
+                if field:
+                    wanted = set(value[0].split(","))
+                    contacts = [contact for contact in contacts
+                                if (contact.get("custom_fields") or {}).get(field.group(1)) in wanted]
+        return self._page(contacts, query)
+
+    def _create_list(self, body: dict) -> dict:
+        with self.lock:
+            list_id = len(self.lists) + 1
+            self.lists[list_id] = {"contact_list_id": list_id, "name": body.get("name"), "contacts": set()}
+        return {"contact_list_id": list_id, "name": body.get("name")}
+
+    def _add_contacts_to_lists(self, body: list) -> dict:
+        with self.lock:
+            for entry in body:
+                for list_id in entry.get("lists", []):
+                    self.lists[list_id]["contacts"].add(entry["contact_id"])
+        return {"data": body}
+
+    def _create_campaign(self, body: dict) -> dict:
+        with self.lock:
+            campaign_id = len(self.campaigns) + 1
+            self.campaigns[campaign_id] = dict(body, campaign_id=campaign_id)
+        return {"campaign_id": campaign_id, "name": body.get("name")}
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Request handler delegating to FakeSlickText.handle.
+            """
+            protocol_version = "HTTP/1.1"
+            # Avoid the Nagle / delayed ACK stall on small keep-alive responses
+            disable_nagle_algorithm = True
+
+            def _dispatch(self):
+                parsed = urlparse(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                raw_body = self.rfile.read(length) if length else b""
+                if self.headers.get("Content-Encoding") == "gzip":
+                    raw_body = gzip.decompress(raw_body)
+                body = json.loads(raw_body) if raw_body else None
+                status, payload = server.handle(self.command, parsed.path, parse_qs(parsed.query), body)
+                content = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                if status == 429:
+                    self.send_header("Retry-After", str(server.retry_after))
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = _dispatch
+            do_POST = _dispatch
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                """Silence the default request logging."""
+
+        return Handler
@@ -0,0 +1,102 @@
+"""
+In-memory SQLite stand-in for the time tracking database, used by the unit tests and benchmarks.
+
+The models live in a schema (dbo by default), which SQLite emulates with an attached in-memory
+database of the same name.
+"""
+import contextlib
+from datetime import date, datetime, timedelta, timezone
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from res.db.db_functions import MISSING_PUNCH_TIMES
+from res.db.models import Base, DayEntry, Employee, PayPeriod, Timecard
+
+
+class SQLiteDatabase:
+    """
+    An in-memory database with the tables of res.db.models.
+    """
+
+    def __init__(self):
+        """
+        Create the engine, attach the schema and create the tables.
+        """
+        self.engine = create_engine("sqlite://", poolclass=StaticPool,
+                                    connect_args={"check_same_thread": False})
+        schema = Employee.__table__.schema
+
+        @event.listens_for(self.engine, "connect")
+        def attach_schema(connection, _):
+            if schema:
+                connection.execute(f"ATTACH DATABASE ':memory:' AS {schema}")
+
+        Base.metadata.create_all(self.engine)
+        self.statements = []
+        self.parameters = []
+        event.listen(self.engine, "before_cursor_execute", self._record_statement)
+
+    def _record_statement(self, conn, cursor, statement, parameters, context, executemany):
+        """
+        Record every statement sent to the database.
+        """
+        self.statements.append(statement)
+        self.parameters.append(parameters)
+
+    def session(self, **kwargs) -> Session:
+        """
+        Create a session bound to the database.
+        :param kwargs: Additional Session arguments.
+        :return: A new SQLAlchemy session
+        """
+        return Session(self.engine, **kwargs)
+
+    @contextlib.contextmanager
+    def count_round_trips(self):
+        """
+        Count the statements sent to the database inside the block.
+        Their parameters are in self.parameters, at the same positions as in self.statements.
+        :return: A list collecting the statements, filled when the block exits.
+        """
+        statements = []
+        start = len(self.statements)
+        yield statements
+        statements.extend(self.statements[start:])
+
+    def query_plan(self, statement: str, parameters=()) -> list:
+        """
+        Ask SQLite how it runs a statement, e.g. one collected by count_round_trips().
+        :param statement: The SQL statement.
+        :param parameters: Its parameters, as sent to the database.
+        :return: The detail of every EXPLAIN QUERY PLAN row, e.g. "SEARCH dbo.Timecards USING INDEX ...".
+        """
+        with self.engine.connect() as connection:
+            rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", tuple(parameters)).fetchall()
+        return [row[-1] for row in rows]
+
+    def populate(self, employees: int, missing_every: int = 3, entries_per_timecard: int = 5) -> PayPeriod:
+        """
+        Add a pay period with one timecard per employee.
+        Every `missing_every`-th employee has a missing clock out punch on one day.
+        :param employees: The number of employees.
+        :param missing_every: The interval of employees with a missing punch.
+        :param entries_per_timecard: The number of day entries per timecard.
+        :return: The pay period.
+        """
+        with self.session(expire_on_commit=False) as session:
+            pay_period = PayPeriod(date(2024, 1, 1), date(2024, 1, 7))
+            session.add(pay_period)
+            session.flush()
+            for i in range(employees):
+                associate_id = f"A{i:06d}"
+                session.add(Employee(associate_id, f"W{i:06d}", f"First{i}", f"Last{i}"))
+                timecard_id = f"T{pay_period.pay_period_id}-{i:06d}"
+                session.add(Timecard(timecard_id, associate_id, pay_period.pay_period_id, i % missing_every == 0))
+                for day in range(entries_per_timecard):
+                    clock_in = datetime(2024, 1, 1 + day, 8, tzinfo=timezone.utc)
+                    clock_out = clock_in + timedelta(hours=8)
+                    if i % missing_every == 0 and day == 2:
+                        clock_out = MISSING_PUNCH_TIMES[i % 2]
+                    session.add(DayEntry(f"{timecard_id}-{day}", timecard_id, clock_in.date(), clock_in, clock_out))
+            session.commit()
+        return pay_period
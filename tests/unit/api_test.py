@@ -1,10 +1,14 @@
 """
 Unit tests for the APIConnector class.
 """
+import json
+import time
 from unittest.mock import MagicMock
 import requests
 import pytest
-from res.api import APIConnector
+from res.api import APIConnector, IncompleteDownloadError
+from res.retry import RetryPolicy
+from tests.fake_slicktext import FakeSlickText
 
 
 class TestAPIConnectorUnit:
@@ -111,7 +115,399 @@ class TestAPIConnectorUnit:
         # Call get_brands(), which internally calls __make_request()
         result = api_connector.get_brands()
 
-        # Should retry 5 times
-        assert api_connector.session.request.call_count == APIConnector.MAX_RETRIES
-        # Should return None after all retries fail
+        # A 404 will never succeed, so it should not be retried
+        assert api_connector.session.request.call_count == 1
         assert result is None
+
+    def test_retry_after_is_honoured(self, monkeypatch, api_connector):
+        """
+        Test that a 429 response waits for the Retry-After delay before retrying.
+        :param monkeypatch: The monkeypatch fixture
+        :param api_connector: The APIConnector object
+        """
+        throttled = MagicMock(status_code=429, text="Too Many Requests", headers={"Retry-After": "2"})
+        success = MagicMock(status_code=200, headers={})
+        success.json.return_value = {"data": []}
+
+        mock_request = MagicMock(side_effect=[throttled, success])
+        monkeypatch.setattr(api_connector.session, "request", mock_request)
+        sleeps = []
+        monkeypatch.setattr("time.sleep", sleeps.append)
+
+        result = api_connector.get_brands()
+
+        assert result == {"data": []}
+        assert mock_request.call_count == 2
+        assert sleeps == [2.0]
+
+    def test_no_sleep_after_last_attempt(self, monkeypatch, api_connector):
+        """
+        Test that the connector does not sleep after the final failed attempt.
+        :param monkeypatch: The monkeypatch fixture
+        :param api_connector: The APIConnector object
+        """
+        mock_request = MagicMock(return_value=MagicMock(status_code=503, text="Unavailable", headers={}))
+        monkeypatch.setattr(api_connector.session, "request", mock_request)
+        sleeps = []
+        monkeypatch.setattr("time.sleep", sleeps.append)
+
+        assert api_connector.get_brands() is None
+        assert mock_request.call_count == APIConnector.MAX_RETRIES
+        assert len(sleeps) == APIConnector.MAX_RETRIES - 1
+
+    @staticmethod
+    def _paged_contacts(total: int):
+        """
+        Build a fake get_contacts implementation returning `total` contacts in pages.
+        :param total: The total number of contacts.
+        :return: A function with the same signature as APIConnector.get_contacts
+        """
+        def fake_get_contacts(limit=None, offset=None, **_filters):
+            data = [{"contact_id": i} for i in range(offset, min(offset + limit, total))]
+            return {
+                "data": data,
+                "pagingData": {"hasMore": offset + limit < total, "total": total}
+            }
+        return fake_get_contacts
+
+    def test_get_all_contacts_concurrent_keeps_order(self, monkeypatch, api_connector):
+        """
+        Test that concurrent pagination returns every contact in API order.
+        """
+        fake = MagicMock(side_effect=self._paged_contacts(1000))
+        monkeypatch.setattr(api_connector, "get_contacts", fake)
+
+        contacts = api_connector.get_all_contacts(concurrent=True, max_workers=3)
+
+        assert [contact["contact_id"] for contact in contacts] == list(range(1000))
+        assert fake.call_count == 4
+        offsets = sorted(call.kwargs["offset"] for call in fake.call_args_list)
+        assert offsets == [0, 250, 500, 750]
+
+    def test_get_all_contacts_concurrent_matches_sequential(self, monkeypatch, api_connector):
+        """
+        Test that concurrent and sequential pagination return the same contacts.
+        """
+        monkeypatch.setattr(api_connector, "get_contacts", self._paged_contacts(600))
+
+        assert (api_connector.get_all_contacts(concurrent=True) ==
+                api_connector.get_all_contacts())
+
+    def test_get_all_contacts_concurrent_without_total(self, monkeypatch, api_connector):
+        """
+        Test that concurrent pagination falls back to sequential paging without a total count.
+        """
+        paged = self._paged_contacts(600)
+
+        def fake_get_contacts(limit=None, offset=None, **filters):
+            batch = paged(limit=limit, offset=offset, **filters)
+            del batch["pagingData"]["total"]
+            return batch
+
+        fake = MagicMock(side_effect=fake_get_contacts)
+        monkeypatch.setattr(api_connector, "get_contacts", fake)
+
+        contacts = api_connector.get_all_contacts(concurrent=True)
+
+        assert len(contacts) == 600
+        assert fake.call_count == 3
+
+    @pytest.mark.parametrize("concurrent", [False, True])
+    @pytest.mark.parametrize("failed_offset", [0, 250])
+    def test_get_all_contacts_strict_raises_on_failed_page(self, monkeypatch, api_connector, concurrent,
+                                                           failed_offset):
+        """
+        Test that a strict download raises instead of returning the contacts fetched before a failed page.
+        """
+        paged = self._paged_contacts(600)
+
+        def fake_get_contacts(limit=None, offset=None, **filters):
+            return None if offset == failed_offset else paged(limit=limit, offset=offset, **filters)
+
+        monkeypatch.setattr(api_connector, "get_contacts", fake_get_contacts)
+
+        assert len(api_connector.get_all_contacts(concurrent=concurrent)) == failed_offset
+        with pytest.raises(IncompleteDownloadError) as exc_info:
+            api_connector.get_all_contacts(concurrent=concurrent, strict=True)
+        assert exc_info.value.offset == failed_offset
+
+    def test_get_all_contacts_strict_checks_total(self, monkeypatch, api_connector):
+        """
+        Test that a strict concurrent download raises when fewer contacts than the total are returned.
+        """
+        paged = self._paged_contacts(600)
+
+        def fake_get_contacts(limit=None, offset=None, **filters):
+            batch = paged(limit=limit, offset=offset, **filters)
+            if offset == 250:
+                batch["data"] = batch["data"][:100]
+            return batch
+
+        monkeypatch.setattr(api_connector, "get_contacts", fake_get_contacts)
+
+        with pytest.raises(IncompleteDownloadError) as exc_info:
+            api_connector.get_all_contacts(concurrent=True, strict=True)
+        assert (exc_info.value.fetched, exc_info.value.total) == (450, 600)
+
+    @pytest.mark.parametrize("method, error, expected_attempts", [
+        ("GET", requests.exceptions.ReadTimeout("read timed out"), 3),
+        ("POST", requests.exceptions.ReadTimeout("read timed out"), 1),
+        ("POST", requests.exceptions.ConnectionError("connection aborted"), 1),
+        ("POST", requests.exceptions.ConnectTimeout("connect timed out"), 3),
+    ])
+    def test_retries_depend_on_method(self, monkeypatch, method, error, expected_attempts):
+        """
+        Test that a POST is only retried when the request cannot have reached the server.
+        """
+        api_connector = APIConnector(token="test_token", brand_id="1",
+                                     retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0))
+        mock_request = MagicMock(side_effect=error)
+        monkeypatch.setattr(api_connector.session, "request", mock_request)
+
+        if method == "GET":
+            assert api_connector.get_contacts() is None
+        else:
+            assert api_connector.create_campaign("Reminder", "Message", 10) is None
+
+        assert mock_request.call_count == expected_attempts
+
+    def test_post_retried_on_refused_connection(self):
+        """
+        Test that a POST to a server refusing connections is retried, since it never reached it.
+        """
+        api_connector = APIConnector(token="test_token", brand_id="1", base_url="http://127.0.0.1:1",
+                                     retry_policy=RetryPolicy(max_attempts=2, backoff_factor=0))
+
+        assert api_connector.create_contact_list("Reminder") is None
+        assert api_connector.metrics.summary()["create_list"]["requests"] == 2
+
+    def test_invalid_max_workers(self):
+        """
+        Test that a non-positive worker count is rejected.
+        """
+        with pytest.raises(ValueError):
+            APIConnector(token="test_token", max_workers=0)
+
+    def test_iter_contacts_is_lazy(self, monkeypatch, api_connector):
+        """
+        Test that iter_contacts only requests pages as they are consumed.
+        """
+        fake = MagicMock(side_effect=self._paged_contacts(1000))
+        monkeypatch.setattr(api_connector, "get_contacts", fake)
+
+        contacts = api_connector.iter_contacts()
+        first_page = [next(contacts) for _ in range(250)]
+
+        assert [contact["contact_id"] for contact in first_page] == list(range(250))
+        assert fake.call_count == 1
+        contacts.close()
+        assert fake.call_count == 1
+
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_iter_contacts_yields_everything(self, monkeypatch, api_connector, prefetch):
+        """
+        Test that iter_contacts yields every contact in order, with and without prefetching.
+        """
+        fake = MagicMock(side_effect=self._paged_contacts(600))
+        monkeypatch.setattr(api_connector, "get_contacts", fake)
+
+        contacts = list(api_connector.iter_contacts(prefetch=prefetch, status="active"))
+
+        assert [contact["contact_id"] for contact in contacts] == list(range(600))
+        assert fake.call_count == 3
+        assert all(call.kwargs["status"] == "active" for call in fake.call_args_list)
+
+    def test_iter_contacts_prefetches_next_page(self, monkeypatch, api_connector):
+        """
+        Test that prefetching requests the next page before the current one is consumed.
+        """
+        fake = MagicMock(side_effect=self._paged_contacts(600))
+        monkeypatch.setattr(api_connector, "get_contacts", fake)
+
+        contacts = api_connector.iter_contacts(prefetch=True)
+        next(contacts)
+        # The second page is requested in the background while the first is consumed
+        for _ in range(100):
+            if fake.call_count == 2:
+                break
+            time.sleep(0.01)
+        assert fake.call_count == 2
+        contacts.close()
+
+    def test_find_contacts_by_custom_field(self, monkeypatch, api_connector):
+        """
+        Test that custom field lookups are chunked and keep only matching contacts.
+        """
+        def fake_get_contacts(limit=None, offset=None, **filters):
+            values = filters["custom_fields[adp_associate_id]"].split(",")
+            data = [{"contact_id": int(value[1:]), "custom_fields": {"adp_associate_id": value}}
+                    for value in values if value != "W5"]
+            return {"data": data, "pagingData": {"hasMore": False, "total": len(data)}}
+
+        fake = MagicMock(side_effect=fake_get_contacts)
+        monkeypatch.setattr(api_connector, "get_contacts", fake)
+        worker_ids = {f"W{i}" for i in range(1, 8)}
+
+        contacts = api_connector.find_contacts_by_custom_field("adp_associate_id", worker_ids,
+                                                               chunk_size=3, max_workers=2)
+
+        assert sorted(contact["contact_id"] for contact in contacts) == [1, 2, 3, 4, 6, 7]
+        assert fake.call_count == 3
+        chunks = sorted(call.kwargs["custom_fields[adp_associate_id]"] for call in fake.call_args_list)
+        assert chunks == ["W1,W2,W3", "W4,W5,W6", "W7"]
+
+    def test_find_contacts_by_custom_field_unfiltered(self, monkeypatch, api_connector):
+        """
+        Test that a custom field filter ignored by the API is detected on the first chunk and
+        the contacts are matched in a single pass instead of paging every contact for each chunk.
+        """
+        all_contacts = [{"contact_id": i, "custom_fields": {"adp_associate_id": f"W{i}"}} for i in range(1, 601)]
+
+        def fake_get_contacts(limit=None, offset=None, **filters):
+            return {"data": all_contacts[offset:offset + limit],
+                    "pagingData": {"hasMore": offset + limit < len(all_contacts), "total": len(all_contacts)}}
+
+        fake = MagicMock(side_effect=fake_get_contacts)
+        monkeypatch.setattr(api_connector, "get_contacts", fake)
+        worker_ids = {"W1", "W10", "W100", "W500", "W599"}
+
+        contacts = api_connector.find_contacts_by_custom_field("adp_associate_id", worker_ids, chunk_size=2)
+
+        assert sorted(contact["contact_id"] for contact in contacts) == [1, 10, 100, 500, 599]
+        # One pass over the three pages instead of three pages per chunk
+        assert fake.call_count == 3
+        assert [call.kwargs["offset"] for call in fake.call_args_list] == [0, 250, 500]
+        assert "custom_fields[adp_associate_id]" not in fake.call_args_list[-1].kwargs
+
+    def test_find_contacts_by_custom_field_unsupported_values(self, monkeypatch, api_connector):
+        """
+        Test that an empty first chunk is treated as an unsupported filter and the contacts are
+        matched in one pass instead of quietly matching nothing.
+        """
+        all_contacts = [{"contact_id": i, "custom_fields": {"adp_associate_id": f"W{i}"}} for i in range(1, 301)]
+
+        def fake_get_contacts(limit=None, offset=None, **filters):
+            # The API does not understand comma separated values and matches nothing
+            data = [] if "custom_fields[adp_associate_id]" in filters else all_contacts[offset:offset + limit]
+            total = len(all_contacts) if data else 0
+            return {"data": data, "pagingData": {"hasMore": offset + limit < total, "total": total}}
+
+        fake = MagicMock(side_effect=fake_get_contacts)
+        monkeypatch.setattr(api_connector, "get_contacts", fake)
+
+        contacts = api_connector.find_contacts_by_custom_field("adp_associate_id", {"W2", "W280", "W999"},
+                                                               chunk_size=2)
+
+        assert sorted(contact["contact_id"] for contact in contacts) == [2, 280]
+        # The empty first chunk, then the two pages of every contact
+        assert [call.kwargs["offset"] for call in fake.call_args_list] == [0, 0, 250]
+
+    def test_find_contacts_by_custom_field_without_values(self, monkeypatch, api_connector):
+        """
+        Test that an empty lookup does not send any request.
+        """
+        fake = MagicMock()
+        monkeypatch.setattr(api_connector, "get_contacts", fake)
+
+        assert not api_connector.find_contacts_by_custom_field("adp_associate_id", set())
+        fake.assert_not_called()
+
+    def test_add_contacts_to_list_in_chunks(self, monkeypatch):
+        """
+        Test that contacts are uploaded in chunks and only failed chunks are reported as failed.
+        """
+        api_connector = APIConnector(token="test_token", brand_id="1")
+        monkeypatch.setattr("time.sleep", lambda x: None)
+
+        def fake_request(method=None, url=None, headers=None, params=None, data=None, timeout=None):
+            body = json.loads(data)
+            response = MagicMock()
+            # The chunk containing contact 4 always fails with a server error
+            response.status_code = 500 if any(entry["contact_id"] == 4 for entry in body) else 201
+            response.json.return_value = {"data": body}
+            response.headers = {}
+            return response
+
+        mock_request = MagicMock(side_effect=fake_request)
+        monkeypatch.setattr(api_connector.session, "request", mock_request)
+
+        report = api_connector.add_contacts_to_list([1, 2, 3, 4, 5, 6, 7], 10, chunk_size=3)
+
+        assert not report.ok
+        assert sorted(report.succeeded) == [1, 2, 3, 7]
+        assert sorted(report.failed) == [4, 5, 6]
+        assert report.to_dict()[4] is False
+        assert report.to_dict()[7] is True
+        # Two successful chunks plus the failing chunk, a POST not retried on a server error
+        assert mock_request.call_count == 3
+        assert all(len(json.loads(call.kwargs["data"])) <= 3 for call in mock_request.call_args_list)
+
+    def test_add_contacts_to_list_invalid_chunk_size(self):
+        """
+        Test that a non-positive chunk size is rejected.
+        """
+        api_connector = APIConnector(token="test_token", brand_id="1")
+        with pytest.raises(ValueError):
+            api_connector.add_contacts_to_list([1], 10, chunk_size=0)
+
+    def test_recovers_from_throttling(self):
+        """
+        Test that throttled requests are retried against the local stand-in server.
+        """
+        with FakeSlickText(contact_count=1000, throttle_every=2, retry_after=0) as server:
+            api_connector = APIConnector(token="test_token", brand_id=server.brand_id,
+                                         base_url=server.base_url)
+            contacts = api_connector.get_all_contacts(concurrent=True)
+
+        assert len(contacts) == 1000
+        assert server.throttled > 0
+        assert api_connector.metrics.summary()["contacts"]["status_codes"][429] == server.throttled
+
+    def test_find_contact_list_and_campaign_by_name(self):
+        """
+        Test that existing lists, their members and campaigns are found by name.
+        """
+        with FakeSlickText(contact_count=10) as server:
+            api_connector = APIConnector(token="test_token", brand_id=server.brand_id,
+                                         base_url=server.base_url)
+            list_id = api_connector.create_contact_list("Reminder")["contact_list_id"]
+            api_connector.add_contacts_to_list([1, 2, 3], list_id)
+            api_connector.create_campaign("Reminder", "Hello", list_id)
+
+            assert api_connector.find_contact_list_by_name("Reminder")["contact_list_id"] == list_id
+            assert api_connector.find_contact_list_by_name("Other") is None
+            assert api_connector.get_list_contact_ids(list_id) == {1, 2, 3}
+            assert api_connector.find_campaign_by_name("Reminder")["name"] == "Reminder"
+            assert api_connector.find_campaign_by_name("Other") is None
+
+    @pytest.mark.parametrize("handler, lookup", [
+        ("_get_lists", lambda api_connector: api_connector.find_contact_list_by_name("Reminder")),
+        ("_get_list_contacts", lambda api_connector: api_connector.get_list_contact_ids(1)),
+        ("_get_campaigns", lambda api_connector: api_connector.find_campaign_by_name("Reminder"))
+    ])
+    def test_lookups_raise_on_failed_page(self, handler, lookup):
+        """
+        Test that a failed page of a list or campaign lookup raises instead of reading as not found.
+        """
+        with FakeSlickText(contact_count=10) as server:
+            api_connector = APIConnector(token="test_token", brand_id=server.brand_id,
+                                         base_url=server.base_url, retry_policy=RetryPolicy(max_attempts=1))
+            list_id = api_connector.create_contact_list("Reminder")["contact_list_id"]
+            api_connector.create_campaign("Reminder", "Hello", list_id)
+            setattr(server, handler, lambda query, body, *groups: (500, {"message": "Internal Server Error"}))
+
+            with pytest.raises(IncompleteDownloadError):
+                lookup(api_connector)
+
+    def test_find_contact_list_by_name_pages_through_lists(self):
+        """
+        Test that the list lookup follows pagination.
+        """
+        with FakeSlickText() as server:
+            api_connector = APIConnector(token="test_token", brand_id=server.brand_id,
+                                         base_url=server.base_url)
+            api_connector.PAGE_LIMIT = 2
+            for i in range(5):
+                api_connector.create_contact_list(f"List {i}")
+
+            assert api_connector.find_contact_list_by_name("List 4")["name"] == "List 4"
@@ -0,0 +1,251 @@
+"""
+Unit tests for the AsyncAPIConnector class, run against a local stand-in SlickText server.
+"""
+import asyncio
+import pytest
+from res.api import IncompleteDownloadError
+from res.async_api import AsyncAPIConnector
+from tests.fake_slicktext import FakeSlickText
+
+
+class TestAsyncAPIConnectorUnit:
+    """
+    Unit tests for the AsyncAPIConnector class.
+    """
+    @pytest.fixture
+    def server(self):
+        """
+        Fixture to run a fake SlickText server with 600 contacts.
+        :return: FakeSlickText object
+        """
+        with FakeSlickText(contact_count=600) as server:
+            yield server
+
+    @pytest.fixture
+    def api_connector(self, server):
+        """
+        Fixture to return an AsyncAPIConnector pointed at the fake server.
+        :return: AsyncAPIConnector object
+        """
+        return AsyncAPIConnector(token="test_token", brand_id=server.brand_id,
+                                 concurrency=4, base_url=server.base_url)
+
+    def test_init(self, api_connector: AsyncAPIConnector):
+        """
+        Test that the session is created lazily.
+        """
+        assert api_connector.token == "test_token"
+        assert api_connector.session is None
+
+    def test_invalid_concurrency(self):
+        """
+        Test that a non-positive concurrency limit is rejected.
+        """
+        with pytest.raises(ValueError):
+            AsyncAPIConnector(token="test_token", concurrency=0)
+
+    def test_get_all_contacts(self, server, api_connector):
+        """
+        Test that get_all_contacts returns every contact in order.
+        """
+        async def run():
+            async with api_connector:
+                return await api_connector.get_all_contacts()
+
+        contacts = asyncio.run(run())
+
+        assert [contact["contact_id"] for contact in contacts] == list(range(1, 601))
+        assert len(server.requests) == 3
+        assert api_connector.session is None
+
+    def test_get_all_contacts_strict(self, monkeypatch, api_connector):
+        """
+        Test that a failed page raises in strict mode instead of returning a partial list.
+        """
+        get_contacts = api_connector.get_contacts
+
+        async def failing_get_contacts(limit=None, offset=None, **filters):
+            if offset == 250:
+                return None
+            return await get_contacts(limit=limit, offset=offset, **filters)
+
+        monkeypatch.setattr(api_connector, "get_contacts", failing_get_contacts)
+
+        async def run(strict):
+            async with api_connector:
+                return await api_connector.get_all_contacts(strict=strict)
+
+        assert len(asyncio.run(run(False))) == 250
+        with pytest.raises(IncompleteDownloadError):
+            asyncio.run(run(True))
+
+    def test_iter_contacts(self, server, api_connector):
+        """
+        Test that iter_contacts fetches pages lazily and stops when the caller stops.
+        """
+        async def run():
+            async with api_connector:
+                contacts = []
+                async for contact in api_connector.iter_contacts(projection=["contact_id"]):
+                    contacts.append(contact)
+                    if len(contacts) == 300:
+                        break
+                return contacts
+
+        contacts = asyncio.run(run())
+
+        assert contacts[0] == {"contact_id": 1}
+        assert len(contacts) == 300
+        assert len(server.requests) == 2
+
+    @pytest.mark.parametrize("custom_field_filter", [True, False])
+    def test_find_contacts_by_custom_field(self, server, api_connector, custom_field_filter):
+        """
+        Test that custom field lookups are chunked, and fall back to one pass over the contacts
+        when the API ignores the filter.
+        """
+        server.custom_field_filter = custom_field_filter
+        worker_ids = {"W000001", "W000002", "W000300", "W000599", "W000700"}
+
+        async def run():
+            async with api_connector:
+                return await api_connector.find_contacts_by_custom_field("adp_associate_id", worker_ids,
+                                                                         chunk_size=2)
+
+        contacts = asyncio.run(run())
+
+        assert sorted(contact["contact_id"] for contact in contacts) == [1, 2, 300, 599]
+        # Three chunks, or the first chunk's page followed by the two remaining pages of every contact
+        filtered = ["custom_fields[adp_associate_id]" in request["query"] for request in server.requests]
+        assert filtered == ([True] * 3 if custom_field_filter else [True, False, False])
+
+    def test_find_contacts_by_custom_field_unsupported_values(self, monkeypatch, server, api_connector):
+        """
+        Test that an empty first chunk falls back to one pass over every contact.
+        """
+        contacts_page = server._contacts_page  # pylint: disable=protected-access
+
+        def unsupported_values_page(query):
+            # An API without comma separated values matches nothing
+            if any("," in value[0] for value in query.values()):
+                return server._page([], query)  # pylint: disable=protected-access
+            return contacts_page(query)
+
+        monkeypatch.setattr(server, "_contacts_page", unsupported_values_page)
+
+        async def run():
+            async with api_connector:
+                return await api_connector.find_contacts_by_custom_field("adp_associate_id",
+                                                                         {"W000001", "W000300"})
+
+        contacts = asyncio.run(run())
+
+        assert sorted(contact["contact_id"] for contact in contacts) == [1, 300]
+        filtered = ["custom_fields[adp_associate_id]" in request["query"] for request in server.requests]
+        assert filtered == [True, False, False, False]
+
+    def test_list_and_campaign_lookups(self, server, api_connector):
+        """
+        Test finding contact lists and campaigns by name and reading the contacts of a list.
+        """
+        async def run():
+            async with api_connector:
+                contact_list = await api_connector.create_contact_list("Reminder")
+                list_id = contact_list["contact_list_id"]
+                await api_connector.add_contacts_to_list([1, 2, 3], list_id)
+                await api_connector.create_campaign("Reminder", "Hello", list_id)
+                return (await api_connector.find_contact_list_by_name("Reminder"),
+                        await api_connector.find_contact_list_by_name("Other"),
+                        await api_connector.get_list_contact_ids(list_id),
+                        await api_connector.find_campaign_by_name("Reminder"),
+                        await api_connector.find_campaign_by_name("Other"))
+
+        contact_list, missing_list, contact_ids, campaign, missing_campaign = asyncio.run(run())
+
+        assert contact_list == {"contact_list_id": 1, "name": "Reminder"}
+        assert missing_list is None
+        assert contact_ids == {1, 2, 3}
+        assert campaign["campaign_id"] == 1
+        assert missing_campaign is None
+
+    def test_create_campaign_flow(self, server, api_connector):
+        """
+        Test creating a list, adding contacts to it and creating a campaign.
+        """
+        async def run():
+            async with api_connector:
+                contact_list = await api_connector.create_contact_list("Reminder")
+                list_id = contact_list["contact_list_id"]
+                report = await api_connector.add_contacts_to_list([1, 2, 3], list_id, chunk_size=2)
+                assert report.ok
+                return list_id, await api_connector.create_campaign("Reminder", "Hello", list_id)
+
+        list_id, campaign = asyncio.run(run())
+
+        assert server.lists[list_id]["contacts"] == {1, 2, 3}
+        assert len([request for request in server.requests if request["path"].endswith("/lists/contacts")]) == 2
+        assert campaign["campaign_id"] == 1
+        assert server.campaigns[1]["audience"] == {"contact_lists": [list_id]}
+
+    def test_concurrent_brands_on_one_loop(self, server):
+        """
+        Test that several connectors can share one event loop.
+        """
+        async def fetch():
+            async with AsyncAPIConnector(token="test_token", brand_id=server.brand_id,
+                                         base_url=server.base_url) as api_connector:
+                return await api_connector.get_all_contacts()
+
+        async def run():
+            return await asyncio.gather(fetch(), fetch())
+
+        first, second = asyncio.run(run())
+
+        assert len(first) == len(second) == 600
+
+    def test_fatal_status_not_retried(self, monkeypatch, server, api_connector):
+        """
+        Test that a 404 from an unknown brand returns None without retrying.
+        """
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr("asyncio.sleep", fake_sleep)
+        api_connector.set_brand_id("unknown")
+
+        async def run():
+            async with api_connector:
+                return await api_connector.get_contact_details(1)
+
+        assert asyncio.run(run()) is None
+        assert len(server.requests) == 1
+        assert not sleeps
+
+    def test_latency_excludes_semaphore_wait(self):
+        """
+        Test that the recorded latency covers the request only, not the time queued for the semaphore.
+        """
+        with FakeSlickText(contact_count=10, latency=0.05) as server:
+            api_connector = AsyncAPIConnector(token="test_token", brand_id=server.brand_id,
+                                              concurrency=1, base_url=server.base_url)
+
+            async def run():
+                async with api_connector:
+                    await asyncio.gather(*(api_connector.get_contact_details(1) for _ in range(4)))
+
+            asyncio.run(run())
+
+        stats = api_connector.metrics.summary()["contact_details"]
+        assert stats["requests"] == 4
+        # Queued requests would otherwise record up to four times the server latency
+        assert stats["latency_max"] < 0.1
+
+    def test_brand_id_required(self):
+        """
+        Test that brand scoped calls require a brand ID.
+        """
+        api_connector = AsyncAPIConnector(token="test_token")
+        with pytest.raises(ValueError):
+            asyncio.run(api_connector.get_contacts())
@@ -0,0 +1,116 @@
+"""
+Unit tests for the Cassette class.
+"""
+import gzip
+import json
+import pytest
+from res.api import APIConnector
+from res.cassette import Cassette, CassetteMissError
+from res.retry import RetryPolicy
+from res.transport import TransportConfig
+from tests.fake_slicktext import FakeSlickText
+
+
+class TestCassette:
+    """
+    Unit tests for the Cassette class.
+    """
+    @pytest.fixture
+    def path(self, tmp_path) -> str:
+        """
+        Fixture to return the path of a temporary cassette file.
+        :return: The cassette path.
+        """
+        return str(tmp_path / "slicktext.jsonl.gz")
+
+    def test_invalid_mode(self, path):
+        """
+        Test that an unknown mode is rejected.
+        """
+        with pytest.raises(ValueError):
+            Cassette(path, "stream")
+
+    def test_record_and_replay(self, path):
+        """
+        Test that a recorded run is replayed with the same results and without a server.
+        """
+        with FakeSlickText(contact_count=600) as server:
+            base_url = server.base_url
+            with Cassette(path, Cassette.RECORD) as cassette:
+                api_connector = APIConnector(token="test_token", brand_id=server.brand_id,
+                                             base_url=base_url, cassette=cassette)
+                contacts = api_connector.get_all_contacts(concurrent=True)
+                list_id = api_connector.create_contact_list("Reminder")["contact_list_id"]
+                report = api_connector.add_contacts_to_list([1, 2, 3], list_id)
+            recorded_requests = len(server.requests)
+
+        with gzip.open(path, "rt") as file:
+            lines = [json.loads(line) for line in file]
+        assert len(lines) == recorded_requests
+        assert all(line["latency"] >= 0 for line in lines)
+
+        cassette = Cassette(path)
+        assert len(cassette) == recorded_requests
+        api_connector = APIConnector(token="test_token", brand_id="1", base_url=base_url,
+                                     cassette=cassette, fast_json=True)
+        assert api_connector.get_all_contacts(concurrent=True) == contacts
+        assert api_connector.create_contact_list("Reminder")["contact_list_id"] == list_id
+        assert api_connector.add_contacts_to_list([1, 2, 3], list_id).succeeded == report.succeeded
+        assert len(cassette) == 0
+
+    def test_replay_miss(self, path):
+        """
+        Test that a request that was not recorded raises CassetteMissError.
+        """
+        with Cassette(path, Cassette.RECORD):
+            pass
+        api_connector = APIConnector(token="test_token", brand_id="1", cassette=Cassette(path))
+
+        with pytest.raises(CassetteMissError):
+            api_connector.get_brands()
+
+    def test_replay_retries_in_order(self, path, monkeypatch):
+        """
+        Test that identical requests are answered in the order they were recorded, including 429s.
+        """
+        monkeypatch.setattr("time.sleep", lambda x: None)
+        with FakeSlickText(contact_count=10, throttle_every=1, retry_after=0) as server:
+            base_url = server.base_url
+            with Cassette(path, Cassette.RECORD) as cassette:
+                api_connector = APIConnector(token="test_token", brand_id=server.brand_id, base_url=base_url,
+                                             retry_policy=RetryPolicy(max_attempts=2), cassette=cassette)
+                assert api_connector.get_brands() is None
+
+        api_connector = APIConnector(token="test_token", brand_id="1", base_url=base_url,
+                                     retry_policy=RetryPolicy(max_attempts=2), cassette=Cassette(path))
+        assert api_connector.get_brands() is None
+        assert api_connector.metrics.summary()["brands"]["status_codes"] == {429: 2}
+
+    def test_replay_latency(self, path, monkeypatch):
+        """
+        Test that the recorded latency is only waited when replay_latency is set.
+        """
+        with FakeSlickText(latency=0.01) as server:
+            base_url = server.base_url
+            with Cassette(path, Cassette.RECORD) as cassette:
+                APIConnector(token="test_token", base_url=base_url, cassette=cassette).get_brands()
+
+        sleeps = []
+        monkeypatch.setattr("res.cassette.time.sleep", sleeps.append)
+        APIConnector(token="test_token", base_url=base_url, cassette=Cassette(path)).get_brands()
+        assert not sleeps
+        APIConnector(token="test_token", base_url=base_url,
+                     cassette=Cassette(path, replay_latency=True)).get_brands()
+        assert sleeps and sleeps[0] >= 0.01
+
+    def test_compressed_bodies_match(self, path):
+        """
+        Test that gzipped request bodies are matched on their content, not their gzip header.
+        """
+        data, headers = TransportConfig(compress_threshold=0).encode_body({"name": "Reminder"})
+        again, _ = TransportConfig(compress_threshold=0, compress_level=1).encode_body({"name": "Reminder"})
+
+        assert (Cassette.request_key("POST", "http://x/lists", None, data, headers)
+                == Cassette.request_key("POST", "http://x/lists", None, again, headers))
+        assert (Cassette.request_key("POST", "http://x/lists", None, data, headers)
+                != Cassette.request_key("POST", "http://x/lists", {"limit": 1}, data, headers))
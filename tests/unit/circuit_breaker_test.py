@@ -0,0 +1,183 @@
+"""
+Unit tests for the Circuit and CircuitBreaker classes.
+"""
+import asyncio
+from unittest.mock import MagicMock
+import pytest
+from res.api import APIConnector
+from res.async_api import AsyncAPIConnector
+from res.circuit_breaker import Circuit, CircuitBreaker, CircuitOpenError
+from res.metrics import APIMetrics
+from tests.fake_slicktext import FakeSlickText
+
+
+class TestCircuitBreaker:
+    """
+    Unit tests for the CircuitBreaker class.
+    """
+    @pytest.fixture
+    def clock(self, monkeypatch) -> list:
+        """
+        Fixture to replace the monotonic clock of the circuit breaker with a settable one.
+        :return: A one-element list holding the current time.
+        """
+        now = [1000.0]
+        monkeypatch.setattr("res.circuit_breaker.time.monotonic", lambda: now[0])
+        return now
+
+    @pytest.mark.parametrize("kwargs", [
+        {"failure_rate": 0},
+        {"failure_rate": 1.5},
+        {"window_size": 0},
+        {"min_calls": 0},
+        {"window_size": 5, "min_calls": 6},
+        {"half_open_calls": 0},
+        {"open_duration": -1}
+    ])
+    def test_invalid_arguments(self, kwargs):
+        """
+        Test that invalid settings are rejected.
+        """
+        with pytest.raises(ValueError):
+            CircuitBreaker(**kwargs)
+
+    def test_opens_on_failure_rate(self, clock):
+        """
+        Test that the circuit opens once the failure rate over the window reaches the threshold.
+        """
+        breaker = CircuitBreaker(failure_rate=0.5, window_size=4, min_calls=4)
+        for status_code in (200, 500, 200):
+            breaker.before_request("contacts")
+            breaker.record("contacts", status_code)
+        assert breaker.state("contacts") == Circuit.CLOSED
+
+        breaker.before_request("contacts")
+        breaker.record("contacts", None)
+        assert breaker.state("contacts") == Circuit.OPEN
+        with pytest.raises(CircuitOpenError) as excinfo:
+            breaker.before_request("contacts")
+        assert excinfo.value.key == "contacts"
+        # Other endpoints are not affected
+        breaker.before_request("campaigns")
+
+    def test_client_errors_are_not_failures(self, clock):
+        """
+        Test that fatal client errors and throttling do not open the circuit.
+        """
+        breaker = CircuitBreaker(window_size=2, min_calls=2)
+        for status_code in (404, 429, 422, 401):
+            breaker.before_request("contacts")
+            breaker.record("contacts", status_code)
+        assert breaker.state("contacts") == Circuit.CLOSED
+
+    def test_half_open_probe(self, clock):
+        """
+        Test that an open circuit lets one probe through after open_duration and closes on success.
+        """
+        breaker = CircuitBreaker(window_size=1, min_calls=1, open_duration=30)
+        breaker.before_request("contacts")
+        breaker.record("contacts", 503)
+        assert breaker.state("contacts") == Circuit.OPEN
+
+        clock[0] += 31
+        breaker.before_request("contacts")
+        assert breaker.state("contacts") == Circuit.HALF_OPEN
+        # Only one probe at a time
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("contacts")
+
+        breaker.record("contacts", 200)
+        assert breaker.state("contacts") == Circuit.CLOSED
+        breaker.before_request("contacts")
+
+    def test_failed_probe_reopens(self, clock):
+        """
+        Test that a failed probe opens the circuit again for another open_duration.
+        """
+        breaker = CircuitBreaker(window_size=1, min_calls=1, open_duration=30)
+        breaker.before_request("contacts")
+        breaker.record("contacts", 500)
+        clock[0] += 31
+        breaker.before_request("contacts")
+        breaker.record("contacts", 500)
+
+        assert breaker.state("contacts") == Circuit.OPEN
+        clock[0] += 10
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("contacts")
+
+    def test_state_changes_are_recorded(self, clock):
+        """
+        Test that state changes and rejected requests are reported to the metrics.
+        """
+        metrics = APIMetrics()
+        events = []
+        metrics.add_hook(events.append)
+        breaker = CircuitBreaker(window_size=1, min_calls=1, open_duration=30, metrics=metrics)
+
+        breaker.before_request("contacts")
+        breaker.record("contacts", 500)
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("contacts")
+        clock[0] += 31
+        breaker.before_request("contacts")
+        breaker.record("contacts", 200)
+
+        assert [(event["old_state"], event["new_state"]) for event in events if event["event"] == "circuit"] == [
+            ("closed", "open"), ("open", "half_open"), ("half_open", "closed")
+        ]
+        summary = metrics.summary()["contacts"]
+        assert summary["circuit_state"] == "closed"
+        assert summary["circuit_opened"] == 1
+        assert summary["rejected"] == 1
+        assert breaker.states()["contacts"]["state"] == "closed"
+
+    def test_connector_fails_fast(self, monkeypatch):
+        """
+        Test that the APIConnector stops retrying and raises once the circuit opens.
+        """
+        monkeypatch.setattr("time.sleep", lambda x: None)
+        breaker = CircuitBreaker(window_size=3, min_calls=3)
+        api_connector = APIConnector(token="test_token", brand_id="1", circuit_breaker=breaker)
+        response = MagicMock()
+        response.status_code = 503
+        response.headers = {}
+        response.content = b""
+        mock_request = MagicMock(return_value=response)
+        monkeypatch.setattr(api_connector.session, "request", mock_request)
+
+        with pytest.raises(CircuitOpenError):
+            api_connector.get_brands()
+        assert mock_request.call_count == 3
+
+        # Later calls fail without sending a request
+        with pytest.raises(CircuitOpenError):
+            api_connector.get_brands()
+        assert mock_request.call_count == 3
+
+    def test_async_connector_fails_fast(self, monkeypatch):
+        """
+        Test that the AsyncAPIConnector rejects requests while the circuit is open.
+        """
+        breaker = CircuitBreaker(window_size=1, min_calls=1)
+        breaker.before_request("brands")
+        breaker.record("brands", None)
+
+        async def run():
+            async with AsyncAPIConnector(token="test_token", circuit_breaker=breaker) as api_connector:
+                await api_connector.get_brands()
+
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(run())
+
+    def test_healthy_server_keeps_circuit_closed(self):
+        """
+        Test that throttling by the stand-in server does not open the circuit.
+        """
+        breaker = CircuitBreaker(window_size=4, min_calls=4)
+        with FakeSlickText(contact_count=500, throttle_every=2, retry_after=0) as server:
+            api_connector = APIConnector(token="test_token", brand_id=server.brand_id,
+                                         base_url=server.base_url, circuit_breaker=breaker)
+            assert len(api_connector.get_all_contacts()) == 500
+
+        assert breaker.state("contacts") == Circuit.CLOSED
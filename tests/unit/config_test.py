@@ -72,3 +72,56 @@ class TestConfig:
         with pytest.raises(ValueError) as exc_info:
             Config()
         assert str(exc_info.value) == expected_error
+
+    def test_engine_options_defaults(self, valid_config):
+        """
+        Test that the default engine options pre-ping pooled connections and batch executemany.
+        """
+        assert valid_config.engine_options == {
+            'pool_size': 5,
+            'max_overflow': 10,
+            'pool_recycle': 1800,
+            'pool_pre_ping': True,
+            'fast_executemany': True
+        }
+        assert valid_config.read_only_isolation_level == 'READ UNCOMMITTED'
+
+    def test_engine_options_from_environment(self, monkeypatch):
+        """
+        Test that the engine options are read from the environment variables.
+        """
+        monkeypatch.setenv('DB_POOL_SIZE', '2')
+        monkeypatch.setenv('DB_MAX_OVERFLOW', '0')
+        monkeypatch.setenv('DB_POOL_RECYCLE', '-1')
+        monkeypatch.setenv('DB_POOL_PRE_PING', 'false')
+        monkeypatch.setenv('DB_ISOLATION_LEVEL', 'snapshot')
+        monkeypatch.setenv('DB_READ_ONLY_ISOLATION_LEVEL', 'read committed')
+        monkeypatch.setenv('DB_FAST_EXECUTEMANY', 'false')
+
+        config = Config()
+
+        assert config.engine_options == {
+            'pool_size': 2,
+            'max_overflow': 0,
+            'pool_recycle': -1,
+            'pool_pre_ping': False,
+            'isolation_level': 'SNAPSHOT',
+            'fast_executemany': False
+        }
+        assert config.read_only_isolation_level == 'READ COMMITTED'
+
+    @pytest.mark.parametrize("variable, value, expected_error", [
+        ('DB_POOL_SIZE', '0', 'Configuration variable DB_POOL_SIZE must be a positive integer'),
+        ('DB_MAX_OVERFLOW', '-1', 'Configuration variable DB_MAX_OVERFLOW must not be negative'),
+        ('DB_ISOLATION_LEVEL', 'dirty', 'Configuration variable DB_ISOLATION_LEVEL must be one of'),
+        ('DB_READ_ONLY_ISOLATION_LEVEL', 'dirty',
+         'Configuration variable DB_READ_ONLY_ISOLATION_LEVEL must be one of')
+    ])
+    def test_validate_engine_options(self, variable, value, expected_error, monkeypatch):
+        """
+        Test validation of the engine options.
+        """
+        monkeypatch.setenv(variable, value)
+        with pytest.raises(ValueError) as exc_info:
+            Config()
+        assert str(exc_info.value).startswith(expected_error)
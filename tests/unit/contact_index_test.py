@@ -0,0 +1,134 @@
+"""
+Unit tests for the ContactIndex class and the stream_match function.
+"""
+import pytest
+from res.api import APIConnector
+from res.contact_index import ContactIndex, stream_match
+from tests.fake_slicktext import FakeSlickText
+
+
+class TestContactIndex:
+    """
+    Unit tests for the ContactIndex class.
+    """
+    @pytest.fixture
+    def contact_index(self) -> ContactIndex:
+        """
+        Fixture to return a ContactIndex with a duplicate and incomplete contacts.
+        :return: ContactIndex object
+        """
+        contacts = [FakeSlickText.make_contact(i) for i in range(1, 6)]
+        contacts.append({"contact_id": 6, "mobile_number": "+15550000001",
+                         "custom_fields": {"adp_associate_id": " w000001 "}})
+        contacts.append({"contact_id": 7, "custom_fields": None})
+        contacts.append({"contact_id": 8, "custom_fields": {"other": "value"}})
+        return ContactIndex(contacts)
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("W000123", "w000123"),
+        ("  W000123\t", "w000123"),
+        (123, "123"),
+        ("   ", None),
+        (None, None)
+    ])
+    def test_normalize_associate_id(self, raw, expected):
+        """
+        Test that associate IDs are trimmed and case-folded.
+        """
+        assert ContactIndex.normalize_associate_id(raw) == expected
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("+1 (555) 000-0001", "5550000001"),
+        ("555.000.0001", "5550000001"),
+        ("+44 20 7946 0000", "442079460000"),
+        ("", None),
+        (None, None)
+    ])
+    def test_normalize_phone(self, raw, expected):
+        """
+        Test that phone numbers are reduced to their digits.
+        """
+        assert ContactIndex.normalize_phone(raw) == expected
+
+    def test_lookups(self, contact_index):
+        """
+        Test the lookups by associate ID, contact ID and phone number.
+        """
+        assert len(contact_index) == 8
+        assert [contact["contact_id"] for contact in contact_index.get_by_associate_id("W000001")] == [1, 6]
+        assert contact_index.get_by_contact_id(3)["first_name"] == "First3"
+        assert contact_index.get_by_contact_id(99) is None
+        assert [contact["contact_id"] for contact in contact_index.get_by_phone("(555) 000-0001")] == [1, 6]
+        assert contact_index.get_by_phone("555") == []
+
+    def test_incomplete_and_duplicate_contacts(self, contact_index):
+        """
+        Test that contacts without associate IDs and shared associate IDs are reported.
+        """
+        assert [contact["contact_id"] for contact in contact_index.missing_custom_fields] == [7]
+        assert [contact["contact_id"] for contact in contact_index.missing_associate_id] == [7, 8]
+        duplicates = contact_index.duplicates()
+        assert list(duplicates) == ["w000001"]
+        assert [contact["contact_id"] for contact in duplicates["w000001"]] == [1, 6]
+
+    def test_match(self, contact_index):
+        """
+        Test that worker IDs are matched after normalization and unknown IDs are ignored.
+        """
+        matched = contact_index.match(["W000003", "w000001", "W999999", None])
+
+        assert list(matched) == ["w000001", "w000003"]
+        assert [contact["contact_id"] for contact in matched["w000001"]] == [1, 6]
+        # The index is reusable for another set of worker IDs
+        assert list(contact_index.match({"W000005"})) == ["w000005"]
+        assert contact_index.match([]) == {}
+
+
+class TestStreamMatch:
+    """
+    Unit tests for the stream_match function.
+    """
+    def test_first_match_wins(self):
+        """
+        Test that only the first contact of every worker ID is kept.
+        """
+        contacts = [FakeSlickText.make_contact(i) for i in range(1, 4)]
+        contacts.insert(1, {"contact_id": 9, "custom_fields": {"adp_associate_id": "W000003"}})
+
+        matched = stream_match(contacts, ["w000003", "W000002", "W999999"])
+
+        assert {key: [contact["contact_id"] for contact in value] for key, value in matched.items()} == {
+            "w000002": [2], "w000003": [9]
+        }
+
+    def test_stops_consuming_when_all_matched(self):
+        """
+        Test that the stream is not consumed past the last match and is closed.
+        """
+        consumed = []
+
+        def contacts():
+            for i in range(1, 1000):
+                consumed.append(i)
+                yield FakeSlickText.make_contact(i)
+
+        stream = contacts()
+        assert list(stream_match(stream, ["W000002", "W000005"])) == ["w000002", "w000005"]
+        assert consumed == [1, 2, 3, 4, 5]
+        assert next(stream, None) is None
+        assert stream_match(contacts(), []) == {}
+        assert consumed == [1, 2, 3, 4, 5]
+
+    def test_stops_paging(self):
+        """
+        Test that no more contact pages are requested once every worker ID is matched.
+        """
+        with FakeSlickText(contact_count=2000) as server:
+            api_connector = APIConnector(token="test_token", brand_id=server.brand_id,
+                                         base_url=server.base_url)
+            matched = stream_match(api_connector.iter_contacts(), ["W000010", "W000300"])
+            page_requests = [request for request in server.requests if request["path"].endswith("/contacts")]
+
+        assert list(matched) == ["w000010", "w000300"]
+        # Only the two pages holding the matches
+        assert len(page_requests) == 2
@@ -0,0 +1,127 @@
+"""
+Unit tests for the ContactStore class.
+"""
+from unittest.mock import MagicMock
+import pytest
+from res.api import IncompleteDownloadError
+from res.contact_store import ContactStore
+
+
+def make_contact(contact_id, associate_id, last_updated, custom_fields=True):
+    """
+    Build a contact in the shape returned by the API.
+    """
+    return {
+        "contact_id": contact_id,
+        "first_name": f"First{contact_id}",
+        "last_name": f"Last{contact_id}",
+        "custom_fields": {"adp_associate_id": associate_id} if custom_fields else None,
+        "last_updated": last_updated,
+        "mobile_number": "+15550000000"
+    }
+
+
+class TestContactStore:
+    """
+    Unit tests for the ContactStore class.
+    """
+    @pytest.fixture
+    def store(self, tmp_path):
+        """
+        Fixture to return a ContactStore backed by a temporary file.
+        :return: ContactStore object
+        """
+        with ContactStore(str(tmp_path / "contacts.sqlite3")) as store:
+            yield store
+
+    @pytest.fixture
+    def api_connector(self):
+        """
+        Fixture to return a mock APIConnector.
+        """
+        api_connector = MagicMock()
+        api_connector.get_all_contacts.return_value = [
+            make_contact(1, "W1", "2024-01-01T10:00:00"),
+            make_contact(2, "W2", "2024-01-03T10:00:00"),
+            make_contact(3, None, "2024-01-02T10:00:00", custom_fields=False),
+        ]
+        return api_connector
+
+    def test_first_sync_is_full(self, store, api_connector):
+        """
+        Test that the first sync downloads everything and sets the watermark.
+        """
+        assert store.sync(api_connector) == 3
+        assert len(store) == 3
+        assert store.watermark == "2024-01-03T10:00:00"
+        api_connector.get_all_contacts.assert_called_once()
+        assert api_connector.get_all_contacts.call_args.kwargs["concurrent"] is True
+        assert "custom_fields.adp_associate_id" in api_connector.get_all_contacts.call_args.kwargs["projection"]
+
+    def test_incremental_sync_uses_watermark(self, store, api_connector):
+        """
+        Test that later syncs only request contacts modified since the watermark.
+        """
+        store.sync(api_connector)
+        api_connector.get_all_contacts.return_value = [make_contact(2, "W22", "2024-01-05T10:00:00")]
+
+        assert store.sync(api_connector) == 1
+
+        assert api_connector.get_all_contacts.call_args.kwargs["last_updated_after"] == "2024-01-03T10:00:00"
+        contacts = {contact["contact_id"]: contact for contact in store.get_contacts()}
+        assert len(contacts) == 3
+        assert contacts[2]["custom_fields"] == {"adp_associate_id": "W22"}
+        assert store.watermark == "2024-01-05T10:00:00"
+
+    def test_full_resync_replaces_contacts(self, store, api_connector):
+        """
+        Test that a forced full resync drops contacts that no longer exist.
+        """
+        store.sync(api_connector)
+        api_connector.get_all_contacts.return_value = [make_contact(1, "W1", "2024-01-01T10:00:00")]
+
+        store.sync(api_connector, full=True)
+
+        assert [contact["contact_id"] for contact in store.get_contacts()] == [1]
+        assert store.watermark == "2024-01-01T10:00:00"
+
+    @pytest.mark.parametrize("full", [False, True])
+    def test_failed_sync_keeps_store(self, store, api_connector, full):
+        """
+        Test that a failed download neither replaces the stored contacts nor moves the watermark.
+        """
+        store.sync(api_connector)
+        api_connector.get_all_contacts.side_effect = IncompleteDownloadError(250, 250, 1000)
+
+        with pytest.raises(IncompleteDownloadError):
+            store.sync(api_connector, full=full)
+
+        assert api_connector.get_all_contacts.call_args.kwargs["strict"] is True
+        assert len(store) == 3
+        assert store.watermark == "2024-01-03T10:00:00"
+
+    def test_get_contacts_shape(self, store, api_connector):
+        """
+        Test that stored contacts keep the fields used for matching.
+        """
+        store.sync(api_connector)
+        contacts = list(store.get_contacts())
+
+        assert contacts[0] == {
+            "contact_id": 1,
+            "first_name": "First1",
+            "last_name": "Last1",
+            "custom_fields": {"adp_associate_id": "W1"}
+        }
+        assert contacts[2]["custom_fields"] is None
+
+    def test_store_persists_between_runs(self, tmp_path, api_connector):
+        """
+        Test that the snapshot survives reopening the file.
+        """
+        path = str(tmp_path / "contacts.sqlite3")
+        with ContactStore(path) as store:
+            store.sync(api_connector)
+        with ContactStore(path) as store:
+            assert len(store) == 3
+            assert store.watermark == "2024-01-03T10:00:00"
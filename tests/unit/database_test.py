@@ -4,7 +4,10 @@ This module contains unit tests for the database module.
 import os
 from unittest.mock import patch
 import pytest
+from sqlalchemy import inspect
 from res.db.database import Database
+from res.db.models import DayEntry, Timecard
+from tests.sqlite_db import SQLiteDatabase
 
 
 class TestDatabaseUnit:
@@ -37,13 +40,56 @@ class TestDatabaseUnit:
         """
         assert db_instance.engine.url.drivername == "mssql+pyodbc"
 
+    @patch('res.db.database.Database.create_indexes')
     @patch('res.db.database.Base.metadata.create_all')
-    def test_create_tables(self, mock_create_all, db_instance):
+    def test_create_tables(self, mock_create_all, mock_create_indexes, db_instance):
         """
         Test the create_tables method to ensure tables are created.
         """
         db_instance.create_tables()
         mock_create_all.assert_called_once_with(db_instance.engine)
+        mock_create_indexes.assert_called_once_with()
+
+    def test_create_indexes_on_existing_tables(self):
+        """
+        Test that the indexes missing from tables created before they were added to the models are created.
+        """
+        database = SQLiteDatabase()
+        with database.engine.begin() as connection:
+            for index in list(Timecard.__table__.indexes) + list(DayEntry.__table__.indexes):
+                index.drop(connection)
+        with patch.dict(os.environ, {'DB_SERVER': 'localhost', 'DB_NAME': 'test_db',
+                                     'DB_USERNAME': 'test_user', 'DB_PASSWORD': 'test_password'}), \
+                patch.object(Database, '_create_engine', return_value=database.engine):
+            db_instance = Database()
+
+        db_instance.create_tables()
+        # A second call finds the indexes and does not fail
+        db_instance.create_indexes()
+
+        inspector = inspect(database.engine)
+        schema = Timecard.__table__.schema
+        assert {index["name"] for index in inspector.get_indexes("Timecards", schema=schema)} == \
+            {index.name for index in Timecard.__table__.indexes}
+        assert {index["name"] for index in inspector.get_indexes("DayEntries", schema=schema)} == \
+            {index.name for index in DayEntry.__table__.indexes}
+
+    def test_create_engine_options(self, db_instance):
+        """
+        Test that the engine is created with the pool and pyodbc options of the configuration.
+        """
+        assert db_instance.engine.pool.size() == db_instance.config.pool_size
+        assert db_instance.engine.pool._pre_ping is True
+        assert db_instance.engine.dialect.fast_executemany is True
+
+    def test_get_read_only_session(self, db_instance):
+        """
+        Test that read-only sessions use the read-only isolation level on the shared pool.
+        """
+        session = db_instance.get_read_only_session()
+        assert session.get_bind() is db_instance.read_only_engine
+        assert db_instance.read_only_engine.get_execution_options()["isolation_level"] == "READ UNCOMMITTED"
+        assert db_instance.read_only_engine.pool is db_instance.engine.pool
 
     def test_get_new_session(self, db_instance):
         """
@@ -0,0 +1,230 @@
+"""
+Unit tests for the database functions, run against an in-memory SQLite database.
+"""
+import pytest
+from sqlalchemy import bindparam, inspect, select, text
+from sqlalchemy.dialects.mssql import pyodbc
+from sqlalchemy.orm import selectinload
+from res.db.db_functions import (
+    MISSING_PUNCH_TIMES,
+    get_employees_with_missing_punches_by_pay_period,
+    get_pay_period_by_start_date,
+    get_time_cards_with_missing_punches,
+    get_worker_ids_with_missing_punches_by_pay_period,
+    missing_punch_filter,
+    refresh_missing_punch_summary
+)
+from res.db.models import DayEntry, Employee, MissingPunchSummary, Timecard
+from tests.sqlite_db import SQLiteDatabase
+
+
+class TestDBFunctions:
+    """
+    Unit tests for the missing punch queries.
+    """
+    @pytest.fixture
+    def database(self) -> SQLiteDatabase:
+        """
+        Fixture to return an in-memory database.
+        :return: SQLiteDatabase object
+        """
+        return SQLiteDatabase()
+
+    def test_get_worker_ids_with_missing_punches(self, database):
+        """
+        Test that the worker IDs of the employees with a missing punch are returned as strings.
+        """
+        pay_period = database.populate(employees=10, missing_every=3)
+
+        with database.session() as session:
+            worker_ids = get_worker_ids_with_missing_punches_by_pay_period(session, pay_period.pay_period_id)
+
+        assert worker_ids == {"W000000", "W000003", "W000006", "W000009"}
+        assert all(isinstance(worker_id, str) for worker_id in worker_ids)
+
+    def test_get_worker_ids_other_pay_period(self, database):
+        """
+        Test that only the timecards of the requested pay period are considered.
+        """
+        pay_period = database.populate(employees=5)
+
+        with database.session() as session:
+            assert get_worker_ids_with_missing_punches_by_pay_period(session, pay_period.pay_period_id + 1) == set()
+
+    def test_get_worker_ids_single_round_trip(self, database):
+        """
+        Test that the worker IDs are fetched with one statement, however many timecards match.
+        """
+        pay_period = database.populate(employees=60, missing_every=2)
+
+        with database.session() as session:
+            with database.count_round_trips() as statements:
+                worker_ids = get_worker_ids_with_missing_punches_by_pay_period(session, pay_period.pay_period_id)
+
+        assert len(worker_ids) == 30
+        assert len(statements) == 1
+        assert "DISTINCT" in statements[0]
+
+    def test_get_time_cards_with_missing_punches(self, database):
+        """
+        Test that the timecards with a missing punch are returned once each.
+        """
+        pay_period = database.populate(employees=6, missing_every=3)
+
+        with database.session() as session:
+            time_cards = get_time_cards_with_missing_punches(session, pay_period.pay_period_id)
+            assert sorted(time_card.associate_id for time_card in time_cards) == ["A000000", "A000003"]
+            assert get_pay_period_by_start_date(session, pay_period.pay_period_start).pay_period_id == \
+                pay_period.pay_period_id
+
+    def test_get_employees_with_missing_punches(self, database):
+        """
+        Test that the employees are fetched with one semi-join query and no IN list of parameters.
+        """
+        pay_period = database.populate(employees=12, missing_every=4)
+
+        with database.session() as session:
+            with database.count_round_trips() as statements:
+                employees = get_employees_with_missing_punches_by_pay_period(session, pay_period.pay_period_id)
+
+        assert sorted(employee.worker_id for employee in employees) == ["W000000", "W000004", "W000008"]
+        assert len(statements) == 1
+        # Only the pay period and the missing punch placeholders are bound, never the associate IDs
+        assert "associate_id IN (SELECT" in statements[0]
+        assert statements[0].count("?") == 5
+
+    def test_get_employees_with_missing_punches_eager_loading(self, database):
+        """
+        Test that loader options eager-load the timecards and day entries.
+        """
+        pay_period = database.populate(employees=12, missing_every=4, entries_per_timecard=3)
+        options = [selectinload(Employee.timecards).selectinload(Timecard.day_entries)]
+
+        with database.session() as session:
+            with database.count_round_trips() as statements:
+                employees = get_employees_with_missing_punches_by_pay_period(session, pay_period.pay_period_id,
+                                                                             options=options)
+                entries = [entry for employee in employees for timecard in employee.timecards
+                           for entry in timecard.day_entries]
+
+        assert len(entries) == 9
+        # The employees, then one SELECT ... IN per relationship
+        assert len(statements) == 3
+
+    def test_create_tables_emits_indexes(self, database):
+        """
+        Test that the indexes declared on the models are created with the tables.
+        """
+        inspector = inspect(database.engine)
+        schema = DayEntry.__table__.schema
+
+        day_entry_indexes = {index["name"]: index["column_names"]
+                             for index in inspector.get_indexes("DayEntries", schema=schema)}
+        timecard_indexes = {index["name"]: index["column_names"]
+                            for index in inspector.get_indexes("Timecards", schema=schema)}
+
+        assert day_entry_indexes == {
+            "IX_DayEntries_timecard_id": ["timecard_id"],
+            "IX_DayEntries_clock_in_time_timecard_id": ["clock_in_time", "timecard_id"],
+            "IX_DayEntries_clock_out_time_timecard_id": ["clock_out_time", "timecard_id"]
+        }
+        assert timecard_indexes == {"IX_Timecards_pay_period_id_associate_id": ["pay_period_id", "associate_id"]}
+
+    def test_refresh_missing_punch_summary(self, database):
+        """
+        Test that the first refresh summarizes the timecards with missing punches and the summary
+        gives the same worker IDs.
+        """
+        pay_period = database.populate(employees=10, missing_every=3)
+
+        with database.session() as session:
+            assert refresh_missing_punch_summary(session, pay_period.pay_period_id) == 4
+            session.commit()
+            summaries = session.query(MissingPunchSummary).all()
+            worker_ids = get_worker_ids_with_missing_punches_by_pay_period(session, pay_period.pay_period_id,
+                                                                           use_summary=True)
+
+        assert [summary.missing_punches for summary in summaries] == [1, 1, 1, 1]
+        assert worker_ids == {"W000000", "W000003", "W000006", "W000009"}
+
+    def test_refresh_missing_punch_summary_only_changed_timecards(self, database):
+        """
+        Test that a refresh only writes the rows of the timecards whose missing punches changed,
+        including changes made outside the ORM and deleted entries.
+        """
+        pay_period = database.populate(employees=10, missing_every=3)
+        with database.session() as session:
+            refresh_missing_punch_summary(session)
+            session.commit()
+            assert refresh_missing_punch_summary(session) == 0
+
+        with database.session() as session:
+            schema = DayEntry.__table__.schema
+            # The importer fixes the clock out punch of W000003, deletes the faulty entry of W000006
+            # and adds a second missing punch to W000000
+            session.execute(text(f'UPDATE {schema}."DayEntries" SET clock_out_time = clock_in_time '
+                                 f"WHERE entry_id = 'T{pay_period.pay_period_id}-000003-2'"))
+            session.execute(text(f'DELETE FROM {schema}."DayEntries" '
+                                 f"WHERE entry_id = 'T{pay_period.pay_period_id}-000006-2'"))
+            session.execute(text(f'UPDATE {schema}."DayEntries" SET clock_in_time = :missing '
+                                 f"WHERE entry_id = 'T{pay_period.pay_period_id}-000000-0'").bindparams(
+                bindparam("missing", MISSING_PUNCH_TIMES[0], type_=DayEntry.clock_in_time.type)))
+            session.commit()
+
+            assert refresh_missing_punch_summary(session) == 3
+            session.commit()
+            assert get_worker_ids_with_missing_punches_by_pay_period(session, pay_period.pay_period_id,
+                                                                     use_summary=True) == {"W000000", "W000009"}
+            assert session.get(MissingPunchSummary, f"T{pay_period.pay_period_id}-000000").missing_punches == 2
+
+    def test_get_worker_ids_from_summary_does_not_read_day_entries(self, database):
+        """
+        Test that the summary lookup reads the summary rows only, and that bypassing it reads the entries.
+        """
+        pay_period = database.populate(employees=20, missing_every=5)
+        with database.session() as session:
+            refresh_missing_punch_summary(session)
+            session.commit()
+
+            with database.count_round_trips() as statements:
+                get_worker_ids_with_missing_punches_by_pay_period(session, pay_period.pay_period_id,
+                                                                  use_summary=True)
+                get_worker_ids_with_missing_punches_by_pay_period(session, pay_period.pay_period_id)
+
+        assert "MissingPunchSummaries" in statements[0] and "DayEntries" not in statements[0]
+        assert "MissingPunchSummaries" not in statements[1] and "DayEntries" in statements[1]
+        plan = database.query_plan(statements[0], database.parameters[-2])
+        assert any("INDEX IX_MissingPunchSummaries_pay_period_id_associate_id" in step for step in plan)
+
+    @pytest.mark.parametrize("lookup", [get_worker_ids_with_missing_punches_by_pay_period,
+                                        get_employees_with_missing_punches_by_pay_period])
+    def test_missing_punch_query_plan(self, database, lookup):
+        """
+        Test that the missing punch lookups search the indexes and never scan a table.
+        """
+        pay_period = database.populate(employees=50, missing_every=5)
+
+        with database.session() as session:
+            with database.count_round_trips() as statements:
+                lookup(session, pay_period.pay_period_id)
+        plan = database.query_plan(statements[0], database.parameters[-1])
+
+        assert any("Timecards USING INDEX IX_Timecards_pay_period_id_associate_id" in step for step in plan)
+        assert any("DayEntries USING" in step and "INDEX IX_DayEntries_" in step for step in plan)
+        assert not any(step.startswith("SCAN") for step in plan)
+
+    def test_missing_punch_placeholders_use_datetimeoffset_format(self):
+        """
+        Test that on SQL Server the placeholders take the DATETIMEOFFSET type of the punch columns
+        and are sent as datetimeoffset strings keeping their UTC offset.
+        """
+        dialect = pyodbc.dialect()
+        compiled = select(DayEntry.entry_id).where(missing_punch_filter()).compile(dialect=dialect)
+        bind_types = {bind.type.compile(dialect=dialect) for bind in compiled.binds.values()}
+        processor = DayEntry.clock_out_time.type.dialect_impl(dialect).bind_processor(dialect)
+
+        assert bind_types == {"DATETIMEOFFSET(7)"}
+        assert [processor(value) for value in MISSING_PUNCH_TIMES] == [
+            "2001-01-01 00:00:00.000000 -05:00",
+            "2000-01-01 00:00:00.000000 +00:00"
+        ]
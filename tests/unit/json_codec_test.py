@@ -0,0 +1,80 @@
+"""
+Unit tests for the json_codec module.
+"""
+import json
+import pytest
+from res import json_codec
+from res.api import APIConnector
+from tests.fake_slicktext import FakeSlickText
+
+
+class TestJsonCodec:
+    """
+    Unit tests for the json_codec helpers.
+    """
+    def test_loads(self):
+        """
+        Test decoding bytes and str documents.
+        """
+        assert json_codec.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+        assert json_codec.loads('{"a": null}') == {"a": None}
+
+    def test_loads_invalid(self):
+        """
+        Test that invalid documents raise a json.JSONDecodeError with either backend.
+        """
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads(b"not json")
+
+    def test_loads_without_orjson(self, monkeypatch):
+        """
+        Test the standard library fallback.
+        """
+        monkeypatch.setattr(json_codec, "orjson", None)
+        assert json_codec.loads(b'{"a": 1}') == {"a": 1}
+
+    def test_compile_projection(self):
+        """
+        Test building a projection tree from dotted paths.
+        """
+        assert json_codec.compile_projection(["contact_id", "custom_fields.adp_associate_id"]) == {
+            "contact_id": None,
+            "custom_fields": {"adp_associate_id": None}
+        }
+
+    def test_project(self):
+        """
+        Test that only the projected keys are kept.
+        """
+        projection = json_codec.compile_projection(["contact_id", "custom_fields.adp_associate_id",
+                                                    "first_name"])
+        record = {
+            "contact_id": 1,
+            "mobile_number": "+15550000001",
+            "custom_fields": {"adp_associate_id": "W1", "department": "Sales"}
+        }
+
+        assert json_codec.project(record, projection) == {
+            "contact_id": 1,
+            "custom_fields": {"adp_associate_id": "W1"}
+        }
+        # A null parent is kept as null
+        assert json_codec.project({"contact_id": 2, "custom_fields": None}, projection) == {
+            "contact_id": 2,
+            "custom_fields": None
+        }
+
+    @pytest.mark.parametrize("fast_json", [False, True])
+    def test_get_all_contacts_with_projection(self, fast_json):
+        """
+        Test that the connector returns projected contacts with both decoders.
+        """
+        with FakeSlickText(contact_count=300) as server:
+            api_connector = APIConnector(token="test_token", brand_id=server.brand_id,
+                                         base_url=server.base_url, fast_json=fast_json)
+            contacts = api_connector.get_all_contacts(projection=["contact_id",
+                                                                  "custom_fields.adp_associate_id"])
+
+        assert len(contacts) == 300
+        assert contacts[0] == {"contact_id": 1, "custom_fields": {"adp_associate_id": "W000001"}}
+        assert "projection" not in server.requests[0]["query"]
@@ -0,0 +1,107 @@
+"""
+Unit tests for the logging configuration helpers.
+"""
+import json
+import logging
+import sys
+import pytest
+from res.logging_config import JSONFormatter, configure_logging, summarize
+
+
+class TestLoggingConfig:
+    """
+    Unit tests for configure_logging, JSONFormatter and summarize.
+    """
+    @pytest.fixture
+    def restore_root_logger(self):
+        """
+        Fixture to restore the root logger handlers and level after a test.
+        """
+        root = logging.getLogger()
+        handlers, level = list(root.handlers), root.level
+        yield
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        for handler in handlers:
+            root.addHandler(handler)
+        root.setLevel(level)
+
+    def test_json_formatter(self):
+        """
+        Test that records are formatted as JSON with their extra values.
+        """
+        record = logging.LogRecord("main", logging.WARNING, __file__, 1, "Matched %d contacts", (3,), None)
+        record.brand_id = "1"
+
+        entry = json.loads(JSONFormatter().format(record))
+
+        assert entry["level"] == "WARNING"
+        assert entry["logger"] == "main"
+        assert entry["message"] == "Matched 3 contacts"
+        assert entry["brand_id"] == "1"
+        assert "time" in entry
+
+    def test_json_formatter_exception(self):
+        """
+        Test that exceptions are included in the JSON entry.
+        """
+        try:
+            raise ValueError("broken")
+        except ValueError:
+            record = logging.LogRecord("main", logging.ERROR, __file__, 1, "Failed", (), True)
+            record.exc_info = sys.exc_info()
+
+        assert "ValueError: broken" in json.loads(JSONFormatter().format(record))["exception"]
+
+    @pytest.mark.usefixtures("restore_root_logger")
+    def test_configure_logging(self, tmp_path):
+        """
+        Test that records go through the queue to a rotating JSON log file.
+        """
+        log_file = tmp_path / "run.log"
+        listener = configure_logging(level="INFO", log_file=str(log_file), json_format=True,
+                                     max_bytes=200, backup_count=2)
+        try:
+            for i in range(20):
+                logging.info("Line %d of the run", i)
+            logging.debug("Not written")
+        finally:
+            listener.stop()
+
+        lines = log_file.read_text().splitlines()
+        assert lines
+        assert json.loads(lines[-1])["message"] == "Line 19 of the run"
+        assert (tmp_path / "run.log.1").exists()
+        assert not (tmp_path / "run.log.3").exists()
+        assert all("Not written" not in line for line in lines)
+
+    @pytest.mark.usefixtures("restore_root_logger")
+    def test_configure_logging_exception(self, tmp_path):
+        """
+        Test that an exception logged through the queue keeps its own key in the JSON line.
+        """
+        log_file = tmp_path / "run.log"
+        listener = configure_logging(log_file=str(log_file), json_format=True)
+        try:
+            try:
+                raise ValueError("broken")
+            except ValueError:
+                logging.exception("Brand %s failed", "1")
+        finally:
+            listener.stop()
+
+        entry = json.loads(log_file.read_text().splitlines()[-1])
+        assert entry["message"] == "Brand 1 failed"
+        assert "ValueError: broken" in entry["exception"]
+
+    @pytest.mark.parametrize("items, limit, expected", [
+        ([], 2, ""),
+        (["W1", "W2"], 2, "W1, W2"),
+        (["W1", "W2", "W3", "W4"], 2, "W1, W2 (+2 more)"),
+        ((i for i in range(3)), 1, "0 (+2 more)")
+    ])
+    def test_summarize(self, items, limit, expected):
+        """
+        Test that collections are cut to the sample size.
+        """
+        assert summarize(items, limit) == expected
@@ -0,0 +1,146 @@
+"""
+Unit tests for the main module, run end to end against an in-memory SQLite database and
+local stand-in SlickText servers.
+"""
+import importlib
+from datetime import date
+import pytest
+from res.api import APIConnector
+from res.date_util import DateUtil
+from tests.fake_slicktext import FakeSlickText
+from tests.sqlite_db import SQLiteDatabase
+
+
+class FixedDateUtil(DateUtil):
+    """
+    A DateUtil whose today is in the week after the pay period added by SQLiteDatabase.populate().
+    """
+    @staticmethod
+    def get_today() -> date:
+        return date(2024, 1, 8)
+
+
+class TestMain:
+    """
+    Unit tests for main.main.
+    """
+    @pytest.fixture
+    def main(self, monkeypatch):
+        """
+        Fixture to import the main module, which reads its required settings from the environment.
+        :return: The main module
+        """
+        monkeypatch.setenv("SLICK_TEXT_API_KEY", "test_token")
+        monkeypatch.setenv("SLICK_TEXT_BRAND_IDS", "1")
+        main = importlib.import_module("main")
+        monkeypatch.setattr(main, "DateUtil", FixedDateUtil)
+        return main
+
+    @pytest.fixture
+    def database(self, monkeypatch, main) -> SQLiteDatabase:
+        """
+        Fixture to return an in-memory database used by main in place of Database.
+        10 employees, of which W000000, W000003, W000006 and W000009 have a missing punch.
+        :return: SQLiteDatabase object
+        """
+        database = SQLiteDatabase()
+        database.populate(employees=10, missing_every=3)
+        database.get_read_only_session = database.session
+        monkeypatch.setattr(main, "Database", lambda: database)
+        return database
+
+    @pytest.fixture
+    def servers(self, monkeypatch, main, database):
+        """
+        Fixture to run one fake SlickText server per brand and point the connectors of main at them.
+        Contact 1 is relabeled W000000 and contact 10 shares W000003 with contact 3.
+        :return: A dictionary of FakeSlickText objects by brand ID
+        """
+        servers = {brand_id: FakeSlickText(contact_count=600, brand_id=brand_id) for brand_id in ("1", "2")}
+        for server in servers.values():
+            server.contacts[0]["custom_fields"]["adp_associate_id"] = "W000000"
+            server.contacts[9]["custom_fields"]["adp_associate_id"] = "W000003"
+            server.start()
+
+        def api_connector(**kwargs):
+            return APIConnector(base_url=servers[kwargs["brand_id"]].base_url, **kwargs)
+
+        monkeypatch.setattr(main, "APIConnector", api_connector)
+        monkeypatch.setattr(main, "BRAND_IDS", list(servers))
+        yield servers
+        for server in servers.values():
+            server.stop()
+
+    @staticmethod
+    def posts(server: FakeSlickText, path: str) -> list:
+        """
+        Get the POST requests sent to a path of the brand.
+        :param server: The FakeSlickText object.
+        :param path: The path after the brand, e.g. "/campaigns".
+        :return: A list of requests.
+        """
+        return [request for request in server.requests
+                if request["method"] == "POST" and request["path"] == f"/v1/brands/{server.brand_id}{path}"]
+
+    def test_main(self, main, servers):
+        """
+        Test that every brand gets a contact list of every contact of the workers, and a campaign.
+        """
+        main.main()
+
+        for server in servers.values():
+            assert len(server.lists) == 1
+            assert server.lists[1]["contacts"] == {1, 3, 6, 9, 10}
+            assert len(server.campaigns) == 1
+            assert server.campaigns[1]["audience"] == {"contact_lists": [1]}
+
+    def test_one_brand_fails(self, main, servers):
+        """
+        Test that a brand failing to create its campaign fails the run, without affecting the other brand.
+        """
+        servers["2"]._post_campaign = lambda query, body: (400, {"message": "Bad Request"})
+
+        with pytest.raises(RuntimeError, match="Processing failed for brands: 2$"):
+            main.main()
+
+        assert len(servers["1"].campaigns) == 1
+        assert len(servers["2"].lists) == 1
+        assert not servers["2"].campaigns
+
+    def test_rerun_reuses_list_and_campaign(self, monkeypatch, main, servers):
+        """
+        Test that a rerun after a failed brand only creates the campaign it is missing.
+        """
+        monkeypatch.setattr(main, "REUSE_EXISTING", True)
+        servers["2"]._post_campaign = lambda query, body: (400, {"message": "Bad Request"})
+        with pytest.raises(RuntimeError):
+            main.main()
+        del servers["2"]._post_campaign
+        for server in servers.values():
+            server.requests.clear()
+
+        main.main()
+
+        for server in servers.values():
+            assert len(server.lists) == 1
+            assert len(server.campaigns) == 1
+            assert not self.posts(server, "/lists")
+            assert not self.posts(server, "/lists/contacts")
+        assert not self.posts(servers["1"], "/campaigns")
+        assert len(self.posts(servers["2"], "/campaigns")) == 1
+
+    def test_first_match_wins(self, monkeypatch, main, servers):
+        """
+        Test that only the first contact of every worker is added, and contacts stop being fetched
+        once every worker is matched.
+        """
+        monkeypatch.setattr(main, "FIRST_MATCH_WINS", True)
+
+        main.main()
+
+        for server in servers.values():
+            assert server.lists[1]["contacts"] == {1, 3, 6, 9}
+            contact_pages = [request for request in server.requests
+                             if request["path"] == f"/v1/brands/{server.brand_id}/contacts"]
+            assert len(contact_pages) == 1
+            assert len(server.campaigns) == 1
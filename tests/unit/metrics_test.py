@@ -0,0 +1,96 @@
+"""
+Unit tests for the APIMetrics class.
+"""
+import logging
+from unittest.mock import MagicMock
+import pytest
+from res.api import APIConnector
+from res.metrics import APIMetrics
+
+
+class TestAPIMetrics:
+    """
+    Unit tests for the APIMetrics class.
+    """
+    @pytest.fixture
+    def metrics(self) -> APIMetrics:
+        """
+        Fixture to return an empty APIMetrics object.
+        :return: APIMetrics object
+        """
+        return APIMetrics()
+
+    def test_record_request(self, metrics):
+        """
+        Test that requests are aggregated per endpoint key.
+        """
+        metrics.record_request("contacts", 200, 0.2, 0, 1000)
+        metrics.record_request("contacts", 429, 3.0, 0, 10)
+        metrics.record_request("campaigns", None, 0.01, 50)
+
+        summary = metrics.summary()
+        assert summary["contacts"]["requests"] == 2
+        assert summary["contacts"]["status_codes"] == {200: 1, 429: 1}
+        assert summary["contacts"]["latency_histogram"][0.25] == 1
+        assert summary["contacts"]["latency_histogram"][5.0] == 1
+        assert summary["contacts"]["latency_avg"] == pytest.approx(1.6)
+        assert summary["contacts"]["latency_max"] == 3.0
+        assert summary["contacts"]["bytes_received"] == 1010
+        assert summary["campaigns"]["status_codes"] == {"error": 1}
+        assert summary["campaigns"]["bytes_sent"] == 50
+
+    def test_record_retry(self, metrics):
+        """
+        Test that retries and retry sleep are accumulated.
+        """
+        metrics.record_retry("contacts", 1.5)
+        metrics.record_retry("contacts", 0.5)
+
+        assert metrics.summary()["contacts"]["retries"] == 2
+        assert metrics.summary()["contacts"]["retry_sleep"] == 2.0
+
+    def test_hooks(self, metrics):
+        """
+        Test that hooks receive every event and a failing hook is ignored.
+        """
+        events = []
+        metrics.add_hook(MagicMock(side_effect=RuntimeError("broken exporter")))
+        metrics.add_hook(events.append)
+
+        metrics.record_request("brands", 200, 0.1, 0, 5)
+        metrics.record_retry("brands", 1.0)
+
+        assert [event["event"] for event in events] == ["request", "retry"]
+        assert events[0]["endpoint"] == "brands"
+
+    def test_log_summary(self, metrics, caplog):
+        """
+        Test that the summary logs one line per endpoint.
+        """
+        metrics.record_request("contacts", 200, 0.1, 0, 5)
+        metrics.record_request("campaigns", 201, 0.1, 5, 5)
+
+        with caplog.at_level(logging.INFO):
+            metrics.log_summary()
+
+        assert len(caplog.records) == 2
+        assert "API campaigns: 1 requests" in caplog.records[0].getMessage()
+
+    def test_connector_records_metrics(self, monkeypatch):
+        """
+        Test that the APIConnector records attempts, retries and statuses.
+        """
+        api_connector = APIConnector(token="test_token")
+        monkeypatch.setattr("time.sleep", lambda x: None)
+        failure = MagicMock(status_code=503, text="Unavailable", headers={}, content=b"Unavailable")
+        success = MagicMock(status_code=200, headers={}, content=b'{"data": []}')
+        success.json.return_value = {"data": []}
+        monkeypatch.setattr(api_connector.session, "request", MagicMock(side_effect=[failure, success]))
+
+        api_connector.get_brands()
+
+        stats = api_connector.metrics.summary()["brands"]
+        assert stats["requests"] == 2
+        assert stats["retries"] == 1
+        assert stats["status_codes"] == {503: 1, 200: 1}
+        assert stats["bytes_received"] == len(b"Unavailable") + len(b'{"data": []}')
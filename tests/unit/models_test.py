@@ -3,7 +3,7 @@ This module contains tests for the models in the database package.
 """
 from datetime import date, datetime
 import pytest
-from res.db.models import Employee, Timecard, DayEntry, PayPeriod
+from res.db.models import Employee, Timecard, DayEntry, MissingPunchSummary, PayPeriod
 
 
 class TestEmployee:
@@ -305,3 +305,59 @@ class TestDayEntry:
             # Invalid attributes
             DayEntry(**kwargs)
         assert str(exc_info.value) == exception_message
+
+
+class TestMissingPunchSummary:
+    """
+    Test for the MissingPunchSummary class.
+    """
+
+    @pytest.fixture
+    def valid_summary(self) -> MissingPunchSummary:
+        """
+        Create a valid MissingPunchSummary object.
+        """
+        return MissingPunchSummary(
+            timecard_id="timecard_id",
+            associate_id="associate_id",
+            pay_period_id=1,
+            missing_punches=2
+        )
+
+    def test_summary_to_dict(self, valid_summary: MissingPunchSummary):
+        """
+        Test the to_dict method of the MissingPunchSummary class.
+        """
+        assert valid_summary.to_dict() == {
+            'timecard_id': 'timecard_id',
+            'associate_id': 'associate_id',
+            'pay_period_id': 1,
+            'missing_punches': 2
+        }
+
+    def test_summary_repr(self, valid_summary: MissingPunchSummary):
+        """
+        Test the __repr__ method of the MissingPunchSummary class.
+        """
+        assert repr(valid_summary) == ("<MissingPunchSummary(timecard_id=timecard_id, associate_id=associate_id, "
+                                       "pay_period_id=1, missing_punches=2)>")
+
+    @pytest.mark.parametrize("kwargs, exception_message", [
+        ({"timecard_id": 1, "associate_id": "associate_id", "pay_period_id": 1, "missing_punches": 0},
+         "timecard_id must be a string"),
+        ({"timecard_id": "timecard_id", "associate_id": 1, "pay_period_id": 1, "missing_punches": 0},
+         "associate_id must be a string"),
+        ({"timecard_id": "timecard_id", "associate_id": "associate_id", "pay_period_id": "1",
+          "missing_punches": 0},
+         "pay_period_id must be an integer"),
+        ({"timecard_id": "timecard_id", "associate_id": "associate_id", "pay_period_id": 1,
+          "missing_punches": "0"},
+         "missing_punches must be an integer"),
+    ])
+    def test_summary_instantiation_with_invalid_attributes(self, kwargs, exception_message):
+        """
+        Test that the MissingPunchSummary class cannot be instantiated with invalid attributes.
+        """
+        with pytest.raises(TypeError) as exc_info:
+            MissingPunchSummary(**kwargs)
+        assert str(exc_info.value) == exception_message
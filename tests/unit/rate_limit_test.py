@@ -0,0 +1,118 @@
+"""
+Unit tests for the TokenBucket and RateLimiter classes.
+"""
+import asyncio
+import threading
+from unittest.mock import MagicMock
+import pytest
+from res.api import APIConnector
+from res.rate_limit import RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """
+    Unit tests for the TokenBucket class.
+    """
+    @pytest.mark.parametrize("rate, capacity", [(0, None), (-1, None), (1, 0.5)])
+    def test_invalid_arguments(self, rate, capacity):
+        """
+        Test that invalid rates and capacities are rejected.
+        """
+        with pytest.raises(ValueError):
+            TokenBucket(rate, capacity)
+
+    def test_capacity_defaults_to_one_below_one_per_second(self):
+        """
+        Test that a rate below one request per second gets a capacity of one token.
+        """
+        bucket = TokenBucket(rate=0.5)
+        assert bucket.capacity == 1
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(2, abs=0.1)
+        assert RateLimiter(rate=0.5).acquire("contacts") == 0
+
+    def test_burst_then_wait(self):
+        """
+        Test that the bucket allows a burst of `capacity` and then asks callers to wait.
+        """
+        bucket = TokenBucket(rate=10, capacity=2)
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        # The next caller queues behind the previous reservation
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+        assert bucket.tokens < 0
+
+    def test_thread_safety(self):
+        """
+        Test that concurrent reservations never hand out more tokens than available.
+        """
+        bucket = TokenBucket(rate=0.001, capacity=50)
+        immediate = []
+
+        def worker():
+            for _ in range(10):
+                if bucket.reserve() == 0:
+                    immediate.append(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(immediate) == 50
+
+
+class TestRateLimiter:
+    """
+    Unit tests for the RateLimiter class.
+    """
+    def test_buckets_per_endpoint_key(self, monkeypatch):
+        """
+        Test that every endpoint key has its own bucket and that waits are recorded.
+        """
+        sleeps = []
+        monkeypatch.setattr("time.sleep", sleeps.append)
+        limiter = RateLimiter(rate=10, capacity=1, endpoint_limits={"campaigns": (1, 1)})
+
+        limiter.acquire("contacts")
+        limiter.acquire("contacts")
+        limiter.acquire("campaigns")
+
+        metrics = limiter.metrics()
+        assert len(sleeps) == 1
+        assert metrics["contacts"]["acquired"] == 2
+        assert metrics["contacts"]["throttled"] == 1
+        assert metrics["contacts"]["total_wait"] == pytest.approx(0.1, abs=0.01)
+        assert metrics["campaigns"]["throttled"] == 0
+        assert metrics["campaigns"]["rate"] == 1
+
+    def test_acquire_async(self):
+        """
+        Test that acquire_async waits without blocking the event loop.
+        """
+        limiter = RateLimiter(rate=50, capacity=1)
+
+        async def run():
+            return await asyncio.gather(*(limiter.acquire_async("contacts") for _ in range(3)))
+
+        waits = asyncio.run(run())
+
+        assert waits[0] == 0
+        assert waits[2] == pytest.approx(0.04, abs=0.01)
+
+    def test_connector_acquires_per_request(self, monkeypatch):
+        """
+        Test that the APIConnector takes a token for its endpoint key before each request.
+        """
+        limiter = RateLimiter()
+        api_connector = APIConnector(token="test_token", rate_limiter=limiter)
+        mock_response = MagicMock(status_code=200)
+        mock_response.json.return_value = {}
+        monkeypatch.setattr(api_connector.session, "request", MagicMock(return_value=mock_response))
+
+        api_connector.get_brands()
+        api_connector.get_brands()
+
+        assert limiter.metrics()["brands"]["acquired"] == 2
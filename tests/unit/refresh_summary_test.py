@@ -0,0 +1,36 @@
+"""
+Unit tests for the missing punch summary refresh script, run against an in-memory SQLite database.
+"""
+import pytest
+import refresh_summary
+from res.db.models import MissingPunchSummary
+from tests.sqlite_db import SQLiteDatabase
+
+
+class TestRefreshSummary:
+    """
+    Unit tests for refresh_summary.main.
+    """
+    @pytest.fixture
+    def database(self, monkeypatch) -> SQLiteDatabase:
+        """
+        Fixture to return an in-memory database used by refresh_summary in place of Database.
+        :return: SQLiteDatabase object
+        """
+        database = SQLiteDatabase()
+        database.get_new_session = database.session
+        database.close = lambda: None
+        monkeypatch.setattr(refresh_summary, "Database", lambda: database)
+        return database
+
+    def test_main_commits_the_refresh(self, database):
+        """
+        Test that the refreshed summary rows are committed, and a second run changes nothing.
+        """
+        pay_period = database.populate(employees=10, missing_every=3)
+
+        assert refresh_summary.main(pay_period.pay_period_id) == 4
+        assert refresh_summary.main() == 0
+
+        with database.session() as session:
+            assert session.query(MissingPunchSummary).count() == 4
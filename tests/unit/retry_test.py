@@ -0,0 +1,143 @@
+"""
+Unit tests for the RetryPolicy class.
+"""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import pytest
+from res.retry import RetryPolicy
+
+
+class TestRetryPolicy:
+    """
+    Unit tests for the RetryPolicy class.
+    """
+    @pytest.fixture
+    def policy(self) -> RetryPolicy:
+        """
+        Fixture to return a RetryPolicy without jitter.
+        :return: RetryPolicy object
+        """
+        return RetryPolicy(max_attempts=5, backoff_factor=1, max_backoff=4, jitter=False,
+                           call_budget=None, run_budget=None)
+
+    def test_invalid_max_attempts(self):
+        """
+        Test that a non-positive number of attempts is rejected.
+        """
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    @pytest.mark.parametrize("status_code, expected", [
+        (None, True),
+        (429, True),
+        (500, True),
+        (503, True),
+        (400, False),
+        (401, False),
+        (404, False),
+        (422, False),
+    ])
+    def test_is_retryable(self, policy, status_code, expected):
+        """
+        Test the classification of retryable and fatal failures.
+        """
+        assert policy.is_retryable(status_code) is expected
+
+    @pytest.mark.parametrize("status_code, request_sent, expected", [
+        (None, True, False),
+        (None, False, True),
+        (429, True, True),
+        (503, True, True),
+        (500, True, False),
+        (502, True, False),
+        (504, True, False),
+        (408, True, False),
+    ])
+    def test_is_retryable_non_idempotent(self, policy, status_code, request_sent, expected):
+        """
+        Test that a POST is only retried when the server provably did not process it.
+        """
+        assert policy.is_retryable(status_code, "POST", request_sent) is expected
+        assert policy.is_retryable(status_code, "GET", request_sent) is True
+
+    def test_next_wait_non_idempotent(self, policy):
+        """
+        Test that next_wait gives up on a POST that may have been processed.
+        """
+        assert policy.next_wait(1, 0, None, method="post") is None
+        assert policy.next_wait(1, 0, None, method="post", request_sent=False) == 1
+        assert policy.next_wait(1, 0, 503, "7", method="POST") == 7
+
+    def test_exponential_backoff_is_capped(self, policy):
+        """
+        Test that the backoff doubles after every attempt up to max_backoff.
+        """
+        assert [policy.backoff(attempt) for attempt in range(1, 6)] == [1, 2, 4, 4, 4]
+
+    def test_jitter_stays_within_backoff(self):
+        """
+        Test that a jittered delay is never longer than the backoff.
+        """
+        policy = RetryPolicy(backoff_factor=1, max_backoff=8, jitter=True)
+        for attempt in range(1, 5):
+            assert 0 <= policy.backoff(attempt) <= 2 ** (attempt - 1)
+
+    @pytest.mark.parametrize("value, expected", [
+        ("3", 3.0),
+        (" 10 ", 10.0),
+        ("", None),
+        (None, None),
+        ("soon", None),
+    ])
+    def test_parse_retry_after_seconds(self, value, expected):
+        """
+        Test parsing Retry-After values given in seconds.
+        """
+        assert RetryPolicy.parse_retry_after(value) == expected
+
+    def test_parse_retry_after_http_date(self):
+        """
+        Test parsing a Retry-After value given as an HTTP date.
+        """
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        wait = RetryPolicy.parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert 25 <= wait <= 30
+
+    def test_next_wait_gives_up_on_fatal_status(self, policy):
+        """
+        Test that fatal statuses are not retried.
+        """
+        assert policy.next_wait(1, 0, 404) is None
+
+    def test_next_wait_gives_up_after_max_attempts(self, policy):
+        """
+        Test that no wait is returned once every attempt is used.
+        """
+        assert policy.next_wait(4, 0, 500) == 4
+        assert policy.next_wait(5, 0, 500) is None
+
+    def test_next_wait_uses_retry_after(self, policy):
+        """
+        Test that Retry-After overrides the backoff on 429 and 503 only.
+        """
+        assert policy.next_wait(1, 0, 429, "7") == 7
+        assert policy.next_wait(1, 0, 503, "7") == 7
+        assert policy.next_wait(1, 0, 500, "7") == 1
+
+    def test_call_budget(self):
+        """
+        Test that a call stops retrying once its time budget would be exceeded.
+        """
+        policy = RetryPolicy(backoff_factor=1, jitter=False, call_budget=5, run_budget=None)
+        assert policy.next_wait(1, 3.5, 500) == 1
+        assert policy.next_wait(2, 4.5, 500) is None
+
+    def test_run_budget_is_shared(self):
+        """
+        Test that the run budget accumulates across calls.
+        """
+        policy = RetryPolicy(backoff_factor=1, jitter=False, call_budget=None, run_budget=3)
+        assert policy.next_wait(1, 0, 500) == 1
+        assert policy.next_wait(2, 0, 500) == 2
+        assert policy.next_wait(1, 0, 500) is None
+        assert policy.run_slept == 3
@@ -0,0 +1,99 @@
+"""
+Unit tests for the StageRunner class.
+"""
+import logging
+import threading
+import time
+import pytest
+from res.stages import StageRunner
+
+
+class TestStageRunner:
+    """
+    Unit tests for the StageRunner class.
+    """
+    def test_results_and_dependencies(self):
+        """
+        Test that stages receive the results of their dependencies in declaration order.
+        """
+        runner = StageRunner()
+        runner.add("a", lambda: 2)
+        runner.add("b", lambda: 3)
+        runner.add("c", lambda b, a: b - a, depends=["b", "a"])
+        runner.add("d", lambda c: c * 10, depends=["c"])
+
+        assert runner.run() == {"a": 2, "b": 3, "c": 1, "d": 10}
+        assert set(runner.timings) == {"a", "b", "c", "d"}
+        assert runner.timings["d"]["start"] >= runner.timings["c"]["end"]
+
+    def test_independent_stages_overlap(self):
+        """
+        Test that independent stages run concurrently, so the wall time is the critical path.
+        """
+        barrier = threading.Barrier(2, timeout=5)
+        runner = StageRunner()
+        runner.add("database", lambda: barrier.wait() or time.sleep(0.1))
+        runner.add("contacts", lambda: barrier.wait() or time.sleep(0.1))
+        runner.add("campaign", lambda database, contacts: "done", depends=["database", "contacts"])
+
+        assert runner.run()["campaign"] == "done"
+        assert runner.wall_time < 0.19
+        assert runner.timings["campaign"]["start"] >= max(runner.timings["database"]["end"],
+                                                          runner.timings["contacts"]["end"])
+
+    @pytest.mark.parametrize("stages", [
+        [("a", ["missing"])],
+        [("a", ["b"]), ("b", ["a"])],
+        [("a", ["a"])]
+    ])
+    def test_invalid_graph(self, stages):
+        """
+        Test that unknown dependencies and cycles are rejected before any stage runs.
+        """
+        calls = []
+        runner = StageRunner()
+        for name, depends in stages:
+            runner.add(name, lambda *args: calls.append(args), depends=depends)
+
+        with pytest.raises(ValueError):
+            runner.run()
+        assert not calls
+
+    def test_duplicate_stage(self):
+        """
+        Test that a stage name can only be used once.
+        """
+        runner = StageRunner().add("a", lambda: None)
+        with pytest.raises(ValueError):
+            runner.add("a", lambda: None)
+
+    def test_failure_stops_dependents(self):
+        """
+        Test that a failing stage is re-raised and its dependents never start.
+        """
+        started = []
+        runner = StageRunner()
+        runner.add("query", lambda: 1 / 0)
+        runner.add("slow", lambda: time.sleep(0.05) or started.append("slow"))
+        runner.add("campaign", lambda query: started.append("campaign"), depends=["query"])
+
+        with pytest.raises(ZeroDivisionError):
+            runner.run()
+        # The stage already running is awaited, the dependent is skipped
+        assert started == ["slow"]
+        assert "query" in runner.timings
+
+    def test_log_timings(self, caplog):
+        """
+        Test that one line per stage and the total are logged.
+        """
+        runner = StageRunner()
+        runner.add("a", lambda: None)
+        runner.run()
+
+        with caplog.at_level(logging.INFO):
+            runner.log_timings()
+
+        assert len(caplog.records) == 2
+        assert caplog.records[0].getMessage().startswith("Stage a: start")
+        assert caplog.records[1].getMessage().startswith("Stages completed in")
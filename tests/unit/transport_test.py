@@ -0,0 +1,91 @@
+"""
+Unit tests for the TransportConfig class.
+"""
+import gzip
+import json
+from unittest.mock import MagicMock
+import pytest
+from res.api import APIConnector
+from res.transport import TransportConfig
+from tests.fake_slicktext import FakeSlickText
+
+
+class TestTransportConfig:
+    """
+    Unit tests for the TransportConfig class.
+    """
+    @pytest.mark.parametrize("kwargs", [
+        {"connect_timeout": 0},
+        {"read_timeout": -1},
+        {"pool_maxsize": 0},
+    ])
+    def test_invalid_arguments(self, kwargs):
+        """
+        Test that invalid settings are rejected.
+        """
+        with pytest.raises(ValueError):
+            TransportConfig(**kwargs)
+
+    def test_build_session(self):
+        """
+        Test that the session has a sized pool and the default headers.
+        """
+        session = TransportConfig().build_session("test_token", concurrency=16)
+
+        adapter = session.get_adapter("https://dev.slicktext.com")
+        assert adapter._pool_maxsize == 16  # pylint: disable=protected-access
+        assert session.headers["Authorization"] == "Bearer test_token"
+        assert session.headers["Content-Type"] == "application/json"
+        assert "gzip" in session.headers["Accept-Encoding"]
+
+    def test_timeout_for(self):
+        """
+        Test the default and per-endpoint timeouts.
+        """
+        transport = TransportConfig(connect_timeout=2, read_timeout=10,
+                                    endpoint_timeouts={"campaigns": (3, 60)})
+        assert transport.timeout_for("contacts") == (2, 10)
+        assert transport.timeout_for("campaigns") == (3, 60)
+
+    def test_encode_body(self):
+        """
+        Test that bodies are compact JSON and only gzipped above the threshold.
+        """
+        transport = TransportConfig(compress_threshold=100)
+
+        assert transport.encode_body(None) == (None, {})
+        assert transport.encode_body({"a": 1}) == (b'{"a":1}', {})
+
+        body = [{"contact_id": i, "lists": [1]} for i in range(50)]
+        data, headers = transport.encode_body(body)
+        assert headers == {"Content-Encoding": "gzip"}
+        assert json.loads(gzip.decompress(data)) == body
+
+    def test_connector_sends_timeout(self, monkeypatch):
+        """
+        Test that the connector passes the endpoint timeout to every request.
+        """
+        transport = TransportConfig(endpoint_timeouts={"brands": (1, 2)})
+        api_connector = APIConnector(token="test_token", transport=transport)
+        mock_response = MagicMock(status_code=200)
+        mock_response.json.return_value = {}
+        mock_request = MagicMock(return_value=mock_response)
+        monkeypatch.setattr(api_connector.session, "request", mock_request)
+
+        api_connector.get_brands()
+
+        assert mock_request.call_args.kwargs["timeout"] == (1, 2)
+
+    def test_compressed_upload(self):
+        """
+        Test that a gzipped body is accepted end to end.
+        """
+        with FakeSlickText(contact_count=10) as server:
+            api_connector = APIConnector(token="test_token", brand_id=server.brand_id,
+                                         base_url=server.base_url,
+                                         transport=TransportConfig(compress_threshold=1))
+            list_id = api_connector.create_contact_list("Reminder")["contact_list_id"]
+            report = api_connector.add_contacts_to_list(list(range(1, 11)), list_id)
+
+        assert report.ok
+        assert server.lists[list_id]["contacts"] == set(range(1, 11))